@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for Crystal Quest
+Measures frame times of rendering hot paths
+"""
+
+import os
+import sys
+import time
+
+# Run without a window unless a video driver was requested
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+BENCHMARK_SEED = 1  # Fixed session seed so runs are comparable
+
+def time_frames(engine, frames, before_frame=None):
+    """Render a number of frames and return the average time in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        if before_frame:
+            before_frame()
+        engine.render()
+    return (time.perf_counter() - start) * 1000 / frames
+
+def benchmark_screen_shake(engine, frames=300):
+    """Compare frame time with and without screen shake"""
+    from game.effects import effects
+    
+    print("\n1. Screen shake...")
+    engine.state = "playing"
+    effects.clear()
+    
+    still = time_frames(engine, frames)
+    print(f"  Still:   {still:.2f} ms/frame")
+    
+    # Keep the shake going for the whole run; each step draws a new offset
+    def shake():
+        effects.start_screen_shake(8, 1.0)
+        effects.update(0)
+    
+    shaking = time_frames(engine, frames, shake)
+    print(f"  Shaking: {shaking:.2f} ms/frame")
+    effects.clear()
+
+def benchmark_particles(engine, frames=300):
+    """Time particle rendering under steady explosions, sparkles and trails"""
+    from game.constants import CRYSTAL_BLUE, GOLDEN_YELLOW, CYAN
+    from game.effects import effects
+    
+    print("\n2. Particles...")
+    effects.clear()
+    particles = effects.particle_system
+    
+    elapsed = 0.0
+    for frame in range(frames):
+        if frame % 20 == 0:
+            particles.create_explosion(600, 400, CRYSTAL_BLUE, count=30)
+        particles.create_sparkle(300, 300, GOLDEN_YELLOW, count=2)
+        particles.create_trail(500, 500, CYAN, direction_x=1)
+        particles.update(1 / 60)
+        
+        start = time.perf_counter()
+        particles.render(engine.screen)
+        elapsed += time.perf_counter() - start
+    
+    print(f"  {len(particles)} live particles: {elapsed * 1000 / frames:.3f} ms/frame")
+    print(f"  Spawned {particles.spawned}, evicted {particles.evicted}, peak {particles.peak}")
+    effects.clear()
+
+def benchmark_particle_stress(engine, live=20000, frames=60):
+    """Time update and render with tens of thousands of live particles"""
+    from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT, CYAN
+    from game.effects import ParticleSystem
+    from game.rng import streams
+    
+    print(f"\n3. Particle stress ({live} particles)...")
+    particles = ParticleSystem(capacity=live)
+    print(f"  Backend: {type(particles.particles).__name__}")
+    rng = streams.effects
+    for _ in range(live):
+        particles.add_particle(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                               rng.uniform(-30, 30), rng.uniform(-30, 30),
+                               CYAN, life=60.0, size=rng.randint(1, 3), gravity=False)
+    
+    update_time = render_time = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        particles.update(1 / 60)
+        update_time += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        particles.render(engine.screen)
+        render_time += time.perf_counter() - start
+    
+    print(f"  Update: {update_time * 1000 / frames:.2f} ms/frame")
+    print(f"  Render: {render_time * 1000 / frames:.2f} ms/frame")
+
+def build_wide_level_data(screens, seed=1):
+    """Procedural level data with platforms and entities spread over many screens"""
+    import random
+    from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    
+    rng = random.Random(seed)
+    width = screens * SCREEN_WIDTH
+    data = {
+        'name': 'Crystal Spire',
+        'width': width,
+        'crystals_required': 1,
+        'platforms': [{'x': 0, 'y': SCREEN_HEIGHT - 20, 'width': width, 'height': 20}],
+        'enemies': [],
+        'crystals': [],
+        'coins': [],
+        'powerups': [],
+    }
+    for x in range(300, width, 300):
+        data['platforms'].append({'x': x, 'y': rng.randint(300, 650), 'width': 150, 'height': 20})
+        data['coins'].append({'x': x + 50, 'y': 250})
+        data['enemies'].append({'x': x, 'y': 200, 'type': rng.choice(['walker', 'jumper', 'flyer'])})
+        data['crystals'].append({'x': x + 100, 'y': 150})
+    return data
+
+def benchmark_wide_levels(engine, frames=300):
+    """Compare frame time while scrolling levels of increasing width"""
+    from game.constants import PLAYER_SPEED, FPS
+    from game.camera import camera
+    from game.level import Level
+    
+    print("\n4. Wide levels...")
+    engine.state = "playing"
+    original_level = engine.current_level
+    
+    for screens in (1, 10, 50):
+        level = Level(build_wide_level_data(screens))
+        engine.current_level = level
+        camera.set_world_size(level.width, level.height)
+        
+        # Scroll at running speed from the middle, composing chunks as they come into view
+        start = (level.width - camera.rect.width) // 2
+        positions = iter([start + step * PLAYER_SPEED / FPS for step in range(frames)])
+        def scroll():
+            camera.move_to(next(positions), 0)
+            camera.begin_frame()
+        
+        average = time_frames(engine, frames, scroll)
+        print(f"  {screens:2d} screens: {average:.2f} ms/frame, "
+              f"{camera.culled['entities']} entities culled on the last frame")
+    
+    engine.current_level = original_level
+    camera.set_world_size(original_level.width, original_level.height)
+
+class PlatformList:
+    """Linear scan with the platform grid's query API, as a baseline"""
+    def __init__(self, platforms):
+        self.platforms = platforms
+    
+    def query(self, rect):
+        return self.platforms
+
+def benchmark_collisions(frames=300):
+    """Time player and enemy platform collisions as platform counts grow"""
+    from game.constants import SCREEN_WIDTH
+    from game.level import Level
+    from game.player import Player
+    
+    print("\n5. Platform collisions...")
+    for platform_count in (10, 100, 1000, 5000):
+        # One platform (plus a coin, crystal and enemy) per 300 pixels
+        screens = max(1, platform_count * 300 // SCREEN_WIDTH)
+        level = Level(build_wide_level_data(screens))
+        
+        timings = []
+        for index in (PlatformList(level.platforms), level.platform_grid):
+            player = Player(level.width // 2, 100)
+            enemies = level.enemies[:20]
+            start = time.perf_counter()
+            for _ in range(frames):
+                player.update(1 / 60, index, level.width)
+                for enemy in enemies:
+                    enemy.update(1 / 60, index, player)
+            timings.append((time.perf_counter() - start) * 1000 / frames)
+        
+        print(f"  {len(level.platforms):5d} platforms: scan {timings[0]:.3f} ms/frame, "
+              f"grid {timings[1]:.3f} ms/frame")
+
+def run_benchmarks():
+    """Run all benchmarks"""
+    print("Crystal Quest Benchmarks")
+    print("=" * 40)
+    
+    pygame.init()
+    from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    from game.game_engine import GameEngine
+    from game.rng import streams
+    
+    streams.reseed(BENCHMARK_SEED)
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    engine = GameEngine(screen)
+    
+    benchmark_screen_shake(engine)
+    benchmark_particles(engine)
+    benchmark_particle_stress(engine)
+    benchmark_wide_levels(engine)
+    benchmark_collisions()
+    
+    print("\n" + "=" * 40)
+    print("Benchmarks completed!")
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,116 @@
+# Camera and Culling for Crystal Quest
+import pygame
+from .constants import *
+
+class Viewport:
+    """The visible part of the world, used to skip work on off-screen objects.
+    
+    Anything outside the view rect grown by margin on every side is culled.
+    Culled objects are counted per category for the current frame.
+    """
+    CATEGORIES = ("particles", "entities", "decorations")
+    
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, margin=CULL_MARGIN):
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.margin = margin
+        self.bounds = self.rect.inflate(margin * 2, margin * 2)
+        self.cull_simulation = CULL_SIMULATION
+        self.culled = dict.fromkeys(self.CATEGORIES, 0)
+    
+    def move_to(self, x, y):
+        """Place the view's top-left corner at a world position"""
+        self.rect.topleft = (x, y)
+        self.bounds.center = self.rect.center
+    
+    def begin_frame(self):
+        """Reset the culled counts at the start of a frame"""
+        for category in self.CATEGORIES:
+            self.culled[category] = 0
+    
+    def is_visible(self, rect):
+        """Check whether a world rect overlaps the view plus margin"""
+        return self.bounds.colliderect(rect)
+    
+    def visible_mask(self, left, top, width, height):
+        """Vectorized is_visible over NumPy arrays of rect fields"""
+        bounds = self.bounds
+        return ((left + width > bounds.left) & (left < bounds.right) &
+                (top + height > bounds.top) & (top < bounds.bottom))
+    
+    def count_culled(self, category, count=1):
+        self.culled[category] += count
+
+class Camera(Viewport):
+    """Viewport that scrolls over a level wider than the screen.
+    
+    The view follows a target once it leaves a deadzone around the view
+    center and never shows anything outside the world rect.
+    """
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, margin=CULL_MARGIN,
+                 deadzone_width=CAMERA_DEADZONE_WIDTH, deadzone_height=CAMERA_DEADZONE_HEIGHT):
+        super().__init__(width, height, margin)
+        self.world = self.rect.copy()
+        self.deadzone = pygame.Rect(0, 0, deadzone_width, deadzone_height)
+        self.previous_offset = self.rect.topleft  # Offset before the last follow step
+    
+    @property
+    def offset(self):
+        """World position of the screen's top-left corner"""
+        return self.rect.topleft
+    
+    def set_world_size(self, width, height):
+        """Limit the view to a level of the given size"""
+        self.world.size = (max(width, self.rect.width), max(height, self.rect.height))
+        self.move_to(*self.rect.topleft)
+    
+    def move_to(self, x, y):
+        """Place the view's top-left corner, kept inside the world"""
+        x = max(self.world.left, min(int(x), self.world.right - self.rect.width))
+        y = max(self.world.top, min(int(y), self.world.bottom - self.rect.height))
+        super().move_to(x, y)
+    
+    def snap_to(self, target):
+        """Center the view on a world rect immediately"""
+        self.move_to(target.centerx - self.rect.width // 2,
+                     target.centery - self.rect.height // 2)
+        self.previous_offset = self.rect.topleft
+    
+    def follow(self, target):
+        """Scroll just enough to bring a world rect back inside the deadzone"""
+        self.previous_offset = self.rect.topleft
+        self.deadzone.center = self.rect.center
+        x, y = self.rect.topleft
+        if target.left < self.deadzone.left:
+            x -= self.deadzone.left - target.left
+        elif target.right > self.deadzone.right:
+            x += target.right - self.deadzone.right
+        if target.top < self.deadzone.top:
+            y -= self.deadzone.top - target.top
+        elif target.bottom > self.deadzone.bottom:
+            y += target.bottom - self.deadzone.bottom
+        self.move_to(x, y)
+    
+    def get_render_offset(self, alpha=1.0):
+        """Whole-pixel offset alpha of the way from the previous follow step to the current one"""
+        previous_x, previous_y = self.previous_offset
+        return (round(previous_x + (self.rect.x - previous_x) * alpha),
+                round(previous_y + (self.rect.y - previous_y) * alpha))
+    
+    def world_to_screen(self, x, y):
+        return x - self.rect.x, y - self.rect.y
+    
+    def screen_to_world(self, x, y):
+        return x + self.rect.x, y + self.rect.y
+    
+    def rect_to_screen(self, rect):
+        """Move a world rect into screen coordinates"""
+        return rect.move(-self.rect.x, -self.rect.y)
+
+def interpolate_offset(offset, entity, alpha):
+    """Render offset that draws an entity alpha of the way from its previous to its current position"""
+    lag = 1 - alpha
+    return (offset[0] + (entity.x - entity.previous_x) * lag,
+            offset[1] + (entity.y - entity.previous_y) * lag)
+
+# Global camera instance
+camera = Camera()
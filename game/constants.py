@@ -2,6 +2,10 @@
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
+SIMULATION_RATE = 60  # Fixed simulation steps per second, independent of FPS
+MAX_FRAME_TIME = 0.25  # Longest frame time caught up in full; anything past it is dropped
+RANDOM_SEED = None  # Session seed for all random streams (None picks a fresh one per run)
+LAYOUT_SEED = 42  # Fixed seed for decoration layouts, so they look the same in every session
 
 # Colors - Enhanced palette
 BLACK = (0, 0, 0)
@@ -72,8 +76,26 @@ MAX_LIVES = 3
 LEVEL_TIME_LIMIT = 180  # 3 minutes per level
 
 # Visual effects
-PARTICLE_COUNT = 50
+PARTICLE_COUNT = 512  # Live particle budget, busy gameplay peaks around 220
+PARTICLE_EVICTION = "oldest"  # Or "lowest_life", which particle makes room at the budget
+PARTICLE_ALPHA_STEPS = 16  # Pre-baked alpha levels per particle sprite
+COIN_ROTATION_FRAMES = 32  # Pre-rendered frames per half turn of a coin
+LEVEL_TRANSITION_DURATION = 0.6  # Crossfade between levels, in seconds
+IRIS_KEY_COLOR = (255, 0, 255)  # Colorkey for the see-through part of iris wipes
+ANIMATED_TEXT_LIFETIME = 2.0  # Seconds before an animated text is removed
+ANIMATED_TEXT_FADE_TIME = 0.3  # Seconds an animated text takes to fade away
+TEXT_SCALE_STEP = 0.01  # Scale quantization for pulsing text
+MAX_FREE_TEXTS = 16  # Expired animated texts kept for reuse
+CULL_MARGIN = 64  # Pixels around the view where objects are still drawn
+CULL_SIMULATION = False  # Also skip updating objects outside the view and margin
+ENTITY_RENDER_REACH = 64  # Furthest an entity draws from its x position, for range lookups
+SPATIAL_CELL_SIZE = 128  # Cell size of the platform collision grid
+CAMERA_DEADZONE_WIDTH = 240  # Area around the view center the player moves in without scrolling
+CAMERA_DEADZONE_HEIGHT = 200
+STATIC_CHUNK_WIDTH = 512  # Width of each pre-composed column of a level's static layer
+STATIC_CHUNK_CACHE = 8  # Composed chunks kept around; the view needs at most four
 SHADOW_OFFSET = 2
+PLATFORM_DRAW_MARGIN = 20  # How far platform shadows and textures reach past the platform
 BORDER_WIDTH = 3
 
 # Sounds (we'll use simple tones)
@@ -1,11 +1,43 @@
 # Visual Effects System for Crystal Quest
 import pygame
 import math
-import random
+import heapq
 from .constants import *
+from .sprites import SurfaceCache, text_cache
+from .quality import quality
+from .camera import camera
+from .rng import streams
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, particles fall back to Particle objects
+    numpy = None
+
+# Pre-baked particle circles keyed by (size, color, alpha step)
+particle_sprites = SurfaceCache(max_entries=1024)
+
+def get_particle_sprite(size, color, alpha):
+    """Get a circle sprite for a particle, with alpha quantized to a small ramp"""
+    step = max(0, alpha) * (PARTICLE_ALPHA_STEPS - 1) // 255
+    color = tuple(color[:3])
+    
+    def build():
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        sprite.fill((0, 0, 0, 0))
+        sprite_alpha = step * 255 // (PARTICLE_ALPHA_STEPS - 1)
+        pygame.draw.circle(sprite, (*color, sprite_alpha), (size, size), size)
+        return sprite
+    
+    return particle_sprites.get((size, color, step), build)
 
 class Particle:
+    __slots__ = ("x", "y", "vel_x", "vel_y", "color", "life", "max_life", "size", "gravity", "alpha", "serial")
+    
     def __init__(self, x, y, vel_x, vel_y, color, life, size=3, gravity=True):
+        self.reset(x, y, vel_x, vel_y, color, life, size, gravity)
+    
+    def reset(self, x, y, vel_x, vel_y, color, life, size=3, gravity=True):
+        """Reinitialize the particle so its slot can be reused"""
         self.x = x
         self.y = y
         self.vel_x = vel_x
@@ -16,6 +48,7 @@ class Particle:
         self.size = size
         self.gravity = gravity
         self.alpha = 255
+        self.serial = 0  # Spawn number, set by the pool that owns the particle
     
     def update(self, dt):
         self.x += self.vel_x * dt
@@ -28,88 +61,377 @@ class Particle:
         self.alpha = int(255 * (self.life / self.max_life))
         return self.life > 0
     
+    def get_rect(self):
+        return pygame.Rect(self.x - self.size, self.y - self.size, self.size * 2, self.size * 2)
+    
     def render(self, screen):
         if self.life <= 0:
             return
         
-        color_with_alpha = (*self.color[:3], max(0, self.alpha))
-        particle_surface = pygame.Surface((self.size * 2, self.size * 2))
-        particle_surface.set_alpha(self.alpha)
-        particle_surface.fill(self.color)
+        sprite = get_particle_sprite(self.size, self.color, self.alpha)
+        screen.blit(sprite, (self.x - self.size, self.y - self.size))
+
+class ParticlePool:
+    """Fixed-capacity ring buffer of reusable Particle objects, used without NumPy.
+    
+    Live particles occupy count slots starting at head. Every other slot
+    holds a particle with no life left, ready to be reused. With "oldest"
+    eviction live slots stay in spawn order. "lowest_life" eviction respawns
+    into the victim's slot, so there the order is only kept until the first
+    eviction. The policy is fixed for the life of the pool.
+    """
+    def __init__(self, capacity, eviction="oldest"):
+        self.capacity = capacity
+        self.eviction = eviction
+        self.slots = [Particle(0, 0, 0, 0, BLACK, 0) for _ in range(capacity)]
+        self.head = 0
+        self.count = 0
+        self.next_serial = 0
+        
+        # Lives all run down at the same rate, so the particle with the least
+        # life left is the one that expires first. For lowest_life eviction a
+        # heap of (expiry time, serial, particle) finds it without a scan;
+        # entries for particles that died or were reused are skipped lazily.
+        self.clock = 0.0
+        self.expiry_heap = []
+    
+    def __len__(self):
+        return self.count
+    
+    def live(self):
+        """Live particles in spawn order"""
+        end = self.head + self.count
+        if end <= self.capacity:
+            return self.slots[self.head:end]
+        return self.slots[self.head:] + self.slots[:end - self.capacity]
+    
+    def add(self, x, y, vel_x, vel_y, color, life, size, gravity):
+        """Spawn a particle, returning True if another one was evicted for it"""
+        evicted = self.count == self.capacity
+        if not evicted:
+            particle = self.slots[(self.head + self.count) % self.capacity]
+            self.count += 1
+        elif self.eviction == "oldest":
+            # Overwrite the oldest particle, which makes it the newest
+            particle = self.slots[self.head]
+            self.head = (self.head + 1) % self.capacity
+        else:
+            particle = self.pop_lowest_life()
+        
+        particle.reset(x, y, vel_x, vel_y, color, life, size, gravity)
+        particle.serial = self.next_serial
+        self.next_serial += 1
+        if self.eviction == "lowest_life":
+            self.push_expiry(particle)
+        return evicted
+    
+    def push_expiry(self, particle):
+        heap = self.expiry_heap
+        if len(heap) >= self.capacity * 2:
+            # Mostly stale entries: rebuild from the live particles
+            heap[:] = [(self.clock + p.life, p.serial, p) for p in self.live() if p is not particle]
+            heapq.heapify(heap)
+        heapq.heappush(heap, (self.clock + particle.life, particle.serial, particle))
+    
+    def pop_lowest_life(self):
+        """Remove and return the live particle with the least life left"""
+        heap = self.expiry_heap
+        while True:
+            _, serial, particle = heapq.heappop(heap)
+            if particle.serial == serial and particle.life > 0:
+                return particle
+    
+    def update(self, dt):
+        self.clock += dt
+        survivors = [p for p in self.live() if p.update(dt)]
+        
+        # Off-screen particles can be dropped instead of simulated to the end
+        if camera.cull_simulation:
+            visible = []
+            for particle in survivors:
+                if camera.is_visible(particle.get_rect()):
+                    visible.append(particle)
+                else:
+                    particle.life = 0  # Frees the slot
+            camera.count_culled("particles", len(survivors) - len(visible))
+            survivors = visible
+        
+        if len(survivors) < self.count:
+            # Restart the ring at slot 0 with the dead particles behind the survivors
+            self.slots = survivors + [p for p in self.slots if p.life <= 0]
+            self.head = 0
+        self.count = len(survivors)
+    
+    def clear(self):
+        for particle in self.live():
+            particle.life = 0
+        self.head = 0
+        self.count = 0
+        self.expiry_heap.clear()
+    
+    def render(self, screen, offset=(0, 0)):
+        visible = [p for p in self.live() if camera.is_visible(p.get_rect())]
+        camera.count_culled("particles", self.count - len(visible))
+        
+        offset_x, offset_y = offset
+        screen.blits([
+            (get_particle_sprite(p.size, p.color, p.alpha),
+             (p.x - p.size - offset_x, p.y - p.size - offset_y))
+            for p in visible
+        ], doreturn=False)
+    
+    def get_dirty_rects(self, offset=(0, 0)):
+        return [p.get_rect().move(-offset[0], -offset[1]) for p in self.live()]
+
+class ParticleArrays:
+    """Structure-of-arrays particle storage integrated in NumPy passes.
+    
+    Live particles occupy the first count slots of every array. With
+    "oldest" eviction they are in spawn order starting at head, which only
+    moves off slot 0 while the arrays are full. Colors are stored as indices
+    into a shared palette.
+    """
+    FIELDS = ("x", "y", "vel_x", "vel_y", "life", "max_life", "size", "color", "gravity")
+    
+    def __init__(self, capacity, eviction="oldest"):
+        self.capacity = capacity
+        self.eviction = eviction
+        self.count = 0
+        self.head = 0
+        self.palette = []
+        self.palette_indices = {}
+        
+        self.x = numpy.zeros(capacity)
+        self.y = numpy.zeros(capacity)
+        self.vel_x = numpy.zeros(capacity)
+        self.vel_y = numpy.zeros(capacity)
+        self.life = numpy.zeros(capacity)
+        self.max_life = numpy.ones(capacity)
+        self.size = numpy.zeros(capacity, dtype=numpy.int32)
+        self.color = numpy.zeros(capacity, dtype=numpy.int32)
+        self.gravity = numpy.zeros(capacity, dtype=bool)
+        
+        # Lives only change in update, so for lowest_life eviction a heap of
+        # (life, slot) built at the first eviction of a frame stays exact
+        # until the next update.
+        self.life_heap = None
+    
+    def __len__(self):
+        return self.count
+    
+    def get_color_index(self, color):
+        color = tuple(color[:3])
+        index = self.palette_indices.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self.palette_indices[color] = index
+        return index
+    
+    def add(self, x, y, vel_x, vel_y, color, life, size, gravity):
+        """Spawn a particle, returning True if another one was evicted for it"""
+        evicted = self.count == self.capacity
+        if not evicted:
+            i = self.count
+            self.count += 1
+        elif self.eviction == "oldest":
+            # Overwrite the oldest particle, which makes it the newest
+            i = self.head
+            self.head = (self.head + 1) % self.capacity
+        else:
+            if self.life_heap is None:
+                self.life_heap = list(zip(self.life.tolist(), range(self.capacity)))
+                heapq.heapify(self.life_heap)
+            i = heapq.heappop(self.life_heap)[1]
+        
+        self.x[i] = x
+        self.y[i] = y
+        self.vel_x[i] = vel_x
+        self.vel_y[i] = vel_y
+        self.life[i] = life
+        self.max_life[i] = life
+        self.size[i] = size
+        self.color[i] = self.get_color_index(color)
+        self.gravity[i] = gravity
+        if self.life_heap is not None:
+            heapq.heappush(self.life_heap, (life, i))
+        return evicted
+    
+    def update(self, dt):
+        n = self.count
+        self.life_heap = None
+        if n == 0:
+            return
+        
+        self.x[:n] += self.vel_x[:n] * dt
+        self.y[:n] += self.vel_y[:n] * dt
+        self.vel_y[:n][self.gravity[:n]] += 500 * dt  # Gravity
+        self.life[:n] -= dt
+        
+        # Compact the survivors to the front of the arrays
+        alive = self.life[:n] > 0
+        if camera.cull_simulation:
+            # Off-screen particles are dropped instead of simulated to the end
+            size = self.size[:n]
+            on_screen = camera.visible_mask(self.x[:n] - size, self.y[:n] - size, size * 2, size * 2)
+            camera.count_culled("particles", int(numpy.count_nonzero(alive & ~on_screen)))
+            alive &= on_screen
+        survivors = int(numpy.count_nonzero(alive))
+        if survivors < n:
+            if self.head:
+                # Start the ring back at slot 0 so the survivors stay in spawn order
+                order = numpy.roll(numpy.arange(n), -self.head)
+                keep = order[alive[order]]
+                self.head = 0
+            else:
+                keep = alive
+            for name in self.FIELDS:
+                array = getattr(self, name)
+                array[:survivors] = array[:n][keep]
+            self.count = survivors
+    
+    def clear(self):
+        self.count = 0
+        self.head = 0
+        self.life_heap = None
+    
+    def render(self, screen, offset=(0, 0)):
+        n = self.count
+        if n == 0:
+            return
+        
+        size = self.size[:n]
+        left = self.x[:n] - size
+        top = self.y[:n] - size
+        color = self.color[:n]
+        alpha = (255 * (self.life[:n] / self.max_life[:n])).astype(numpy.int32)
+        
+        # Skip particles outside the viewport
+        visible = camera.visible_mask(left, top, size * 2, size * 2)
+        visible_count = int(numpy.count_nonzero(visible))
+        camera.count_culled("particles", n - visible_count)
+        if visible_count == 0:
+            return
+        if visible_count < n:
+            size, left, top, color, alpha = (field[visible] for field in (size, left, top, color, alpha))
+        
+        # Look up one sprite per distinct (size, color, alpha) instead of per particle
+        keys = (size * len(self.palette) + color) * 256 + alpha
+        unique_keys, sprite_indices = numpy.unique(keys, return_inverse=True)
+        palette_size = len(self.palette)
+        sprites = [
+            get_particle_sprite(key // 256 // palette_size, self.palette[key // 256 % palette_size], key % 256)
+            for key in unique_keys.tolist()
+        ]
         
-        pygame.draw.circle(particle_surface, self.color, 
-                         (self.size, self.size), self.size)
-        screen.blit(particle_surface, (self.x - self.size, self.y - self.size))
+        positions = zip((left - offset[0]).tolist(), (top - offset[1]).tolist())
+        screen.blits(zip(map(sprites.__getitem__, sprite_indices.tolist()), positions),
+                     doreturn=False)
+    
+    def get_dirty_rects(self, offset=(0, 0)):
+        n = self.count
+        size = self.size[:n]
+        return [pygame.Rect(x, y, width, width) for x, y, width in zip(
+            (self.x[:n] - size - offset[0]).tolist(), (self.y[:n] - size - offset[1]).tolist(),
+            (size * 2).tolist())]
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
+    def __init__(self, capacity=PARTICLE_COUNT, eviction=PARTICLE_EVICTION, backend=None):
+        if eviction not in ("oldest", "lowest_life"):
+            raise ValueError(f"Unknown particle eviction policy: {eviction}")
+        
+        # NumPy arrays when available, pooled Particle objects otherwise
+        if backend is None:
+            backend = "arrays" if numpy is not None else "pool"
+        if backend == "arrays":
+            self.particles = ParticleArrays(capacity, eviction)
+        else:
+            self.particles = ParticlePool(capacity, eviction)
+        
+        # Budget statistics
+        self.spawned = 0
+        self.evicted = 0
+        self.peak = 0
+    
+    def __len__(self):
+        return len(self.particles)
     
     def add_particle(self, x, y, vel_x, vel_y, color, life, size=3, gravity=True):
-        self.particles.append(Particle(x, y, vel_x, vel_y, color, life, size, gravity))
+        if self.particles.add(x, y, vel_x, vel_y, color, life, size, gravity):
+            self.evicted += 1
+        self.spawned += 1
+        self.peak = max(self.peak, len(self.particles))
     
     def create_explosion(self, x, y, color, count=10):
         """Create an explosion effect"""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 200)
+        rng = streams.effects
+        for _ in range(quality.scale_count(count)):
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(50, 200)
             vel_x = math.cos(angle) * speed
             vel_y = math.sin(angle) * speed
-            life = random.uniform(0.5, 1.5)
-            size = random.randint(2, 5)
+            life = rng.uniform(0.5, 1.5)
+            size = rng.randint(2, 5)
             self.add_particle(x, y, vel_x, vel_y, color, life, size)
     
     def create_sparkle(self, x, y, color, count=5):
         """Create sparkle effect"""
-        for _ in range(count):
-            vel_x = random.uniform(-30, 30)
-            vel_y = random.uniform(-30, 30)
-            life = random.uniform(0.3, 0.8)
-            size = random.randint(1, 3)
+        rng = streams.effects
+        for _ in range(quality.scale_count(count)):
+            vel_x = rng.uniform(-30, 30)
+            vel_y = rng.uniform(-30, 30)
+            life = rng.uniform(0.3, 0.8)
+            size = rng.randint(1, 3)
             self.add_particle(x, y, vel_x, vel_y, color, life, size, gravity=False)
     
     def create_trail(self, x, y, color, direction_x=0):
         """Create a trail effect"""
-        for _ in range(3):
-            vel_x = random.uniform(-20, 20) + direction_x * -30
-            vel_y = random.uniform(-10, 10)
-            life = random.uniform(0.2, 0.5)
-            size = random.randint(1, 2)
+        rng = streams.effects
+        for _ in range(quality.scale_count(3)):
+            vel_x = rng.uniform(-20, 20) + direction_x * -30
+            vel_y = rng.uniform(-10, 10)
+            life = rng.uniform(0.2, 0.5)
+            size = rng.randint(1, 2)
             self.add_particle(x, y, vel_x, vel_y, color, life, size, gravity=False)
     
     def create_jump_dust(self, x, y):
         """Create dust particles when jumping"""
-        for _ in range(8):
-            vel_x = random.uniform(-50, 50)
-            vel_y = random.uniform(-20, 5)
-            life = random.uniform(0.3, 0.6)
-            size = random.randint(1, 3)
+        rng = streams.effects
+        for _ in range(quality.scale_count(8)):
+            vel_x = rng.uniform(-50, 50)
+            vel_y = rng.uniform(-20, 5)
+            life = rng.uniform(0.3, 0.6)
+            size = rng.randint(1, 3)
             dust_color = (200, 180, 140)  # Dusty brown
             self.add_particle(x, y, vel_x, vel_y, dust_color, life, size)
     
     def create_landing_dust(self, x, y, width):
         """Create dust particles when landing"""
-        for _ in range(12):
-            offset_x = random.uniform(-width//2, width//2)
-            vel_x = random.uniform(-80, 80)
-            vel_y = random.uniform(-30, -10)
-            life = random.uniform(0.4, 0.8)
-            size = random.randint(2, 4)
+        rng = streams.effects
+        for _ in range(quality.scale_count(12)):
+            offset_x = rng.uniform(-width//2, width//2)
+            vel_x = rng.uniform(-80, 80)
+            vel_y = rng.uniform(-30, -10)
+            life = rng.uniform(0.4, 0.8)
+            size = rng.randint(2, 4)
             dust_color = (180, 160, 120)
             self.add_particle(x + offset_x, y, vel_x, vel_y, dust_color, life, size)
     
     def update(self, dt):
         """Update all particles and remove dead ones"""
-        self.particles = [p for p in self.particles if p.update(dt)]
+        self.particles.update(dt)
     
     def clear(self):
         """Clear all particles"""
         self.particles.clear()
     
-    def render(self, screen):
-        """Render all particles"""
-        for particle in self.particles:
-            particle.render(screen)
+    def render(self, screen, offset=(0, 0)):
+        """Render all particles with a single batched blit, shifted by the camera offset"""
+        self.particles.render(screen, offset)
+    
+    def get_dirty_rects(self, offset=(0, 0)):
+        """Screen areas touched by the particles rendered this frame"""
+        return self.particles.get_dirty_rects(offset)
 
 class ScreenTransition:
     def __init__(self):
@@ -119,6 +441,30 @@ class ScreenTransition:
         self.timer = 0.0
         self.direction = "out"  # "in" or "out"
         self.callback = None
+        self.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        
+        # Full-screen buffers, allocated once per resolution and reused
+        self.size = None
+        self.overlay = None  # Solid black, only its alpha changes
+        self.snapshot = None  # Copy of the outgoing frame for crossfades
+        self.iris_mask = None  # Black with a see-through circle for iris wipes
+    
+    def prepare(self, size):
+        """(Re)allocate the transition buffers for a screen size"""
+        if size == self.size:
+            return
+        self.size = size
+        
+        self.overlay = pygame.Surface(size)
+        self.snapshot = pygame.Surface(size)
+        self.iris_mask = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self.overlay = self.overlay.convert()
+            self.snapshot = self.snapshot.convert()
+            self.iris_mask = self.iris_mask.convert()
+        
+        self.overlay.fill(BLACK)
+        self.iris_mask.set_colorkey(IRIS_KEY_COLOR)
     
     def start_fade_out(self, duration=1.0, callback=None):
         self.active = True
@@ -144,6 +490,27 @@ class ScreenTransition:
         self.direction = direction
         self.callback = callback
     
+    def start_crossfade(self, screen, duration=1.0, callback=None):
+        """Fade from the frame currently on screen to whatever is drawn next"""
+        self.prepare(screen.get_size())
+        self.snapshot.blit(screen, (0, 0))
+        
+        self.active = True
+        self.transition_type = "crossfade"
+        self.duration = duration
+        self.timer = 0.0
+        self.callback = callback
+    
+    def start_iris(self, duration=1.0, callback=None, direction="out", center=None):
+        """Shrink ("out") or grow ("in") a circular view around center"""
+        self.active = True
+        self.transition_type = "iris"
+        self.duration = duration
+        self.timer = 0.0
+        self.direction = direction
+        self.callback = callback
+        self.center = center or (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    
     def update(self, dt):
         if not self.active:
             return False
@@ -168,10 +535,31 @@ class ScreenTransition:
             else:
                 alpha = int(255 * (1 - progress))
             
-            fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            fade_surface.set_alpha(alpha)
-            fade_surface.fill(BLACK)
-            screen.blit(fade_surface, (0, 0))
+            self.prepare(screen.get_size())
+            self.overlay.set_alpha(alpha)
+            screen.blit(self.overlay, (0, 0))
+        
+        elif self.transition_type == "crossfade":
+            self.snapshot.set_alpha(int(255 * (1 - progress)))
+            screen.blit(self.snapshot, (0, 0))
+        
+        elif self.transition_type == "iris":
+            self.prepare(screen.get_size())
+            width, height = self.size
+            center_x, center_y = self.center
+            
+            # Radius that uncovers the whole screen from the iris center
+            full_radius = math.hypot(max(center_x, width - center_x),
+                                     max(center_y, height - center_y))
+            if self.direction == "out":
+                radius = int(full_radius * (1 - progress))
+            else:
+                radius = int(full_radius * progress)
+            
+            self.iris_mask.fill(BLACK)
+            if radius > 0:
+                pygame.draw.circle(self.iris_mask, IRIS_KEY_COLOR, self.center, radius)
+            screen.blit(self.iris_mask, (0, 0))
         
         elif self.transition_type == "wipe":
             if self.direction == "left":
@@ -182,18 +570,35 @@ class ScreenTransition:
                 pygame.draw.rect(screen, BLACK, (SCREEN_WIDTH - width, 0, width, SCREEN_HEIGHT))
 
 class AnimatedText:
-    def __init__(self, text, x, y, font, color, animation_type="bounce"):
+    def __init__(self, text, x, y, font, color, animation_type="bounce", lifetime=ANIMATED_TEXT_LIFETIME):
+        self.scaled_surfaces = {}  # Scale step -> surface, for "pulse" texts
+        self.appearance = None  # (font, text, color) the surfaces were made for
+        self.reset(text, x, y, font, color, animation_type, lifetime)
+    
+    def reset(self, text, x, y, font, color, animation_type="bounce", lifetime=ANIMATED_TEXT_LIFETIME):
+        """(Re)initialize the text, keeping rendered surfaces if they still apply"""
+        if self.appearance != (font, text, color):
+            self.appearance = (font, text, color)
+            # Owned copy, so alpha can be set without touching the shared cache
+            self.base_surface = text_cache.render(font, text, True, color).copy()
+            self.scaled_surfaces.clear()
+        
         self.text = text
         self.x = x
         self.y = y
         self.font = font
         self.color = color
         self.animation_type = animation_type
+        self.lifetime = lifetime  # Seconds, or None to live until cleared
         self.timer = 0.0
         self.offset_y = 0
         self.scale = 1.0
         self.alpha = 255
     
+    @property
+    def expired(self):
+        return self.lifetime is not None and self.timer >= self.lifetime
+    
     def update(self, dt):
         self.timer += dt
         
@@ -203,20 +608,31 @@ class AnimatedText:
             self.scale = 1.0 + math.sin(self.timer * 4) * 0.1
         elif self.animation_type == "fade_in":
             self.alpha = min(255, int(255 * self.timer))
-    
-    def render(self, screen):
-        # Create text surface
-        text_surface = self.font.render(self.text, True, self.color)
         
-        # Apply scaling if needed
-        if self.scale != 1.0:
-            new_width = int(text_surface.get_width() * self.scale)
-            new_height = int(text_surface.get_height() * self.scale)
-            text_surface = pygame.transform.scale(text_surface, (new_width, new_height))
+        # Fade out at the end of the text's life
+        if self.lifetime is not None:
+            time_left = self.lifetime - self.timer
+            if time_left < ANIMATED_TEXT_FADE_TIME:
+                self.alpha = min(self.alpha, max(0, int(255 * time_left / ANIMATED_TEXT_FADE_TIME)))
+    
+    def get_surface(self):
+        """Get the text surface for the current scale, scaling each step once"""
+        step = round((self.scale - 1.0) / TEXT_SCALE_STEP)
+        if step == 0:
+            return self.base_surface
         
-        # Apply alpha
-        if self.alpha < 255:
-            text_surface.set_alpha(self.alpha)
+        surface = self.scaled_surfaces.get(step)
+        if surface is None:
+            scale = 1.0 + step * TEXT_SCALE_STEP
+            new_width = int(self.base_surface.get_width() * scale)
+            new_height = int(self.base_surface.get_height() * scale)
+            surface = pygame.transform.scale(self.base_surface, (new_width, new_height))
+            self.scaled_surfaces[step] = surface
+        return surface
+    
+    def render(self, screen):
+        text_surface = self.get_surface()
+        text_surface.set_alpha(self.alpha)
         
         # Calculate position
         rect = text_surface.get_rect(center=(self.x, self.y + self.offset_y))
@@ -228,29 +644,41 @@ class VisualEffects:
         self.particle_system = ParticleSystem()
         self.screen_transition = ScreenTransition()
         self.animated_texts = []
+        self.free_texts = []  # Expired texts kept for reuse
         self.screen_shake = 0.0
         self.screen_shake_duration = 0.0
+        self.shake_offset = (0, 0)  # Drawn once per step, however often the frame is rendered
+    
+    def add_animated_text(self, text, x, y, font, color, animation_type="bounce",
+                          lifetime=ANIMATED_TEXT_LIFETIME):
+        if self.free_texts:
+            animated_text = self.free_texts.pop()
+            animated_text.reset(text, x, y, font, color, animation_type, lifetime)
+        else:
+            animated_text = AnimatedText(text, x, y, font, color, animation_type, lifetime)
+        self.animated_texts.append(animated_text)
+        return animated_text
     
-    def add_animated_text(self, text, x, y, font, color, animation_type="bounce"):
-        self.animated_texts.append(AnimatedText(text, x, y, font, color, animation_type))
+    def recycle_text(self, animated_text):
+        if len(self.free_texts) < MAX_FREE_TEXTS:
+            self.free_texts.append(animated_text)
     
     def start_screen_shake(self, intensity=10, duration=0.5):
         self.screen_shake = intensity
         self.screen_shake_duration = duration
     
     def get_screen_offset(self):
-        if self.screen_shake > 0:
-            offset_x = random.uniform(-self.screen_shake, self.screen_shake)
-            offset_y = random.uniform(-self.screen_shake, self.screen_shake)
-            return (int(offset_x), int(offset_y))
-        return (0, 0)
+        return self.shake_offset
     
     def clear(self):
         """Clear all effects"""
         self.particle_system.clear()
+        for text in self.animated_texts:
+            self.recycle_text(text)
         self.animated_texts.clear()
         self.screen_shake = 0.0
         self.screen_shake_duration = 0.0
+        self.shake_offset = (0, 0)
     
     def update(self, dt):
         self.particle_system.update(dt)
@@ -261,13 +689,27 @@ class VisualEffects:
             self.screen_shake_duration -= dt
             if self.screen_shake_duration <= 0:
                 self.screen_shake = 0
+        if self.screen_shake > 0:
+            rng = streams.effects
+            offset_x = rng.uniform(-self.screen_shake, self.screen_shake)
+            offset_y = rng.uniform(-self.screen_shake, self.screen_shake)
+            self.shake_offset = (int(offset_x), int(offset_y))
+        else:
+            self.shake_offset = (0, 0)
         
-        # Update animated texts
+        # Update animated texts, recycling the ones that expired
+        alive_texts = []
         for text in self.animated_texts:
             text.update(dt)
+            if text.expired:
+                self.recycle_text(text)
+            else:
+                alive_texts.append(text)
+        self.animated_texts[:] = alive_texts
     
-    def render(self, screen):
-        self.particle_system.render(screen)
+    def render(self, screen, offset=(0, 0)):
+        # Particles live in the world, texts and transitions on the screen
+        self.particle_system.render(screen, offset)
         
         for text in self.animated_texts:
             text.render(screen)
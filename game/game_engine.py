@@ -1,27 +1,44 @@
 import pygame
+import random
 from game.constants import *
 from game.player import Player
 from game.level import LevelManager
 from game.effects import effects
+from game.gradients import gradient_engine
+from game.sprites import text_cache, render_pulsing_text
+from game.hud import Hud
+from game.quality import quality
+from game.camera import camera, interpolate_offset
+from game.input import InputState, InputSource, KeyboardInput
 
 class GameEngine:
-    def __init__(self, screen):
+    def __init__(self, screen, dirty_rects=False, headless=False, input_source=None):
+        # Headless engines simulate without drawing or sound, into an off-screen surface
+        self.headless = headless
+        if screen is None:
+            screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.screen = screen
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
         # Game state
         self.state = "menu"  # menu, playing, paused, game_over, level_complete, game_complete
-        self.player = Player(50, SCREEN_HEIGHT - 100)  # Start higher up
+        self.player = self.create_player()
         self.level_manager = LevelManager()
         self.current_level = None
         self.level_timer = 0
         self.game_timer = 0
+        self.hud = Hud(self.small_font)
         
         # Menu selection
         self.menu_selection = 0
         self.menu_options = ["Start Game", "Instructions", "Quit"]
         
+        # Floating menu particles, laid out once as (x, y, size) from a fixed seed
+        rng = random.Random(LAYOUT_SEED)
+        self.menu_particles = [(rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT), rng.randint(1, 3))
+                               for _ in range(20)]
+        
         # Pause menu
         self.pause_selection = 0
         self.pause_options = ["Resume", "Restart Level", "Main Menu"]
@@ -33,13 +50,51 @@ class GameEngine:
         # Key states for menu navigation
         self.keys_pressed = set()
         
+        # Player controls come from a pluggable source, snapshotted once per step.
+        # Headless engines press nothing unless given a scripted or recorded source.
+        if input_source is None:
+            input_source = InputSource() if headless else KeyboardInput()
+        self.input_source = input_source
+        self.input_state = InputState()
+        
+        # Dirty-rectangle rendering: only repaint what changed while playing
+        self.dirty_rects = dirty_rects
+        self.update_rects = None  # None means the whole screen is flipped
+        self.previous_rects = []
+        self.last_rendered = None  # frame_key() of the last clean frame
+        
+        # Frames are drawn here while the screen shakes, then blitted offset
+        self.backbuffer = None
+        
+        # How far the frame lies between the last two simulation steps, and
+        # the camera offset interpolated to match
+        self.alpha = 1.0
+        self.render_offset = camera.offset
+        
         self.load_level()
     
     def load_level(self):
+        previous_level = self.current_level
         self.current_level = self.level_manager.get_current_level()
+        
+        # Free the previous level's composed layer
+        if previous_level and previous_level is not self.current_level:
+            previous_level.invalidate_static_layer()
+        
         if self.current_level:
             self.level_timer = self.current_level.time_limit
             self.player.respawn()
+            self.hud.bind(self.player, self.current_level, self.level_manager)
+            camera.set_world_size(self.current_level.width, self.current_level.height)
+            camera.snap_to(self.player.get_rect())
+            # Compose the visible part of the static layer up front instead of on the first frame
+            if not self.headless:
+                self.current_level.static_layer.build(camera.rect)
+    
+    def create_player(self):
+        player = Player(50, SCREEN_HEIGHT - 100)  # Start higher up
+        player.sound_enabled = not self.headless
+        return player
     
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -55,8 +110,8 @@ class GameEngine:
                 if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
                     self.state = "paused"
                 else:
-                    # Pass key press to player for jump handling
-                    self.player.handle_key_press(event.key)
+                    # Queue the press for the next input snapshot
+                    self.input_source.handle_key_press(event.key)
             elif self.state == "paused":
                 if not self.handle_pause_input(event.key):
                     return False  # Quit requested
@@ -124,16 +179,21 @@ class GameEngine:
         self.restart_game()
     
     def restart_game(self):
+        # Recordings need restarts to replay in step with the input
+        self.input_source.mark("restart_game")
+        
         # Clear effects
         effects.clear()
         
-        self.player = Player(50, SCREEN_HEIGHT - 100)  # Start higher up
+        self.player = self.create_player()
         self.level_manager = LevelManager()
         self.game_timer = 0
         self.load_level()
         self.state = "playing"
     
     def restart_level(self):
+        self.input_source.mark("restart_level")
+        
         # Clear effects
         effects.clear()
         
@@ -142,17 +202,10 @@ class GameEngine:
             self.current_level.reset_collectibles()
             self.current_level.reset_enemies()
         
-        # Reset player
+        # Reset player lives and power-ups
         self.player.respawn()
-        self.player.lives = MAX_LIVES
-        
-        # Reset player power-ups
-        self.player.has_double_jump = False
-        self.player.double_jump_used = False
-        self.player.has_speed_boost = False
-        self.player.speed_boost_timer = 0
-        self.player.has_shield = False
-        self.player.shield_timer = 0
+        self.player.reset_for_level()
+        camera.snap_to(self.player.get_rect())
         
         # Reset level timer
         if self.current_level:
@@ -167,13 +220,11 @@ class GameEngine:
         next_level = self.level_manager.next_level()
         if next_level:
             # Reset lives and power-ups for new level
-            self.player.lives = MAX_LIVES
-            self.player.has_double_jump = False
-            self.player.double_jump_used = False
-            self.player.has_speed_boost = False
-            self.player.speed_boost_timer = 0
-            self.player.has_shield = False
-            self.player.shield_timer = 0
+            self.player.reset_for_level()
+            
+            # Fade from the level complete screen into the new level
+            if not self.headless:
+                effects.screen_transition.start_crossfade(self.screen, LEVEL_TRANSITION_DURATION)
             
             self.load_level()
             self.state = "playing"
@@ -188,8 +239,11 @@ class GameEngine:
             self.game_timer += dt
             self.level_timer -= dt
             
-            # Update player
-            self.player.update(dt, self.current_level.platforms)
+            # Update player and scroll to keep them in view
+            self.input_state = self.input_source.poll()
+            self.player.update(dt, self.current_level.platform_grid, self.current_level.width,
+                               self.input_state)
+            camera.follow(self.player.get_rect())
             
             # Update level
             self.current_level.update(dt, self.player)
@@ -216,14 +270,24 @@ class GameEngine:
         
         return True
     
-    def render(self):
+    def render(self, alpha=1.0):
+        if self.headless:
+            return
+        
+        self.alpha = alpha
+        self.render_offset = camera.get_render_offset(alpha)
+        
         # Apply screen shake if active
         offset_x, offset_y = effects.get_screen_offset()
         
-        # Create a temporary surface for shake effect
+        if self.dirty_rects and self.can_render_dirty(offset_x, offset_y):
+            self.render_dirty()
+            return
+        self.update_rects = None
+        
+        # Render into the shake backbuffer when the view is offset
         if offset_x != 0 or offset_y != 0:
-            temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            render_target = temp_surface
+            render_target = self.get_backbuffer()
         else:
             render_target = self.screen
         
@@ -245,33 +309,118 @@ class GameEngine:
         
         # Apply screen shake
         if offset_x != 0 or offset_y != 0:
-            self.screen.fill(BLACK)
-            self.screen.blit(temp_surface, (offset_x, offset_y))
+            self.blit_shaken(render_target, offset_x, offset_y)
         
         # Always render effects last
-        effects.render(self.screen)
+        effects.render(self.screen, self.render_offset)
+        
+        if self.dirty_rects:
+            self.remember_frame(offset_x, offset_y)
+    
+    def get_backbuffer(self):
+        """Get the persistent off-screen frame used while shaking"""
+        size = self.screen.get_size()
+        if self.backbuffer is None or self.backbuffer.get_size() != size:
+            self.backbuffer = pygame.Surface(size).convert(self.screen)
+        return self.backbuffer
+    
+    def blit_shaken(self, frame, offset_x, offset_y):
+        """Copy a frame to the screen offset, clearing only the exposed edges"""
+        width, height = self.screen.get_size()
+        if offset_x > 0:
+            self.screen.fill(BLACK, (0, 0, offset_x, height))
+        elif offset_x < 0:
+            self.screen.fill(BLACK, (width + offset_x, 0, -offset_x, height))
+        if offset_y > 0:
+            self.screen.fill(BLACK, (0, 0, width, offset_y))
+        elif offset_y < 0:
+            self.screen.fill(BLACK, (0, height + offset_y, width, -offset_y))
+        
+        self.screen.blit(frame, (offset_x, offset_y))
+    
+    def can_render_dirty(self, offset_x, offset_y):
+        """Check whether the screen holds a frame that can be patched"""
+        return (self.state == "playing" and
+                offset_x == 0 and offset_y == 0 and
+                not effects.screen_transition.active and
+                not effects.animated_texts and
+                self.last_rendered == self.frame_key())
+    
+    def frame_key(self):
+        """What a clean frame depends on; any change forces a full repaint"""
+        return (self.state, self.current_level, quality.changes, self.render_offset)
+    
+    def remember_frame(self, offset_x, offset_y):
+        """Record a full frame so the next dirty frame can erase it"""
+        if self.state == "playing":
+            self.previous_rects = self.get_dirty_rects()
+        else:
+            self.previous_rects = []
+        
+        # Shaken or overlaid frames can't be patched, so force another full one
+        clean = (offset_x == 0 and offset_y == 0 and
+                 not effects.screen_transition.active and
+                 not effects.animated_texts)
+        self.last_rendered = self.frame_key() if clean else None
+    
+    def render_dirty(self):
+        """Repaint only the screen areas that changed since the last frame"""
+        dirty = self.get_dirty_rects()
+        
+        # Erase last frame's dynamic objects, then draw this frame's
+        offset = self.render_offset
+        self.current_level.restore_background(self.screen, self.previous_rects, offset)
+        self.current_level.render_dynamic(self.screen, offset, self.alpha)
+        self.player.render(self.screen, interpolate_offset(offset, self.player, self.alpha))
+        self.render_ui_enhanced(self.screen)
+        effects.render(self.screen, offset)
+        
+        self.update_rects = self.previous_rects + dirty
+        self.previous_rects = dirty
+    
+    def get_dirty_rects(self):
+        """Screen areas touched by the dynamic parts of the game view"""
+        offset = self.render_offset
+        rects = self.current_level.get_dirty_rects(offset, self.alpha)
+        player_x, player_y = interpolate_offset(offset, self.player, self.alpha)
+        rects.append(self.player.get_render_bounds().move(-player_x, -player_y))
+        rects.extend(effects.particle_system.get_dirty_rects(offset))
+        rects.extend(self.get_ui_rects())
+        return rects
+    
+    def get_ui_rects(self):
+        """Screen areas covered by the in-game HUD"""
+        return [
+            pygame.Rect(5, 5, 250, 120),
+            pygame.Rect(SCREEN_WIDTH - 205, 5, 200, 140)
+        ]
+    
+    def present(self):
+        """Push the rendered frame to the display"""
+        if self.headless:
+            pass  # Nothing was drawn
+        elif self.update_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.update_rects)
+        
+        # Culled counts cover each frame's simulation steps and render
+        camera.begin_frame()
     
     def render_menu_enhanced(self, screen):
         # Enhanced gradient background
-        for y in range(SCREEN_HEIGHT):
-            color_factor = y / SCREEN_HEIGHT
-            color = (
-                int(DARK_GRAY[0] * (1 - color_factor) + DEEP_BLUE[0] * color_factor),
-                int(DARK_GRAY[1] * (1 - color_factor) + DEEP_BLUE[1] * color_factor),
-                int(DARK_GRAY[2] * (1 - color_factor) + DEEP_BLUE[2] * color_factor)
-            )
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
+        gradient_engine.draw_linear(screen, DARK_GRAY, DEEP_BLUE)
         
         # Animated title with glow effect
         import math
         title_glow = int(50 + 30 * math.sin(pygame.time.get_ticks() * 0.003))
         
         # Draw title glow
-        title_text = self.font.render("CRYSTAL QUEST", True, CYAN)
+        title_text = text_cache.render(self.font, "CRYSTAL QUEST", True, CYAN)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 150))
         
         # Multiple glow layers
-        for i in range(5):
+        for i in range(quality.get("menu_glow_layers")):
             glow_surface = pygame.Surface((title_rect.width + i*10, title_rect.height + i*10))
             glow_surface.set_alpha(title_glow - i*10)
             glow_surface.fill(CYAN)
@@ -284,7 +433,7 @@ class GameEngine:
         # Animated subtitle
         subtitle_pulse = math.sin(pygame.time.get_ticks() * 0.002) * 0.1 + 1
         subtitle_color = tuple(min(255, max(0, int(c * subtitle_pulse))) for c in WHITE)
-        subtitle_text = self.small_font.render("A 2D Platformer Adventure", True, subtitle_color)
+        subtitle_text = render_pulsing_text(self.small_font, "A 2D Platformer Adventure", subtitle_color)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH//2, 200))
         screen.blit(subtitle_text, subtitle_rect)
         
@@ -296,7 +445,7 @@ class GameEngine:
                 option_color = GOLDEN_YELLOW
                 
                 # Draw selection glow
-                option_text = self.font.render(option, True, option_color)
+                option_text = text_cache.render(self.font, option, True, option_color)
                 option_rect = option_text.get_rect(center=(SCREEN_WIDTH//2, 300 + i * 60))
                 
                 glow_surface = pygame.Surface((option_rect.width + 40, option_rect.height + 20))
@@ -325,7 +474,7 @@ class GameEngine:
                 pygame.draw.polygon(screen, GOLDEN_YELLOW, arrow_points_right)
             else:
                 option_color = WHITE
-                option_text = self.font.render(option, True, option_color)
+                option_text = text_cache.render(self.font, option, True, option_color)
                 option_rect = option_text.get_rect(center=(SCREEN_WIDTH//2, 300 + i * 60))
             
             screen.blit(option_text, option_rect)
@@ -342,17 +491,13 @@ class GameEngine:
             # Remove emoji for now since we don't have font support
             clean_line = line.replace("🎮 ", "").replace("⬆️ ", "").replace("⏸️ ", "").replace("💎 ", "")
             text_color = tuple(min(255, max(0, int(c * (0.8 + 0.2 * math.sin(pygame.time.get_ticks() * 0.001 + i))))) for c in LIGHT_BLUE)
-            text = self.small_font.render(clean_line, True, text_color)
+            text = render_pulsing_text(self.small_font, clean_line, text_color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH//2, 550 + i * 30))
             screen.blit(text, text_rect)
         
         # Add floating particles in background
-        import random
-        random.seed(42)
-        for i in range(20):
-            x = (random.randint(0, SCREEN_WIDTH) + pygame.time.get_ticks() * 0.02 * (i % 3 + 1)) % SCREEN_WIDTH
-            y = random.randint(0, SCREEN_HEIGHT)
-            size = random.randint(1, 3)
+        for i, (start_x, y, size) in enumerate(self.menu_particles):
+            x = (start_x + pygame.time.get_ticks() * 0.02 * (i % 3 + 1)) % SCREEN_WIDTH
             alpha = 50 + int(30 * math.sin(pygame.time.get_ticks() * 0.001 + i))
             
             # Draw particle directly without creating surface
@@ -366,7 +511,7 @@ class GameEngine:
     def render_instructions(self):
         self.screen.fill(DARK_GRAY)
         
-        title_text = self.font.render("INSTRUCTIONS", True, CYAN)
+        title_text = text_cache.render(self.font, "INSTRUCTIONS", True, CYAN)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 50))
         self.screen.blit(title_text, title_rect)
         
@@ -399,7 +544,7 @@ class GameEngine:
             else:
                 color = WHITE
             
-            text = self.small_font.render(line, True, color)
+            text = text_cache.render(self.small_font, line, True, color)
             self.screen.blit(text, (100, 120 + i * 25))
     
     def render_instructions_enhanced(self, screen):
@@ -409,7 +554,7 @@ class GameEngine:
     def render_instructions_with_screen(self, screen):
         screen.fill(DARK_GRAY)
         
-        title_text = self.font.render("INSTRUCTIONS", True, CYAN)
+        title_text = text_cache.render(self.font, "INSTRUCTIONS", True, CYAN)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 50))
         screen.blit(title_text, title_rect)
         
@@ -442,15 +587,15 @@ class GameEngine:
             else:
                 color = WHITE
             
-            text = self.small_font.render(line, True, color)
+            text = text_cache.render(self.small_font, line, True, color)
             screen.blit(text, (100, 120 + i * 25))
     
     def render_game_enhanced(self, screen):
-        # Render level first
-        self.current_level.render(screen)
+        # Render level first, with moving objects between their last two steps
+        self.current_level.render(screen, self.render_offset, self.alpha)
         
         # Render player
-        self.player.render(screen)
+        self.player.render(screen, interpolate_offset(self.render_offset, self.player, self.alpha))
         
         # Render enhanced UI
         self.render_ui_enhanced(screen)
@@ -471,7 +616,7 @@ class GameEngine:
         pygame.draw.rect(self.screen, WHITE, ui_border, 2)
         
         # Lives with heart icons
-        lives_text = self.small_font.render(f"Lives:", True, WHITE)
+        lives_text = text_cache.render(self.small_font, f"Lives:", True, WHITE)
         self.screen.blit(lives_text, (15, 15))
         for i in range(self.player.lives):
             heart_x = 60 + i * 20
@@ -487,7 +632,7 @@ class GameEngine:
         coin_icon_pos = (15, 40)
         pygame.draw.circle(self.screen, GOLDEN_YELLOW, coin_icon_pos, 8)
         pygame.draw.circle(self.screen, WHITE, coin_icon_pos, 8, 2)
-        score_text = self.small_font.render(f"Score: {self.player.score}", True, WHITE)
+        score_text = text_cache.render(self.small_font, f"Score: {self.player.score}", True, WHITE)
         self.screen.blit(score_text, (35, 35))
         
         # Crystals with crystal icon
@@ -499,15 +644,17 @@ class GameEngine:
         pygame.draw.polygon(self.screen, CRYSTAL_BLUE, crystal_points)
         pygame.draw.polygon(self.screen, WHITE, crystal_points, 2)
         
-        crystals_collected = sum(1 for crystal in self.current_level.crystals if crystal.collected)
-        crystals_text = self.small_font.render(
+        crystals_collected = self.current_level.crystals_collected
+        crystals_text = text_cache.render(
+            self.small_font,
             f"Crystals: {crystals_collected}/{self.current_level.crystals_required}", 
             True, CYAN
         )
         self.screen.blit(crystals_text, (35, 60))
         
         # Level info
-        level_text = self.small_font.render(
+        level_text = text_cache.render(
+            self.small_font,
             f"Level: {self.level_manager.current_level + 1}/{self.level_manager.get_total_levels()}", 
             True, WHITE
         )
@@ -524,7 +671,7 @@ class GameEngine:
         
         time_left = int(self.level_timer)
         timer_color = RED if time_left < 30 else WHITE
-        timer_text = self.small_font.render(f"Time: {time_left}", True, timer_color)
+        timer_text = text_cache.render(self.small_font, f"Time: {time_left}", True, timer_color)
         timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH - 70, 20))
         self.screen.blit(timer_text, timer_rect)
         
@@ -537,7 +684,7 @@ class GameEngine:
         level_name_border = pygame.Rect(SCREEN_WIDTH - 210, 40, 200, 25)
         pygame.draw.rect(self.screen, GOLDEN_YELLOW, level_name_border, 2)
         
-        level_name_text = self.small_font.render(self.current_level.name, True, GOLDEN_YELLOW)
+        level_name_text = text_cache.render(self.small_font, self.current_level.name, True, GOLDEN_YELLOW)
         level_name_rect = level_name_text.get_rect(center=(SCREEN_WIDTH - 110, 52))
         self.screen.blit(level_name_text, level_name_rect)
         
@@ -559,7 +706,7 @@ class GameEngine:
                 (icon_x, icon_y + 1), (icon_x - 3, icon_y + 4), (icon_x + 3, icon_y + 4)
             ])
             
-            powerup_text = self.small_font.render("Double Jump", True, GREEN)
+            powerup_text = text_cache.render(self.small_font, "Double Jump", True, GREEN)
             self.screen.blit(powerup_text, (SCREEN_WIDTH - 135, y_offset + 5))
             y_offset += 25
         
@@ -580,7 +727,7 @@ class GameEngine:
             ]
             pygame.draw.polygon(self.screen, YELLOW, lightning_points)
             
-            powerup_text = self.small_font.render(f"Speed Boost ({time_left}s)", True, YELLOW)
+            powerup_text = text_cache.render(self.small_font, f"Speed Boost ({time_left}s)", True, YELLOW)
             self.screen.blit(powerup_text, (SCREEN_WIDTH - 155, y_offset + 5))
             y_offset += 25
         
@@ -601,142 +748,12 @@ class GameEngine:
             ]
             pygame.draw.polygon(self.screen, CYAN, shield_points)
             
-            powerup_text = self.small_font.render(f"Shield ({time_left}s)", True, CYAN)
+            powerup_text = text_cache.render(self.small_font, f"Shield ({time_left}s)", True, CYAN)
             self.screen.blit(powerup_text, (SCREEN_WIDTH - 135, y_offset + 5))
     
     def render_ui_enhanced(self, screen):
-        import math
-        
-        # Create semi-transparent UI background panels
-        ui_panel_left = pygame.Surface((250, 120))
-        ui_panel_left.set_alpha(180)
-        ui_panel_left.fill((20, 20, 40))
-        screen.blit(ui_panel_left, (5, 5))
-        
-        ui_panel_right = pygame.Surface((200, 100))
-        ui_panel_right.set_alpha(180)
-        ui_panel_right.fill((20, 20, 40))
-        screen.blit(ui_panel_right, (SCREEN_WIDTH - 205, 5))
-        
-        # Enhanced lives display with heart icons
-        lives_y = 15
-        for i in range(MAX_LIVES):
-            heart_x = 15 + i * 25
-            if i < self.player.lives:
-                # Full heart
-                heart_color = RED
-                pulse = math.sin(pygame.time.get_ticks() * 0.008) * 0.1 + 1
-                heart_size = int(8 * pulse)
-            else:
-                # Empty heart
-                heart_color = GRAY
-                heart_size = 8
-            
-            # Draw heart shape (simplified)
-            pygame.draw.circle(screen, heart_color, (heart_x, lives_y), heart_size//2)
-            pygame.draw.circle(screen, heart_color, (heart_x + heart_size//2, lives_y), heart_size//2)
-            pygame.draw.polygon(screen, heart_color, [
-                (heart_x - heart_size//2, lives_y),
-                (heart_x + heart_size, lives_y),
-                (heart_x + heart_size//4, lives_y + heart_size)
-            ])
-        
-        lives_text = self.small_font.render(f"Lives", True, WHITE)
-        screen.blit(lives_text, (15, lives_y + 15))
-        
-        # Enhanced score with coin icon
-        score_text = self.small_font.render(f"Score: {self.player.score}", True, GOLDEN_YELLOW)
-        screen.blit(score_text, (15, 45))
-        
-        # Enhanced crystals display with crystal icon
-        crystals_collected = sum(1 for crystal in self.current_level.crystals if crystal.collected)
-        crystals_text = self.small_font.render(
-            f"Crystals: {crystals_collected}/{self.current_level.crystals_required}", 
-            True, CRYSTAL_BLUE
-        )
-        screen.blit(crystals_text, (15, 70))
-        
-        # Draw mini crystal icons
-        for i in range(self.current_level.crystals_required):
-            crystal_x = 100 + i * 15
-            crystal_y = 75
-            crystal_color = CRYSTAL_BLUE if i < crystals_collected else GRAY
-            
-            # Draw diamond shape
-            points = [
-                (crystal_x, crystal_y - 4),
-                (crystal_x + 4, crystal_y),
-                (crystal_x, crystal_y + 4),
-                (crystal_x - 4, crystal_y)
-            ]
-            pygame.draw.polygon(screen, crystal_color, points)
-            if i < crystals_collected:
-                pygame.draw.polygon(screen, WHITE, points, 1)
-        
-        # Level info
-        level_text = self.small_font.render(
-            f"Level: {self.level_manager.current_level + 1}/{self.level_manager.get_total_levels()}", 
-            True, WHITE
-        )
-        screen.blit(level_text, (15, 95))
-        
-        # Enhanced timer with warning colors
-        time_left = int(self.level_timer)
-        if time_left <= 30:
-            timer_color = RED
-            timer_pulse = math.sin(pygame.time.get_ticks() * 0.02) * 0.3 + 0.7
-            timer_color = tuple(min(255, max(0, int(c * timer_pulse))) for c in timer_color)
-        elif time_left <= 60:
-            timer_color = ORANGE
-        else:
-            timer_color = WHITE
-        
-        timer_text = self.small_font.render(f"Time: {time_left}", True, timer_color)
-        timer_rect = timer_text.get_rect(topright=(SCREEN_WIDTH - 15, 15))
-        screen.blit(timer_text, timer_rect)
-        
-        # Level name with style
-        level_name_text = self.small_font.render(self.current_level.name, True, GOLDEN_YELLOW)
-        level_name_rect = level_name_text.get_rect(topright=(SCREEN_WIDTH - 15, 40))
-        screen.blit(level_name_text, level_name_rect)
-        
-        # Enhanced power-up indicators
-        y_offset = 70
-        if self.player.has_double_jump:
-            powerup_bg = pygame.Surface((120, 20))
-            powerup_bg.set_alpha(150)
-            powerup_bg.fill(GREEN)
-            screen.blit(powerup_bg, (SCREEN_WIDTH - 125, y_offset - 2))
-            
-            powerup_text = self.small_font.render("Double Jump", True, WHITE)
-            powerup_rect = powerup_text.get_rect(topright=(SCREEN_WIDTH - 15, y_offset))
-            screen.blit(powerup_text, powerup_rect)
-            y_offset += 25
-        
-        if self.player.has_speed_boost:
-            time_left = int(self.player.speed_boost_timer)
-            
-            powerup_bg = pygame.Surface((140, 20))
-            powerup_bg.set_alpha(150)
-            powerup_bg.fill(GOLDEN_YELLOW)
-            screen.blit(powerup_bg, (SCREEN_WIDTH - 145, y_offset - 2))
-            
-            powerup_text = self.small_font.render(f"Speed Boost ({time_left}s)", True, BLACK)
-            powerup_rect = powerup_text.get_rect(topright=(SCREEN_WIDTH - 15, y_offset))
-            screen.blit(powerup_text, powerup_rect)
-            y_offset += 25
-        
-        if self.player.has_shield:
-            time_left = int(self.player.shield_timer)
-            
-            powerup_bg = pygame.Surface((110, 20))
-            powerup_bg.set_alpha(150)
-            powerup_bg.fill(CYAN)
-            screen.blit(powerup_bg, (SCREEN_WIDTH - 115, y_offset - 2))
-            
-            powerup_text = self.small_font.render(f"Shield ({time_left}s)", True, BLACK)
-            powerup_rect = powerup_text.get_rect(topright=(SCREEN_WIDTH - 15, y_offset))
-            screen.blit(powerup_text, powerup_rect)
+        # Panels and text are cached by the HUD and only redrawn on change
+        self.hud.render(screen, int(self.level_timer))
     
     def render_pause_overlay(self, screen):
         # Semi-transparent overlay
@@ -746,30 +763,30 @@ class GameEngine:
         screen.blit(overlay, (0, 0))
         
         # Pause menu
-        pause_text = self.font.render("PAUSED", True, WHITE)
+        pause_text = text_cache.render(self.font, "PAUSED", True, WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH//2, 250))
         screen.blit(pause_text, pause_rect)
         
         for i, option in enumerate(self.pause_options):
             color = YELLOW if i == self.pause_selection else WHITE
-            option_text = self.font.render(option, True, color)
+            option_text = text_cache.render(self.font, option, True, color)
             option_rect = option_text.get_rect(center=(SCREEN_WIDTH//2, 350 + i * 60))
             screen.blit(option_text, option_rect)
     
     def render_game_over(self):
         self.screen.fill(RED)
         
-        game_over_text = self.font.render("GAME OVER", True, WHITE)
+        game_over_text = text_cache.render(self.font, "GAME OVER", True, WHITE)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, 200))
         self.screen.blit(game_over_text, game_over_rect)
         
-        final_score_text = self.font.render(f"Final Score: {self.player.score}", True, WHITE)
+        final_score_text = text_cache.render(self.font, f"Final Score: {self.player.score}", True, WHITE)
         final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH//2, 280))
         self.screen.blit(final_score_text, final_score_rect)
         
         for i, option in enumerate(self.game_over_options):
             color = YELLOW if i == self.game_over_selection else WHITE
-            option_text = self.font.render(option, True, color)
+            option_text = text_cache.render(self.font, option, True, color)
             option_rect = option_text.get_rect(center=(SCREEN_WIDTH//2, 380 + i * 60))
             self.screen.blit(option_text, option_rect)
     
@@ -777,15 +794,12 @@ class GameEngine:
         import math
         
         # Animated gradient background (red to dark red)
-        for y in range(SCREEN_HEIGHT):
-            color_factor = y / SCREEN_HEIGHT
-            red_intensity = int(120 + 80 * math.sin(pygame.time.get_ticks() * 0.002 + y * 0.01))
-            color = (
-                red_intensity,
-                int(20 * (1 - color_factor)),
-                int(20 * (1 - color_factor))
-            )
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
+        ticks = pygame.time.get_ticks()
+        gradient_engine.draw(screen, lambda y, color_factor, xp: (
+            120 + 80 * xp.sin(ticks * 0.002 + y * 0.01),
+            20 * (1 - color_factor),
+            20 * (1 - color_factor)
+        ))
         
         # Pulsing skull/death particles
         for i in range(15):
@@ -808,7 +822,7 @@ class GameEngine:
             shadow_alpha = 150 - i * 30
             shadow_color = (100 + i * 20, 0, 0)
             
-            shadow_text = self.font.render("GAME OVER", True, shadow_color)
+            shadow_text = text_cache.render(self.font, "GAME OVER", True, shadow_color)
             shadow_rect = shadow_text.get_rect(center=(
                 SCREEN_WIDTH//2 + title_shake_x + shadow_offset,
                 200 + title_shake_y + shadow_offset
@@ -821,7 +835,7 @@ class GameEngine:
         
         # Main title
         title_color = tuple(min(255, max(0, int(c * title_pulse))) for c in (255, 50, 50))
-        game_over_text = self.font.render("GAME OVER", True, title_color)
+        game_over_text = render_pulsing_text(self.font, "GAME OVER", title_color)
         game_over_rect = game_over_text.get_rect(center=(
             SCREEN_WIDTH//2 + title_shake_x, 
             200 + title_shake_y
@@ -831,7 +845,7 @@ class GameEngine:
         # Animated subtitle
         subtitle_wave = math.sin(pygame.time.get_ticks() * 0.003) * 0.3 + 0.7
         subtitle_color = tuple(min(255, max(0, int(c * subtitle_wave))) for c in (255, 150, 150))
-        subtitle_text = self.small_font.render("Your adventure ends here...", True, subtitle_color)
+        subtitle_text = render_pulsing_text(self.small_font, "Your adventure ends here...", subtitle_color)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH//2, 250))
         screen.blit(subtitle_text, subtitle_rect)
         
@@ -844,7 +858,7 @@ class GameEngine:
         score_border = pygame.Rect(SCREEN_WIDTH//2 - 150, 300, 300, 80)
         pygame.draw.rect(screen, (255, 100, 100), score_border, 3)
         
-        final_score_text = self.font.render(f"Final Score: {self.player.score}", True, GOLDEN_YELLOW)
+        final_score_text = text_cache.render(self.font, f"Final Score: {self.player.score}", True, GOLDEN_YELLOW)
         final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH//2, 340))
         screen.blit(final_score_text, final_score_rect)
         
@@ -887,18 +901,18 @@ class GameEngine:
             else:
                 option_color = (255, 180, 180)
             
-            option_text = self.font.render(option, True, option_color)
+            option_text = text_cache.render(self.font, option, True, option_color)
             option_rect = option_text.get_rect(center=(SCREEN_WIDTH//2, option_y))
             screen.blit(option_text, option_rect)
     
     def render_level_complete(self):
         self.screen.fill(GREEN)
         
-        complete_text = self.font.render("LEVEL COMPLETE!", True, WHITE)
+        complete_text = text_cache.render(self.font, "LEVEL COMPLETE!", True, WHITE)
         complete_rect = complete_text.get_rect(center=(SCREEN_WIDTH//2, 250))
         self.screen.blit(complete_text, complete_rect)
         
-        crystals_collected = sum(1 for crystal in self.current_level.crystals if crystal.collected)
+        crystals_collected = self.current_level.crystals_collected
         stats_lines = [
             f"Crystals Collected: {crystals_collected}/{len(self.current_level.crystals)}",
             f"Time Remaining: {int(self.level_timer)}s",
@@ -908,7 +922,7 @@ class GameEngine:
         ]
         
         for i, line in enumerate(stats_lines):
-            text = self.small_font.render(line, True, WHITE)
+            text = text_cache.render(self.small_font, line, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH//2, 350 + i * 30))
             self.screen.blit(text, text_rect)
     
@@ -916,15 +930,12 @@ class GameEngine:
         import math
         
         # Celebratory gradient background (green to gold)
-        for y in range(SCREEN_HEIGHT):
-            color_factor = y / SCREEN_HEIGHT
-            green_pulse = 1 + 0.3 * math.sin(pygame.time.get_ticks() * 0.003)
-            color = (
-                min(255, max(0, int((50 + 100 * color_factor) * green_pulse))),
-                min(255, max(0, int((200 - 50 * color_factor) * green_pulse))),
-                min(255, max(0, int(50 * (1 - color_factor))))
-            )
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
+        green_pulse = 1 + 0.3 * math.sin(pygame.time.get_ticks() * 0.003)
+        gradient_engine.draw(screen, lambda y, color_factor, xp: (
+            xp.clip((50 + 100 * color_factor) * green_pulse, 0, 255),
+            xp.clip((200 - 50 * color_factor) * green_pulse, 0, 255),
+            xp.clip(50 * (1 - color_factor), 0, 255)
+        ))
         
         # Celebration particles (stars and sparkles)
         for i in range(25):
@@ -975,18 +986,18 @@ class GameEngine:
             screen.blit(glow_surface, glow_rect)
         
         # Main title
-        complete_text = self.font.render("LEVEL COMPLETE!", True, WHITE)
+        complete_text = text_cache.render(self.font, "LEVEL COMPLETE!", True, WHITE)
         complete_rect = complete_text.get_rect(center=(SCREEN_WIDTH//2, 150 + title_bounce))
         screen.blit(complete_text, complete_rect)
         
         # Victory message
         victory_pulse = math.sin(pygame.time.get_ticks() * 0.005) * 0.2 + 0.8
         victory_color = tuple(min(255, max(0, int(c * victory_pulse))) for c in GOLDEN_YELLOW)
-        victory_text = self.small_font.render("🎉 Excellent work, Crystal Hunter! 🎉", True, victory_color)
+        victory_text = render_pulsing_text(self.small_font, "🎉 Excellent work, Crystal Hunter! 🎉", victory_color)
         victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH//2, 200))
         # Remove emoji for compatibility
         clean_victory = "Excellent work, Crystal Hunter!"
-        victory_text = self.small_font.render(clean_victory, True, victory_color)
+        victory_text = render_pulsing_text(self.small_font, clean_victory, victory_color)
         screen.blit(victory_text, victory_rect)
         
         # Stats panel with fancy border
@@ -1012,7 +1023,7 @@ class GameEngine:
                         pygame.Rect(panel_x + 10, panel_y + 10, panel_width - 20, panel_height - 20), 2)
         
         # Statistics with icons and colors
-        crystals_collected = sum(1 for crystal in self.current_level.crystals if crystal.collected)
+        crystals_collected = self.current_level.crystals_collected
         stats_data = [
             ("💎", f"Crystals: {crystals_collected}/{len(self.current_level.crystals)}", CRYSTAL_BLUE),
             ("⏱️", f"Time Bonus: {int(self.level_timer)}s", CYAN),
@@ -1032,7 +1043,7 @@ class GameEngine:
             # Stat text with animation
             text_pulse = 1 + 0.1 * math.sin(pygame.time.get_ticks() * 0.006 + i)
             text_color = tuple(min(255, max(0, int(c * text_pulse))) for c in color)
-            stat_text = self.small_font.render(clean_text, True, text_color)
+            stat_text = render_pulsing_text(self.small_font, clean_text, text_color)
             screen.blit(stat_text, (panel_x + 50, stat_y - 8))
         
         # Performance rating
@@ -1072,25 +1083,25 @@ class GameEngine:
         
         # Draw rating text without stars
         rating_text_only = rating.replace("*", "").strip()
-        rating_text = self.small_font.render(rating_text_only, True, rating_color)
+        rating_text = render_pulsing_text(self.small_font, rating_text_only, rating_color)
         rating_rect = rating_text.get_rect(center=(SCREEN_WIDTH//2 + 40, rating_y))
         screen.blit(rating_text, rating_rect)
         
         # Continue instruction with animation
         continue_pulse = math.sin(pygame.time.get_ticks() * 0.008) * 0.4 + 0.6
         continue_color = tuple(min(255, max(0, int(c * continue_pulse))) for c in WHITE)
-        continue_text = self.small_font.render("Press SPACE to continue your quest!", True, continue_color)
+        continue_text = render_pulsing_text(self.small_font, "Press SPACE to continue your quest!", continue_color)
         continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH//2, 550))
         screen.blit(continue_text, continue_rect)
     
     def render_game_complete(self):
         self.screen.fill(PURPLE)
         
-        complete_text = self.font.render("CONGRATULATIONS!", True, WHITE)
+        complete_text = text_cache.render(self.font, "CONGRATULATIONS!", True, WHITE)
         complete_rect = complete_text.get_rect(center=(SCREEN_WIDTH//2, 200))
         self.screen.blit(complete_text, complete_rect)
         
-        victory_text = self.font.render("You completed Crystal Quest!", True, YELLOW)
+        victory_text = text_cache.render(self.font, "You completed Crystal Quest!", True, YELLOW)
         victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH//2, 280))
         self.screen.blit(victory_text, victory_rect)
         
@@ -1104,7 +1115,7 @@ class GameEngine:
         ]
         
         for i, line in enumerate(stats_lines):
-            text = self.small_font.render(line, True, WHITE)
+            text = text_cache.render(self.small_font, line, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH//2, 380 + i * 30))
             self.screen.blit(text, text_rect)
     
@@ -1112,15 +1123,12 @@ class GameEngine:
         import math
         
         # Epic victory gradient background (purple to gold)
-        for y in range(SCREEN_HEIGHT):
-            color_factor = y / SCREEN_HEIGHT
-            time_factor = math.sin(pygame.time.get_ticks() * 0.002) * 0.3 + 0.7
-            color = (
-                min(255, max(0, int((150 + 105 * color_factor) * time_factor))),
-                min(255, max(0, int((50 + 150 * color_factor) * time_factor))),
-                min(255, max(0, int((180 - 130 * color_factor) * time_factor)))
-            )
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
+        time_factor = math.sin(pygame.time.get_ticks() * 0.002) * 0.3 + 0.7
+        gradient_engine.draw(screen, lambda y, color_factor, xp: (
+            xp.clip((150 + 105 * color_factor) * time_factor, 0, 255),
+            xp.clip((50 + 150 * color_factor) * time_factor, 0, 255),
+            xp.clip((180 - 130 * color_factor) * time_factor, 0, 255)
+        ))
         
         # Victory fireworks particles
         for i in range(30):
@@ -1151,14 +1159,14 @@ class GameEngine:
         
         # Rainbow title effect
         rainbow_colors = [
-            (255, int(100 + 155 * math.sin(title_time)), 100),
-            (255, 200, int(100 + 155 * math.sin(title_time + 1))),
-            (int(100 + 155 * math.sin(title_time + 2)), 255, 255),
+            (255, max(0, int(100 + 155 * math.sin(title_time))), 100),
+            (255, 200, max(0, int(100 + 155 * math.sin(title_time + 1)))),
+            (max(0, int(100 + 155 * math.sin(title_time + 2))), 255, 255),
         ]
         
         for i, color in enumerate(rainbow_colors):
             offset = i * 3
-            title_text = self.font.render("CONGRATULATIONS!", True, color)
+            title_text = render_pulsing_text(self.font, "CONGRATULATIONS!", color)
             title_rect = title_text.get_rect(center=(
                 SCREEN_WIDTH//2 + offset, 
                 120 + offset + int(10 * math.sin(title_time + i))
@@ -1166,14 +1174,14 @@ class GameEngine:
             screen.blit(title_text, title_rect)
         
         # Main title (white on top)
-        title_text = self.font.render("CONGRATULATIONS!", True, WHITE)
+        title_text = text_cache.render(self.font, "CONGRATULATIONS!", True, WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 120))
         screen.blit(title_text, title_rect)
         
         # Epic subtitle
         subtitle_glow = math.sin(pygame.time.get_ticks() * 0.006) * 0.3 + 0.7
         subtitle_color = tuple(min(255, max(0, int(c * subtitle_glow))) for c in GOLDEN_YELLOW)
-        victory_text = self.font.render("You completed Crystal Quest!", True, subtitle_color)
+        victory_text = render_pulsing_text(self.font, "You completed Crystal Quest!", subtitle_color)
         victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH//2, 180))
         screen.blit(victory_text, victory_rect)
         
@@ -1208,11 +1216,11 @@ class GameEngine:
         # Achievement text
         achievement_pulse = math.sin(pygame.time.get_ticks() * 0.008) * 0.2 + 0.8
         achievement_color = tuple(min(255, max(0, int(c * achievement_pulse))) for c in GOLDEN_YELLOW)
-        achievement_text = self.small_font.render("🏆 CRYSTAL MASTER ACHIEVED! 🏆", True, achievement_color)
+        achievement_text = render_pulsing_text(self.small_font, "🏆 CRYSTAL MASTER ACHIEVED! 🏆", achievement_color)
         achievement_rect = achievement_text.get_rect(center=(SCREEN_WIDTH//2, banner_y + banner_height//2))
         # Remove emoji for compatibility
         clean_achievement = "CRYSTAL MASTER ACHIEVED!"
-        achievement_text = self.small_font.render(clean_achievement, True, achievement_color)
+        achievement_text = render_pulsing_text(self.small_font, clean_achievement, achievement_color)
         screen.blit(achievement_text, achievement_rect)
         
         # Final stats panel
@@ -1249,7 +1257,7 @@ class GameEngine:
         for i, (stat, color) in enumerate(zip(final_stats, stat_colors)):
             stat_wave = math.sin(pygame.time.get_ticks() * 0.005 + i * 0.5) * 0.2 + 0.8
             final_color = tuple(min(255, max(0, int(c * stat_wave))) for c in color)
-            stat_text = self.small_font.render(stat, True, final_color)
+            stat_text = render_pulsing_text(self.small_font, stat, final_color)
             stat_rect = stat_text.get_rect(center=(SCREEN_WIDTH//2, stats_y + 30 + i * 35))
             screen.blit(stat_text, stat_rect)
         
@@ -1257,13 +1265,13 @@ class GameEngine:
         thanks_y = 540
         thanks_pulse = math.sin(pygame.time.get_ticks() * 0.004) * 0.3 + 0.7
         thanks_color = tuple(min(255, max(0, int(c * thanks_pulse))) for c in WHITE)
-        thanks_text = self.small_font.render("Thanks for playing Crystal Quest!", True, thanks_color)
+        thanks_text = render_pulsing_text(self.small_font, "Thanks for playing Crystal Quest!", thanks_color)
         thanks_rect = thanks_text.get_rect(center=(SCREEN_WIDTH//2, thanks_y))
         screen.blit(thanks_text, thanks_rect)
         
         # Play again instruction
         play_again_pulse = math.sin(pygame.time.get_ticks() * 0.012) * 0.4 + 0.6
         play_again_color = tuple(min(255, max(0, int(c * play_again_pulse))) for c in GOLDEN_YELLOW)
-        play_again_text = self.small_font.render("Press SPACE to embark on a new quest!", True, play_again_color)
+        play_again_text = render_pulsing_text(self.small_font, "Press SPACE to embark on a new quest!", play_again_color)
         play_again_rect = play_again_text.get_rect(center=(SCREEN_WIDTH//2, 580))
         screen.blit(play_again_text, play_again_rect)
@@ -0,0 +1,99 @@
+# Gradient Rendering for Crystal Quest
+import pygame
+import math
+from .constants import *
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, gradients fall back to a Python loop
+    numpy = None
+
+class ScalarMath:
+    """Scalar stand-ins for the NumPy functions used by gradient formulas"""
+    sin = staticmethod(math.sin)
+    cos = staticmethod(math.cos)
+    
+    @staticmethod
+    def clip(value, low, high):
+        return min(high, max(low, value))
+
+class GradientEngine:
+    """Draws full-screen vertical gradients by stretching one column of colors.
+    
+    A gradient formula takes (y, ratio, xp) and returns (red, green, blue).
+    With NumPy, y and ratio are arrays over every row and xp is numpy, so a
+    whole frame's column is a single vectorized expression. Without NumPy,
+    the formula is called once per row with floats and xp is ScalarMath.
+    """
+    def __init__(self):
+        self.size = None
+        self.format = None  # (bitsize, masks) of the surface drawn into
+        self.column = None  # 1 pixel wide surface holding one color per row
+        self.column_pixels = None
+        self.rows = None
+        self.ratios = None
+        self.static_gradients = {}
+    
+    def prepare(self, screen):
+        """(Re)allocate the column buffers for a target's size and pixel format"""
+        size = screen.get_size()
+        target_format = (screen.get_bitsize(), screen.get_masks())
+        if size == self.size and target_format == self.format:
+            return
+        self.size = size
+        self.format = target_format
+        width, height = size
+        
+        # Stretching straight into the target needs the target's pixel format
+        self.column = pygame.Surface((1, height), 0, screen)
+        
+        if numpy is not None:
+            self.rows = numpy.arange(height, dtype=numpy.float64)
+            self.ratios = self.rows / height
+            self.column_pixels = numpy.zeros((1, height, 3), dtype=numpy.uint8)
+        
+        # Cached gradients are only valid for the size and format they were drawn at
+        self.static_gradients.clear()
+    
+    def fill_column(self, formula):
+        """Evaluate a formula for every row into the column surface"""
+        if numpy is not None:
+            red, green, blue = formula(self.rows, self.ratios, numpy)
+            # Assigning to the uint8 buffer truncates like int() did per row
+            self.column_pixels[0, :, 0] = red
+            self.column_pixels[0, :, 1] = green
+            self.column_pixels[0, :, 2] = blue
+            pygame.surfarray.blit_array(self.column, self.column_pixels)
+        else:
+            height = self.size[1]
+            for y in range(height):
+                color = formula(y, y / height, ScalarMath)
+                self.column.set_at((0, y), tuple(int(c) for c in color))
+    
+    def draw(self, screen, formula):
+        """Draw an animated gradient: one column evaluation and one stretch"""
+        self.prepare(screen)
+        self.fill_column(formula)
+        pygame.transform.scale(self.column, self.size, screen)
+    
+    def draw_static(self, screen, key, formula):
+        """Draw a gradient that never changes, rendering it only once"""
+        self.prepare(screen)
+        surface = self.static_gradients.get(key)
+        if surface is None:
+            self.fill_column(formula)
+            surface = pygame.transform.scale(self.column, self.size)
+            self.static_gradients[key] = surface
+        screen.blit(surface, (0, 0))
+    
+    def draw_linear(self, screen, top_color, bottom_color):
+        """Draw a cached two-color top to bottom gradient"""
+        def formula(y, ratio, xp):
+            return tuple(
+                top_color[i] * (1 - ratio) + bottom_color[i] * ratio
+                for i in range(3)
+            )
+        self.draw_static(screen, ("linear", top_color, bottom_color), formula)
+
+# Global gradient engine instance
+gradient_engine = GradientEngine()
@@ -0,0 +1,78 @@
+# Headless Simulation for Crystal Quest
+import os
+import time
+
+# No window or audio device is needed, so use SDL's dummy drivers
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from .constants import *
+from .game_engine import GameEngine
+from .rng import streams
+from .effects import effects
+from .input import SESSION_EVENTS
+
+def create_headless_engine(input_source=None):
+    """Game engine that simulates without a window, rendering or sound"""
+    # The dummy display only backs keyboard sources; the mixer is never started
+    pygame.display.init()
+    pygame.font.init()
+    return GameEngine(None, headless=True, input_source=input_source)
+
+def replay_session_events(engine):
+    """Run the restarts the input source holds for before its next step"""
+    for event in engine.input_source.take_events():
+        if event not in SESSION_EVENTS:
+            raise ValueError(f"Unknown session event: {event}")
+        getattr(engine, event)()
+
+def run_simulation(steps, tick_rate=SIMULATION_RATE, controller=None, engine=None, seed=RANDOM_SEED,
+                   input_source=None):
+    """Step the game as fast as the CPU allows and return run statistics.
+    
+    Player controls come from input_source (scripted or recorded), and
+    controller(engine, step) is called before every step for anything else.
+    Restarts held by a recording are replayed before the step they were
+    recorded at. Completed levels advance automatically and the run stops
+    early once the game is over or complete with no restart to follow.
+    Runs with the same seed and input give identical results.
+    """
+    # Start from clean shared state so equal seeds and input replay exactly
+    streams.reseed(seed)
+    effects.clear()
+    if engine is None:
+        engine = create_headless_engine(input_source)
+    elif input_source is not None:
+        engine.input_source = input_source
+    if engine.state == "menu":
+        engine.start_game()
+    
+    dt = 1.0 / tick_rate
+    completed = 0
+    start = time.perf_counter()
+    for completed in range(1, steps + 1):
+        replay_session_events(engine)
+        if controller:
+            controller(engine, completed - 1)
+        if not engine.update(dt):
+            break
+        
+        if engine.state == "level_complete":
+            engine.next_level()
+        replay_session_events(engine)
+        if engine.state in ("game_over", "game_complete"):
+            break
+    elapsed = time.perf_counter() - start
+    
+    return {
+        "seed": streams.seed,
+        "steps": completed,
+        "simulated_seconds": completed * dt,
+        "elapsed_seconds": elapsed,
+        "steps_per_second": completed / elapsed if elapsed > 0 else 0.0,
+        "state": engine.state,
+        "levels_completed": engine.level_manager.current_level,
+        "score": engine.player.score,
+        "lives": engine.player.lives,
+    }
@@ -0,0 +1,215 @@
+# Heads-Up Display for Crystal Quest
+import pygame
+import math
+from .constants import *
+from .sprites import text_cache, render_pulsing_text
+
+class HudWidget:
+    """A piece of the HUD that is only re-rasterized after it is invalidated"""
+    def __init__(self, builder):
+        self.builder = builder  # Returns a list of (surface, position) blits
+        self.blits = []
+        self.key = None
+        self.dirty = True
+    
+    def invalidate(self):
+        self.dirty = True
+    
+    def set_key(self, key):
+        """Invalidate the widget if the value it shows has changed"""
+        if key != self.key:
+            self.key = key
+            self.dirty = True
+    
+    def draw(self, screen):
+        if self.dirty:
+            self.blits = self.builder()
+            self.dirty = False
+        screen.blits(self.blits, doreturn=False)
+
+class Hud:
+    """Retained-mode in-game HUD.
+    
+    Panels are built once and each widget keeps its rendered surfaces until a
+    player or level event changes what it shows, so a frame only composites.
+    """
+    def __init__(self, font):
+        self.font = font
+        self.player = None
+        self.level = None
+        self.level_manager = None
+        
+        self.left_panel = self.build_panel(250, 120)
+        self.right_panel = self.build_panel(200, 100)
+        
+        # Rows of hearts for the current life count, keyed by pulse size
+        self.heart_rows = {}
+        
+        self.level_info = HudWidget(self.build_level_info)
+        self.score = HudWidget(self.build_score)
+        self.crystals = HudWidget(self.build_crystals)
+        self.timer = HudWidget(self.build_timer)
+        self.powerups = HudWidget(self.build_powerups)
+        self.widgets = [self.level_info, self.score, self.crystals, self.timer, self.powerups]
+    
+    def bind(self, player, level, level_manager):
+        """Show a player and level, listening to their events"""
+        if self.player:
+            self.player.remove_listener(self.on_event)
+        if self.level:
+            self.level.remove_listener(self.on_event)
+        
+        self.player = player
+        self.level = level
+        self.level_manager = level_manager
+        player.add_listener(self.on_event)
+        level.add_listener(self.on_event)
+        
+        self.invalidate()
+    
+    def invalidate(self):
+        """Re-rasterize everything on the next frame"""
+        self.heart_rows.clear()
+        for widget in self.widgets:
+            widget.invalidate()
+    
+    def on_event(self, event):
+        if event == "lives":
+            self.heart_rows.clear()
+        elif event == "score":
+            self.score.invalidate()
+        elif event == "crystals":
+            self.crystals.invalidate()
+        elif event in ("powerups", "powerup_tick"):
+            self.powerups.invalidate()
+    
+    def render(self, screen, time_left):
+        """Composite the cached HUD for this frame"""
+        screen.blit(self.left_panel, (5, 5))
+        screen.blit(self.right_panel, (SCREEN_WIDTH - 205, 5))
+        
+        # Full hearts pulse between two sizes, each row is rendered once
+        pulse = math.sin(pygame.time.get_ticks() * 0.008) * 0.1 + 1
+        screen.blit(self.get_heart_row(int(8 * pulse)), (7, 7))
+        
+        # The timer changes once a second, or every frame while it flashes
+        flashing = time_left <= 30
+        if flashing:
+            timer_pulse = math.sin(pygame.time.get_ticks() * 0.02) * 0.3 + 0.7
+            timer_color = tuple(min(255, max(0, int(c * timer_pulse))) for c in RED)
+        elif time_left <= 60:
+            timer_color = ORANGE
+        else:
+            timer_color = WHITE
+        self.timer.set_key((time_left, timer_color, flashing))
+        
+        for widget in self.widgets:
+            widget.draw(screen)
+    
+    def build_panel(self, width, height):
+        panel = pygame.Surface((width, height))
+        panel.set_alpha(180)
+        panel.fill((20, 20, 40))
+        return panel
+    
+    def get_heart_row(self, full_size):
+        row = self.heart_rows.get(full_size)
+        if row is None:
+            row = pygame.Surface((MAX_LIVES * 25 + 16, 24), pygame.SRCALPHA)
+            row.fill((0, 0, 0, 0))
+            for i in range(MAX_LIVES):
+                if i < self.player.lives:
+                    self.draw_heart(row, 8 + i * 25, 8, RED, full_size)
+                else:
+                    self.draw_heart(row, 8 + i * 25, 8, GRAY, 8)
+            self.heart_rows[full_size] = row
+        return row
+    
+    def draw_heart(self, surface, x, y, color, size):
+        # Draw heart shape (simplified)
+        pygame.draw.circle(surface, color, (x, y), size//2)
+        pygame.draw.circle(surface, color, (x + size//2, y), size//2)
+        pygame.draw.polygon(surface, color, [
+            (x - size//2, y),
+            (x + size, y),
+            (x + size//4, y + size)
+        ])
+    
+    def build_level_info(self):
+        lives_text = text_cache.render(self.font, "Lives", True, WHITE)
+        
+        level_text = text_cache.render(
+            self.font,
+            f"Level: {self.level_manager.current_level + 1}/{self.level_manager.get_total_levels()}",
+            True, WHITE
+        )
+        
+        level_name_text = text_cache.render(self.font, self.level.name, True, GOLDEN_YELLOW)
+        level_name_rect = level_name_text.get_rect(topright=(SCREEN_WIDTH - 15, 40))
+        
+        return [
+            (lives_text, (15, 30)),
+            (level_text, (15, 95)),
+            (level_name_text, level_name_rect)
+        ]
+    
+    def build_score(self):
+        score_text = text_cache.render(self.font, f"Score: {self.player.score}", True, GOLDEN_YELLOW)
+        return [(score_text, (15, 45))]
+    
+    def build_crystals(self):
+        collected = self.level.crystals_collected
+        required = self.level.crystals_required
+        crystals_text = text_cache.render(
+            self.font,
+            f"Crystals: {collected}/{required}",
+            True, CRYSTAL_BLUE
+        )
+        
+        # Mini crystal icons, one diamond per required crystal
+        icons = pygame.Surface((required * 15 + 10, 10), pygame.SRCALPHA)
+        icons.fill((0, 0, 0, 0))
+        for i in range(required):
+            icon_x = 5 + i * 15
+            points = [
+                (icon_x, 1),
+                (icon_x + 4, 5),
+                (icon_x, 9),
+                (icon_x - 4, 5)
+            ]
+            pygame.draw.polygon(icons, CRYSTAL_BLUE if i < collected else GRAY, points)
+            if i < collected:
+                pygame.draw.polygon(icons, WHITE, points, 1)
+        
+        return [(crystals_text, (15, 70)), (icons, (95, 70))]
+    
+    def build_timer(self):
+        time_left, timer_color, flashing = self.timer.key
+        if flashing:
+            timer_text = render_pulsing_text(self.font, f"Time: {time_left}", timer_color)
+        else:
+            timer_text = text_cache.render(self.font, f"Time: {time_left}", True, timer_color)
+        return [(timer_text, timer_text.get_rect(topright=(SCREEN_WIDTH - 15, 15)))]
+    
+    def build_powerups(self):
+        blits = []
+        y_offset = 70
+        active = []
+        if self.player.has_double_jump:
+            active.append(("Double Jump", 120, GREEN, WHITE))
+        if self.player.has_speed_boost:
+            active.append((f"Speed Boost ({int(self.player.speed_boost_timer)}s)", 140, GOLDEN_YELLOW, BLACK))
+        if self.player.has_shield:
+            active.append((f"Shield ({int(self.player.shield_timer)}s)", 110, CYAN, BLACK))
+        
+        for label, width, background, color in active:
+            powerup_bg = pygame.Surface((width, 20))
+            powerup_bg.set_alpha(150)
+            powerup_bg.fill(background)
+            blits.append((powerup_bg, (SCREEN_WIDTH - width - 5, y_offset - 2)))
+            
+            powerup_text = text_cache.render(self.font, label, True, color)
+            blits.append((powerup_text, powerup_text.get_rect(topright=(SCREEN_WIDTH - 15, y_offset))))
+            y_offset += 25
+        
+        return blits
@@ -0,0 +1,149 @@
+# Input Handling for Crystal Quest
+import json
+import pygame
+from .constants import *
+
+LEFT_KEYS = (pygame.K_LEFT, pygame.K_a)
+RIGHT_KEYS = (pygame.K_RIGHT, pygame.K_d)
+JUMP_KEYS = (pygame.K_SPACE, pygame.K_UP, pygame.K_w)
+
+class InputState:
+    """Snapshot of the player's controls for one simulation step"""
+    __slots__ = ("left", "right", "jump")
+    
+    def __init__(self, left=False, right=False, jump=False):
+        self.left = left
+        self.right = right
+        self.jump = jump  # Jump was pressed since the previous step
+    
+    def to_bits(self):
+        """Pack the controls into a small int for recordings"""
+        return bool(self.left) | bool(self.right) << 1 | bool(self.jump) << 2
+    
+    @classmethod
+    def from_bits(cls, bits):
+        return cls(bool(bits & 1), bool(bits & 2), bool(bits & 4))
+    
+    def __eq__(self, other):
+        return isinstance(other, InputState) and self.to_bits() == other.to_bits()
+    
+    def __repr__(self):
+        return f"InputState(left={self.left}, right={self.right}, jump={self.jump})"
+
+# Engine methods that reset the simulation mid-session, recorded along with the input
+SESSION_EVENTS = ("restart_game", "restart_level")
+
+class InputSource:
+    """Produces one InputState per simulation step; the base source never presses anything"""
+    def handle_key_press(self, key):
+        """Called for key presses while playing"""
+        pass
+    
+    def poll(self):
+        """Controls for the next simulation step"""
+        return InputState()
+    
+    def mark(self, event):
+        """Called when the engine runs one of SESSION_EVENTS"""
+        pass
+    
+    def take_events(self):
+        """Session events to replay before the next step"""
+        return []
+
+class KeyboardInput(InputSource):
+    """Live keyboard: held keys are read once per step, jumps are queued from key events"""
+    def __init__(self):
+        self.jump_queued = False
+    
+    def handle_key_press(self, key):
+        if key in JUMP_KEYS:
+            self.jump_queued = True
+    
+    def poll(self):
+        keys = pygame.key.get_pressed()
+        state = InputState(any(keys[key] for key in LEFT_KEYS),
+                           any(keys[key] for key in RIGHT_KEYS),
+                           self.jump_queued)
+        self.jump_queued = False
+        return state
+
+class ScriptedInput(InputSource):
+    """Generated input: script(step) returns the InputState for each step"""
+    def __init__(self, script):
+        self.script = script
+        self.step = 0
+    
+    def poll(self):
+        state = self.script(self.step)
+        self.step += 1
+        return state
+
+class RecordedInput(InputSource):
+    """Plays back recorded snapshots and session events, then stops pressing anything"""
+    def __init__(self, frames, seed=None, tick_rate=SIMULATION_RATE, events=()):
+        self.frames = frames  # InputState.to_bits() per step
+        self.events = [tuple(event) for event in events]  # (step, event) in step order
+        self.seed = seed  # Session seed the recording was made with
+        self.tick_rate = tick_rate
+        self.step = 0
+        self.next_event = 0
+    
+    def __len__(self):
+        return len(self.frames)
+    
+    def poll(self):
+        if self.step >= len(self.frames):
+            return InputState()
+        state = InputState.from_bits(self.frames[self.step])
+        self.step += 1
+        return state
+    
+    def take_events(self):
+        events = []
+        while self.next_event < len(self.events) and self.events[self.next_event][0] <= self.step:
+            events.append(self.events[self.next_event][1])
+            self.next_event += 1
+        return events
+    
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        for _, event in data.get('events', []):
+            if event not in SESSION_EVENTS:
+                raise ValueError(f"Unknown event in input recording: {event}")
+        return cls(data['frames'], data.get('seed'), data.get('tick_rate', SIMULATION_RATE),
+                   data.get('events', []))
+
+class InputRecorder(InputSource):
+    """Passes another source through and keeps every snapshot and session event it sees.
+    
+    Events are stored with the number of steps polled before them, so a
+    replay can restart at the same point.
+    """
+    def __init__(self, source):
+        self.source = source
+        self.frames = []
+        self.events = []
+    
+    def handle_key_press(self, key):
+        self.source.handle_key_press(key)
+    
+    def poll(self):
+        state = self.source.poll()
+        self.frames.append(state.to_bits())
+        return state
+    
+    def mark(self, event):
+        self.events.append((len(self.frames), event))
+        self.source.mark(event)
+    
+    def take_events(self):
+        return self.source.take_events()
+    
+    def save(self, path, seed=None, tick_rate=SIMULATION_RATE):
+        """Write the recording as JSON, loadable with RecordedInput.load"""
+        with open(path, 'w') as f:
+            json.dump({'seed': seed, 'tick_rate': tick_rate, 'frames': self.frames,
+                       'events': self.events}, f)
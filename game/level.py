@@ -2,8 +2,233 @@ import pygame
 import json
 import random
 import math
+from bisect import bisect_left, bisect_right
 from game.constants import *
 from game.entities import Enemy, Crystal, Coin, PowerUp
+from game.sprites import SurfaceCache
+from game.spatial import SpatialGrid
+from game.quality import quality
+from game.camera import camera, interpolate_offset
+
+class BackgroundCache:
+    """Pre-rendered gradient backgrounds, drawn once per level theme"""
+    def __init__(self):
+        self.surfaces = {}
+        self.size = None
+    
+    def get(self, level_num, size):
+        """Get the gradient surface for a theme at the given resolution"""
+        # Gradients are only valid for the resolution they were drawn at
+        if size != self.size:
+            self.invalidate()
+            self.size = size
+        
+        surface = self.surfaces.get(level_num)
+        if surface is None:
+            surface = self.render_gradient(level_num, size)
+            self.surfaces[level_num] = surface
+        return surface
+    
+    def render_gradient(self, level_num, size):
+        """Draw a theme's gradient into a new surface"""
+        if level_num in BACKGROUND_GRADIENTS:
+            top_color, bottom_color = BACKGROUND_GRADIENTS[level_num]
+        else:
+            top_color, bottom_color = BACKGROUND_GRADIENTS[0]
+        
+        width, height = size
+        surface = pygame.Surface(size)
+        # Match the display pixel format so the per-frame blit is a plain copy
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        
+        for y in range(height):
+            ratio = y / height
+            color = tuple(
+                int(top_color[i] * (1 - ratio) + bottom_color[i] * ratio)
+                for i in range(3)
+            )
+            pygame.draw.line(surface, color, (0, y), (width, y))
+        return surface
+    
+    def invalidate(self):
+        """Drop all cached gradients (e.g. after a resolution change)"""
+        self.surfaces.clear()
+
+
+# Shared across levels so each theme's gradient is only drawn once
+background_cache = BackgroundCache()
+
+
+class DecorationCache:
+    """Decoration sprites built once and shared by every level that uses them"""
+    def __init__(self):
+        self.sprites = {}
+    
+    def get(self, key, builder):
+        """Get the (surface, offset) sprite for key, building it on first use"""
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = builder()
+            self.sprites[key] = sprite
+        return sprite
+    
+    def draw(self, screen, key, builder, positions, offset=(0, 0)):
+        """Blit the sprite for key at each world anchor position inside the target's clip area"""
+        surface, (sprite_x, sprite_y) = self.get(key, builder)
+        sprite_x -= offset[0]
+        sprite_y -= offset[1]
+        sprite_rect = surface.get_rect()
+        clip = screen.get_clip()
+        blits = []
+        for x, y in positions:
+            sprite_rect.topleft = (x + sprite_x, y + sprite_y)
+            if clip.colliderect(sprite_rect):
+                blits.append((surface, sprite_rect.topleft))
+        camera.count_culled("decorations", len(positions) - len(blits))
+        screen.blits(blits, False)
+    
+    def clear(self):
+        """Drop all cached sprites"""
+        self.sprites.clear()
+
+
+# Shared across levels so each decoration is only rasterized once
+decoration_cache = DecorationCache()
+
+
+class StaticLayer:
+    """Pre-composed surfaces holding the parts of a level that never change.
+    
+    The level is split into columns STATIC_CHUNK_WIDTH wide that are composed
+    on first view and kept in a small cache, so a level many screens wide
+    never needs one huge surface.
+    """
+    def __init__(self, level, max_chunks=STATIC_CHUNK_CACHE):
+        self.level = level
+        self.chunks = SurfaceCache(max_entries=max_chunks)
+        self.quality_changes = None  # Quality version the chunks were built at
+    
+    def build_chunk(self, index):
+        """Compose the gradient, static decorations and platforms of one column"""
+        left = index * STATIC_CHUNK_WIDTH
+        width = min(STATIC_CHUNK_WIDTH, self.level.width - left)
+        surface = pygame.Surface((width, self.level.height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        
+        self.level.draw_gradient_background(surface)
+        self.level.draw_background_decorations(surface, (left, 0))
+        self.level.draw_platforms(surface, (left, 0))
+        return surface
+    
+    def get_chunk(self, index):
+        """Get a composed column, rebuilding everything if quality changed"""
+        if self.quality_changes != quality.changes:
+            self.chunks.clear()
+            self.quality_changes = quality.changes
+        return self.chunks.get(index, lambda: self.build_chunk(index))
+    
+    def build(self, area):
+        """Compose the columns covering a world rect up front"""
+        for index in self.chunk_range(area):
+            self.get_chunk(index)
+    
+    def chunk_range(self, area):
+        area = area.clip(0, 0, self.level.width, self.level.height)
+        if not area:
+            return range(0)
+        return range(area.left // STATIC_CHUNK_WIDTH, (area.right - 1) // STATIC_CHUNK_WIDTH + 1)
+    
+    def draw(self, screen, area, offset=(0, 0)):
+        """Copy a world rect of the layer to the screen, shifted by the camera offset"""
+        offset_x, offset_y = offset
+        for index in self.chunk_range(area):
+            chunk = self.get_chunk(index)
+            chunk_left = index * STATIC_CHUNK_WIDTH
+            source = area.clip(chunk.get_rect(x=chunk_left))
+            screen.blit(chunk, (source.x - offset_x, source.y - offset_y),
+                        source.move(-chunk_left, 0))
+    
+    def invalidate(self):
+        """Drop the composed chunks so they are rebuilt on next use"""
+        self.chunks.clear()
+
+
+class StarField:
+    """Twinkling stars laid out once and drawn from pre-baked sprites"""
+    ALPHA_STEPS = 64  # Entries in the twinkle lookup table (one full cycle)
+    
+    def __init__(self, count=50, seed=LAYOUT_SEED):
+        # Private generator with a fixed seed, so the sky is the same in every session
+        rng = random.Random(seed)
+        
+        # One twinkle cycle of alpha values, indexed by phase step
+        self.alpha_table = [
+            100 + int(50 * math.sin(2 * math.pi * step / self.ALPHA_STEPS))
+            for step in range(self.ALPHA_STEPS)
+        ]
+        
+        # One sprite per star size and alpha step
+        self.sprites = {}
+        for size in range(1, 4):
+            frames = []
+            for alpha in self.alpha_table:
+                star_surface = pygame.Surface((size * 2, size * 2))
+                star_surface.set_alpha(alpha)
+                pygame.draw.circle(star_surface, WHITE, (size, size), size)
+                frames.append(star_surface)
+            self.sprites[size] = frames
+        
+        # Star attributes in parallel arrays
+        self.sprite_frames = []
+        self.phases = []
+        self.positions = []
+        self.rects = []
+        for _ in range(count):
+            x = rng.randint(0, SCREEN_WIDTH)
+            y = rng.randint(0, SCREEN_HEIGHT // 2)
+            size = rng.randint(1, 3)
+            self.sprite_frames.append(self.sprites[size])
+            # Stars further right are further along the cycle
+            self.phases.append(self.phase_to_step(x * 0.01))
+            self.positions.append((x - size, y - size))
+            self.rects.append(pygame.Rect(x - size, y - size, size * 2, size * 2))
+        self.stars = list(zip(self.sprite_frames, self.phases, self.positions))
+        
+        # Stars draw over the static layer, so hide those behind platform art
+        self.covered = [False] * count
+        self.cover_offset = None  # Camera offset covered was worked out for
+    
+    def phase_to_step(self, phase):
+        """Convert a sine phase in radians to an alpha table index"""
+        return int(phase / (2 * math.pi) * self.ALPHA_STEPS)
+    
+    def hide_covered(self, platform_grid, offset):
+        """Mark the stars a platform's shadow or texture reaches at this camera offset"""
+        if offset == self.cover_offset:
+            return
+        self.cover_offset = offset
+        reach = PLATFORM_DRAW_MARGIN * 2
+        for index, rect in enumerate(self.rects):
+            area = rect.move(offset).inflate(reach, reach)
+            self.covered[index] = area.collidelist(platform_grid.query(area)) >= 0
+    
+    def draw(self, screen, ticks, count=None):
+        """Blit the first count uncovered stars (all by default) at their twinkle alpha"""
+        step = self.phase_to_step(ticks * 0.01)
+        steps = self.ALPHA_STEPS
+        screen.blits(
+            [(frames[(step + phase) % steps], position)
+             for (frames, phase, position), covered in zip(self.stars[:count], self.covered)
+             if not covered],
+            False
+        )
+    
+    def get_dirty_rects(self):
+        """Screen areas touched by draw"""
+        return list(self.rects)
+
 
 class Level:
     def __init__(self, level_data):
@@ -16,6 +241,17 @@ class Level:
         self.name = level_data.get('name', 'Unknown Level')
         self.time_limit = level_data.get('time_limit', LEVEL_TIME_LIMIT)
         self.crystals_required = level_data.get('crystals_required', 0)
+        # World size in pixels; levels may be many screens wide but never narrower than one
+        self.width = max(SCREEN_WIDTH, level_data.get('width', SCREEN_WIDTH))
+        self.height = SCREEN_HEIGHT
+        self.static_layer = StaticLayer(self)
+        self.star_field = None
+        
+        # Collected crystal count, kept in step with crystal.collected
+        self.crystals_collected = 0
+        
+        # Callbacks notified of level events such as "crystals"
+        self.listeners = []
         
         self.load_level(level_data)
     
@@ -57,22 +293,62 @@ class Level:
                 powerup_data['type']
             )
             self.powerups.append(powerup)
+        
+        # Collectibles never move sideways, so keep them sorted for range lookups
+        for collectibles in (self.crystals, self.coins, self.powerups):
+            collectibles.sort(key=lambda item: item.x)
+        self.collectible_xs = [[item.x for item in collectibles]
+                               for collectibles in (self.crystals, self.coins, self.powerups)]
+        
+        # Build animated decorations once instead of every frame
+        if self.get_level_number() == 1:
+            self.star_field = StarField()
+        
+        self.invalidate_geometry()
+    
+    def invalidate_geometry(self):
+        """Pick up platform changes; must be called whenever platforms are added, moved or removed"""
+        # Collision queries only visit the platforms near the asking entity
+        self.platform_grid = SpatialGrid(self.platforms)
+        if self.star_field:
+            self.star_field.cover_offset = None
+        self.invalidate_static_layer()
+    
+    def invalidate_static_layer(self):
+        """Rebuild the pre-composed background and platforms on next render"""
+        self.static_layer.invalidate()
+    
+    def add_listener(self, listener):
+        """Register a callback to be called with the name of each level event"""
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+    
+    def notify(self, event):
+        for listener in self.listeners:
+            listener(event)
     
     def update(self, dt, player):
+        # Off-screen entities can be frozen instead of simulated
+        cull = camera.cull_simulation
+        
         # Update enemies (don't remove dead ones so they can be reset)
         for enemy in self.enemies:
             if enemy.alive:
-                enemy.update(dt, self.platforms, player)
+                if cull and not camera.is_visible(enemy.get_render_bounds()):
+                    camera.count_culled("entities")
+                    continue
+                enemy.update(dt, self.platform_grid, player)
         
         # Update collectibles
-        for crystal in self.crystals:
-            crystal.update(dt)
-        
-        for coin in self.coins:
-            coin.update(dt)
-        
-        for powerup in self.powerups:
-            powerup.update(dt)
+        for collectibles in (self.crystals, self.coins, self.powerups):
+            for item in collectibles:
+                if cull and not item.collected and not camera.is_visible(item.get_render_bounds()):
+                    camera.count_culled("entities")
+                    continue
+                item.update(dt)
         
         # Check collisions with player
         player_rect = pygame.Rect(player.x, player.y, player.width, player.height)
@@ -99,6 +375,8 @@ class Level:
                     WHITE, count=10
                 )
                 crystal.collected = True
+                self.crystals_collected += 1
+                self.notify("crystals")
                 player.collect_crystal()
         
         # Coin collisions
@@ -134,134 +412,208 @@ class Level:
                 player.collect_powerup(powerup.type)
     
     def is_complete(self, player):
-        collected_crystals = sum(1 for crystal in self.crystals if crystal.collected)
-        return collected_crystals >= self.crystals_required
+        return self.crystals_collected >= self.crystals_required
     
-    def render(self, screen):
-        # Draw gradient background
-        self.draw_gradient_background(screen)
+    def render(self, screen, offset=(0, 0), alpha=1.0):
+        # Gradient, decorations and platforms are pre-composed in chunks
+        self.static_layer.draw(screen, screen.get_rect(topleft=offset), offset)
         
-        # Draw background decorations
-        self.draw_background_decorations(screen)
+        self.render_dynamic(screen, offset, alpha)
+    
+    def render_dynamic(self, screen, offset=(0, 0), alpha=1.0):
+        """Draw everything that is not part of the static layer"""
+        # Draw animated decorations on top of the static layer
+        self.draw_animated_decorations(screen, offset)
         
-        # Draw platforms with enhanced graphics
-        self.draw_platforms(screen)
+        # Draw entities inside the viewport, moving enemies between their last two steps
+        for enemy in self.get_visible_enemies(count=True):
+            enemy.render(screen, interpolate_offset(offset, enemy, alpha))
         
-        # Draw entities
+        for item in self.get_visible_collectibles(count=True):
+            item.render(screen, offset)
+    
+    def get_visible_enemies(self, count=False):
+        """Live enemies inside the viewport, reporting the others as culled if count is set"""
         for enemy in self.enemies:
             if enemy.alive:
-                enemy.render(screen)
+                if camera.is_visible(enemy.get_render_bounds()):
+                    yield enemy
+                elif count:
+                    camera.count_culled("entities")
+    
+    def get_visible_collectibles(self, count=False):
+        """Uncollected items inside the viewport, in drawing order.
         
-        for crystal in self.crystals:
-            crystal.render(screen)
+        Items are looked up by x range so wide levels only visit the ones
+        near the view. With count set, skipped items are reported as culled,
+        including collected ones outside the range.
+        """
+        bounds = camera.bounds
+        for collectibles, xs in zip((self.crystals, self.coins, self.powerups), self.collectible_xs):
+            first = bisect_left(xs, bounds.left - ENTITY_RENDER_REACH)
+            last = bisect_right(xs, bounds.right + ENTITY_RENDER_REACH)
+            if count:
+                camera.count_culled("entities", first + len(xs) - last)
+            for item in collectibles[first:last]:
+                if item.collected:
+                    continue
+                if camera.is_visible(item.get_render_bounds()):
+                    yield item
+                elif count:
+                    camera.count_culled("entities")
+    
+    def restore_background(self, screen, rects, offset=(0, 0)):
+        """Repaint the given screen areas from the static layer"""
+        for rect in rects:
+            self.static_layer.draw(screen, rect.move(offset), offset)
+    
+    def get_dirty_rects(self, offset=(0, 0), alpha=1.0):
+        """Screen areas touched by render_dynamic this frame"""
+        rects = []
+        if self.star_field:
+            # Stars are a backdrop fixed to the screen
+            rects.extend(self.star_field.get_dirty_rects())
         
-        for coin in self.coins:
-            coin.render(screen)
+        for enemy in self.get_visible_enemies():
+            enemy_x, enemy_y = interpolate_offset(offset, enemy, alpha)
+            rects.append(enemy.get_render_bounds().move(-enemy_x, -enemy_y))
         
-        for powerup in self.powerups:
-            powerup.render(screen)
+        for item in self.get_visible_collectibles():
+            rects.append(item.get_render_bounds().move(-offset[0], -offset[1]))
+        return rects
     
     def draw_gradient_background(self, screen):
         """Draw a beautiful gradient background"""
-        level_num = self.get_level_number()
-        if level_num in BACKGROUND_GRADIENTS:
-            top_color, bottom_color = BACKGROUND_GRADIENTS[level_num]
-        else:
-            top_color, bottom_color = BACKGROUND_GRADIENTS[0]
-        
-        # Draw gradient
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            color = tuple(
-                int(top_color[i] * (1 - ratio) + bottom_color[i] * ratio)
-                for i in range(3)
-            )
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
+        # The gradient only varies vertically, so every chunk shares one surface
+        gradient = background_cache.get(self.get_level_number(),
+                                        (STATIC_CHUNK_WIDTH, screen.get_height()))
+        screen.blit(gradient, (0, 0))
     
-    def draw_background_decorations(self, screen):
-        """Draw decorative background elements"""
-        level_num = self.get_level_number()
+    def draw_background_decorations(self, screen, offset=(0, 0)):
+        """Draw decorative background elements that never change"""
+        if quality.get("decoration_detail") < 1:
+            return
         
+        level_num = self.get_level_number()
         if level_num == 0:  # Tutorial - clouds
-            self.draw_clouds(screen)
-        elif level_num == 1:  # Sky level - stars
-            self.draw_stars(screen)
+            self.draw_clouds(screen, offset)
         elif level_num == 2:  # Cave - stalactites
-            self.draw_cave_decorations(screen)
+            self.draw_cave_decorations(screen, offset)
         elif level_num == 3:  # Crystal - crystals in background
-            self.draw_crystal_decorations(screen)
+            self.draw_crystal_decorations(screen, offset)
         elif level_num == 4:  # Final - ancient ruins
-            self.draw_ruin_decorations(screen)
+            self.draw_ruin_decorations(screen, offset)
+    
+    def tile_positions(self, positions):
+        """Repeat one screen's decoration layout across the level width"""
+        return [(x + left, y) for left in range(0, self.width, SCREEN_WIDTH) for x, y in positions]
     
-    def draw_clouds(self, screen):
+    def draw_animated_decorations(self, screen, offset=(0, 0)):
+        """Draw decorative background elements that change every frame"""
+        if self.get_level_number() == 1:  # Sky level - twinkling stars
+            self.draw_stars(screen, offset)
+    
+    def draw_clouds(self, screen, offset=(0, 0)):
         """Draw simple cloud shapes"""
         cloud_positions = [(200, 100), (600, 150), (1000, 80), (400, 200)]
-        for x, y in cloud_positions:
-            # Simple cloud made of circles
-            cloud_color = (255, 255, 255, 100)
-            for i, (offset_x, offset_y, size) in enumerate([
-                (0, 0, 30), (25, 5, 25), (50, 0, 30), (15, -15, 20), (35, -10, 18)
-            ]):
-                cloud_surface = pygame.Surface((size * 2, size * 2))
-                cloud_surface.set_alpha(80)
-                cloud_surface.fill((255, 255, 255))
-                pygame.draw.circle(cloud_surface, (255, 255, 255), (size, size), size)
-                screen.blit(cloud_surface, (x + offset_x - size, y + offset_y - size))
-    
-    def draw_stars(self, screen):
-        """Draw twinkling stars"""
-        import random
-        random.seed(42)  # Consistent star positions
-        for _ in range(50):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT // 2)
-            size = random.randint(1, 3)
-            # Simple twinkling effect
-            alpha = 100 + int(50 * math.sin(pygame.time.get_ticks() * 0.01 + x * 0.01))
-            star_surface = pygame.Surface((size * 2, size * 2))
-            star_surface.set_alpha(alpha)
-            pygame.draw.circle(star_surface, WHITE, (size, size), size)
-            screen.blit(star_surface, (x - size, y - size))
-    
-    def draw_cave_decorations(self, screen):
+        decoration_cache.draw(screen, "cloud", self.build_cloud_sprite,
+                              self.tile_positions(cloud_positions), offset)
+    
+    def build_cloud_sprite(self):
+        """Rasterize one cloud cluster into a per-pixel alpha sprite"""
+        # Simple cloud made of overlapping translucent puffs
+        puffs = [(0, 0, 30), (25, 5, 25), (50, 0, 30), (15, -15, 20), (35, -10, 18)]
+        left = min(offset_x - size for offset_x, _, size in puffs)
+        top = min(offset_y - size for _, offset_y, size in puffs)
+        right = max(offset_x + size for offset_x, _, size in puffs)
+        bottom = max(offset_y + size for _, offset_y, size in puffs)
+        
+        # Transparent white, so overlapping puffs only accumulate alpha
+        cloud_surface = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        cloud_surface.fill((255, 255, 255, 0))
+        for offset_x, offset_y, size in puffs:
+            puff_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            puff_surface.fill((255, 255, 255, 80))
+            cloud_surface.blit(puff_surface, (offset_x - size - left, offset_y - size - top))
+        return cloud_surface, (left, top)
+    
+    def draw_stars(self, screen, offset=(0, 0)):
+        """Draw twinkling stars, leaving out any that platforms would cover"""
+        if self.star_field:
+            self.star_field.hide_covered(self.platform_grid, offset)
+            # Lower decoration detail draws a thinner star field
+            count = len(self.star_field.stars) * (quality.get("decoration_detail") + 1) // 3
+            self.star_field.draw(screen, pygame.time.get_ticks(), count)
+    
+    def draw_cave_decorations(self, screen, offset=(0, 0)):
         """Draw cave stalactites and stalagmites"""
         # Stalactites from ceiling
         stalactite_positions = [(100, 0), (300, 0), (500, 0), (800, 0), (1000, 0)]
-        for x, y in stalactite_positions:
+        for x, y in self.tile_positions(stalactite_positions):
             height = 40 + (x % 30)
-            points = [(x, y), (x - 8, y), (x - 4, y + height), (x + 4, y + height), (x + 8, y)]
-            pygame.draw.polygon(screen, GRAY, points)
-            pygame.draw.polygon(screen, WHITE, points, 1)
+            decoration_cache.draw(screen, ("stalactite", height),
+                                  lambda: self.build_stalactite_sprite(height), [(x, y)], offset)
+    
+    def build_stalactite_sprite(self, height):
+        """Rasterize a stalactite hanging from its anchor point"""
+        stalactite_surface = pygame.Surface((17, height + 1), pygame.SRCALPHA)
+        x, y = 8, 0
+        points = [(x, y), (x - 8, y), (x - 4, y + height), (x + 4, y + height), (x + 8, y)]
+        pygame.draw.polygon(stalactite_surface, GRAY, points)
+        pygame.draw.polygon(stalactite_surface, WHITE, points, 1)
+        return stalactite_surface, (-x, -y)
     
-    def draw_crystal_decorations(self, screen):
+    def draw_crystal_decorations(self, screen, offset=(0, 0)):
         """Draw background crystals"""
         crystal_positions = [(150, 300), (400, 200), (750, 400), (950, 250)]
-        for x, y in crystal_positions:
-            size = 15
-            points = [(x, y), (x + size, y + size), (x, y + size * 2), (x - size, y + size)]
-            pygame.draw.polygon(screen, CRYSTAL_BLUE, points)
-            pygame.draw.polygon(screen, WHITE, points, 2)
+        decoration_cache.draw(screen, ("crystal", 15), lambda: self.build_crystal_sprite(15),
+                              self.tile_positions(crystal_positions), offset)
     
-    def draw_ruin_decorations(self, screen):
+    def build_crystal_sprite(self, size):
+        """Rasterize a background crystal anchored at its top point"""
+        # Leave room for the outline, which is drawn centered on the edges
+        padding = 2
+        crystal_surface = pygame.Surface((size * 2 + padding * 2 + 1, size * 2 + padding * 2 + 1),
+                                         pygame.SRCALPHA)
+        x, y = size + padding, padding
+        points = [(x, y), (x + size, y + size), (x, y + size * 2), (x - size, y + size)]
+        pygame.draw.polygon(crystal_surface, CRYSTAL_BLUE, points)
+        pygame.draw.polygon(crystal_surface, WHITE, points, 2)
+        return crystal_surface, (-x, -y)
+    
+    def draw_ruin_decorations(self, screen, offset=(0, 0)):
         """Draw ancient ruin pillars"""
         pillar_positions = [(100, SCREEN_HEIGHT - 200), (900, SCREEN_HEIGHT - 180)]
-        for x, y in pillar_positions:
-            width, height = 40, 150
-            # Pillar body
-            pillar_rect = pygame.Rect(x, y, width, height)
-            pygame.draw.rect(screen, GRAY, pillar_rect)
-            # Pillar top
-            top_rect = pygame.Rect(x - 5, y - 10, width + 10, 15)
-            pygame.draw.rect(screen, LIGHT_BLUE, top_rect)
-            pygame.draw.rect(screen, WHITE, pillar_rect, 2)
-            pygame.draw.rect(screen, WHITE, top_rect, 2)
-    
-    def draw_platforms(self, screen):
+        decoration_cache.draw(screen, ("pillar", 40, 150), lambda: self.build_pillar_sprite(40, 150),
+                              self.tile_positions(pillar_positions), offset)
+    
+    def build_pillar_sprite(self, width, height):
+        """Rasterize a ruin pillar anchored at the top-left of its body"""
+        pillar_surface = pygame.Surface((width + 10, height + 10), pygame.SRCALPHA)
+        x, y = 5, 10
+        # Pillar body
+        pillar_rect = pygame.Rect(x, y, width, height)
+        pygame.draw.rect(pillar_surface, GRAY, pillar_rect)
+        # Pillar top
+        top_rect = pygame.Rect(x - 5, y - 10, width + 10, 15)
+        pygame.draw.rect(pillar_surface, LIGHT_BLUE, top_rect)
+        pygame.draw.rect(pillar_surface, WHITE, pillar_rect, 2)
+        pygame.draw.rect(pillar_surface, WHITE, top_rect, 2)
+        return pillar_surface, (-x, -y)
+    
+    def draw_platforms(self, screen, offset=(0, 0)):
         """Draw platforms with enhanced graphics"""
         level_num = self.get_level_number()
         platform_color = PLATFORM_COLORS.get(level_num, WHITE)
+        clip = screen.get_clip()
         
         for platform in self.platforms:
+            # Work in the target's coordinates and skip platforms outside it,
+            # allowing for shadows and textures reaching past the rect
+            platform = platform.move(-offset[0], -offset[1])
+            if not clip.colliderect(platform.inflate(PLATFORM_DRAW_MARGIN * 2, PLATFORM_DRAW_MARGIN * 2)):
+                continue
+            
             # Draw platform shadow
             shadow_rect = pygame.Rect(platform.x + SHADOW_OFFSET, 
                                     platform.y + SHADOW_OFFSET,
@@ -289,6 +641,8 @@ class Level:
             pygame.draw.rect(screen, WHITE, platform, BORDER_WIDTH)
             
             # Draw platform texture/pattern
+            if quality.get("decoration_detail") < 2:
+                continue
             if level_num == 1:  # Sky level - cloud pattern
                 for i in range(0, platform.width, 20):
                     pygame.draw.circle(screen, (255, 255, 255, 50), 
@@ -321,11 +675,13 @@ class Level:
         elif "Fortress" in self.name:
             return 4
         return 0
-
+    
     def reset_collectibles(self):
         """Reset all collectibles to their uncollected state"""
         for crystal in self.crystals:
             crystal.collected = False
+        self.crystals_collected = 0
+        self.notify("crystals")
         
         for coin in self.coins:
             coin.collected = False
@@ -337,8 +693,8 @@ class Level:
         """Reset all enemies to their starting positions and states"""
         for enemy in self.enemies:
             enemy.alive = True
-            enemy.x = enemy.start_x
-            enemy.y = enemy.start_y
+            enemy.x = enemy.previous_x = enemy.start_x
+            enemy.y = enemy.previous_y = enemy.start_y
             enemy.vel_y = 0
             enemy.animation_timer = 0
             
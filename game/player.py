@@ -1,11 +1,25 @@
 import pygame
 import math
 from game.constants import *
+from game.sprites import SurfaceCache, sprite_atlas
+from game.quality import quality
+from game.input import InputState
+
+# Steps per cycle of the player's looping animations, used to quantize
+# their visual state for the appearance cache
+FLASH_STEPS = 20  # Invulnerable color cycle
+PULSE_STEPS = 16  # Idle color pulse
+TRAIL_STEPS = 16  # Speed trail wobble
+
+# Rasterized player layers keyed by quantized visual state
+appearance_cache = SurfaceCache(max_entries=256)
 
 class Player:
     def __init__(self, x, y):
         self.x = x
         self.y = y
+        self.previous_x = x  # Position before the last update, for render interpolation
+        self.previous_y = y
         self.width = PLAYER_SIZE
         self.height = PLAYER_SIZE
         self.vel_x = 0
@@ -29,12 +43,21 @@ class Player:
         self.color = BLUE
         self.animation_timer = 0
         
-        # Jump input tracking
-        self.jump_pressed = False
+        # Callbacks notified of player events such as "score" or "lives"
+        self.listeners = []
+        
+        # Headless simulations never touch the mixer
+        self.sound_enabled = True
         
-    def update(self, dt, platforms):
+    def update(self, dt, platform_grid, world_width=SCREEN_WIDTH, controls=None):
         from .effects import effects
         
+        if controls is None:
+            controls = InputState()  # No input this step
+        
+        self.previous_x = self.x
+        self.previous_y = self.y
+        
         # Handle invulnerability
         if self.invulnerable:
             self.invulnerable_timer -= dt
@@ -43,6 +66,7 @@ class Player:
         
         # Handle power-ups
         if self.has_speed_boost:
+            seconds_left = int(self.speed_boost_timer)
             self.speed_boost_timer -= dt
             # Add speed boost particles
             if self.speed_boost_timer > 0:
@@ -52,8 +76,12 @@ class Player:
                 )
             if self.speed_boost_timer <= 0:
                 self.has_speed_boost = False
+                self.notify("powerups")
+            elif int(self.speed_boost_timer) != seconds_left:
+                self.notify("powerup_tick")
         
         if self.has_shield:
+            seconds_left = int(self.shield_timer)
             self.shield_timer -= dt
             # Add shield particles
             if self.shield_timer > 0:
@@ -63,10 +91,11 @@ class Player:
                 )
             if self.shield_timer <= 0:
                 self.has_shield = False
+                self.notify("powerups")
+            elif int(self.shield_timer) != seconds_left:
+                self.notify("powerup_tick")
         
         # Physics
-        keys = pygame.key.get_pressed()
-        
         # Store old values for particle effects
         old_on_ground = self.on_ground
         old_vel_y = self.vel_y
@@ -76,7 +105,7 @@ class Player:
         
         # Horizontal movement
         speed_multiplier = 1.5 if self.has_speed_boost else 1.0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if controls.left:
             self.vel_x = -PLAYER_SPEED * speed_multiplier
             # Add movement dust when on ground
             if self.on_ground or old_on_ground:
@@ -84,7 +113,7 @@ class Player:
                     self.x + self.width // 2, self.y + self.height,
                     (180, 160, 120), direction_x=1
                 )
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        elif controls.right:
             self.vel_x = PLAYER_SPEED * speed_multiplier
             # Add movement dust when on ground
             if self.on_ground or old_on_ground:
@@ -96,10 +125,9 @@ class Player:
             self.vel_x *= 0.8  # Friction
         
         # Jumping
-        if self.jump_pressed:
-            self.jump_pressed = False  # Reset jump press
+        if controls.jump:
             # Check if we're on ground by testing collision before jumping
-            self.check_ground_collision(platforms)
+            self.check_ground_collision(platform_grid)
             if self.on_ground:
                 self.vel_y = -PLAYER_JUMP_SPEED
                 self.on_ground = False
@@ -126,11 +154,11 @@ class Player:
         
         # Update horizontal position and check horizontal collisions
         self.x += self.vel_x * dt
-        self.handle_horizontal_collisions(platforms, old_x)
+        self.handle_horizontal_collisions(platform_grid, old_x)
         
         # Update vertical position and check vertical collisions
         self.y += self.vel_y * dt
-        self.handle_vertical_collisions(platforms, old_y)
+        self.handle_vertical_collisions(platform_grid, old_y)
         
         # Check if we just landed hard
         if not old_on_ground and self.on_ground and old_vel_y > 300:
@@ -142,8 +170,8 @@ class Player:
             if old_vel_y > 600:
                 effects.start_screen_shake(3, 0.2)
         
-        # Keep player on screen horizontally
-        self.x = max(0, min(self.x, SCREEN_WIDTH - self.width))
+        # Keep player inside the level horizontally
+        self.x = max(0, min(self.x, world_width - self.width))
         
         # Check if player fell off the bottom
         if self.y > SCREEN_HEIGHT:
@@ -153,19 +181,19 @@ class Player:
         # Animation
         self.animation_timer += dt
     
-    def check_ground_collision(self, platforms):
+    def check_ground_collision(self, platform_grid):
         """Check if player is currently standing on ground"""
         player_rect = pygame.Rect(self.x, self.y + 1, self.width, self.height)  # Check 1 pixel below
-        for platform in platforms:
+        for platform in platform_grid.query(player_rect):
             if player_rect.colliderect(platform):
                 self.on_ground = True
                 return
     
-    def handle_horizontal_collisions(self, platforms, old_x):
+    def handle_horizontal_collisions(self, platform_grid, old_x):
         """Handle horizontal collisions separately"""
         player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
         
-        for platform in platforms:
+        for platform in platform_grid.query(player_rect):
             if player_rect.colliderect(platform):
                 if self.vel_x > 0:  # Moving right
                     self.x = platform.left - self.width
@@ -173,11 +201,11 @@ class Player:
                     self.x = platform.right
                 self.vel_x = 0
     
-    def handle_vertical_collisions(self, platforms, old_y):
+    def handle_vertical_collisions(self, platform_grid, old_y):
         """Handle vertical collisions separately"""
         player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
         
-        for platform in platforms:
+        for platform in platform_grid.query(player_rect):
             if player_rect.colliderect(platform):
                 if self.vel_y > 0:  # Falling down
                     self.y = platform.top - self.height
@@ -195,6 +223,7 @@ class Player:
         from .effects import effects
         
         self.lives -= 1
+        self.notify("lives")
         self.invulnerable = True
         self.invulnerable_timer = 2.0  # 2 seconds of invulnerability
         
@@ -210,8 +239,8 @@ class Player:
         self.play_sound(DAMAGE_SOUND_FREQ, 200)
     
     def respawn(self):
-        self.x = 50
-        self.y = SCREEN_HEIGHT - 100  # Higher up so player doesn't fall through ground
+        self.x = self.previous_x = 50
+        self.y = self.previous_y = SCREEN_HEIGHT - 100  # Higher up so player doesn't fall through ground
         self.vel_x = 0
         self.vel_y = 0
         self.on_ground = False
@@ -219,10 +248,12 @@ class Player:
     def collect_crystal(self):
         self.crystals_collected += 1
         self.score += 100
+        self.notify("score")
         self.play_sound(COLLECT_SOUND_FREQ, 100)
     
     def collect_coin(self):
         self.score += 10
+        self.notify("score")
         self.play_sound(COLLECT_SOUND_FREQ, 50)
     
     def collect_powerup(self, powerup_type):
@@ -237,8 +268,38 @@ class Player:
         elif powerup_type == "shield":
             self.has_shield = True
             self.shield_timer = POWERUP_DURATION
+        
+        self.notify("powerups")
+    
+    def reset_for_level(self):
+        """Restore full lives and clear all power-ups"""
+        self.lives = MAX_LIVES
+        self.has_double_jump = False
+        self.double_jump_used = False
+        self.has_speed_boost = False
+        self.speed_boost_timer = 0
+        self.has_shield = False
+        self.shield_timer = 0
+        
+        self.notify("lives")
+        self.notify("powerups")
+    
+    def add_listener(self, listener):
+        """Register a callback to be called with the name of each player event"""
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+    
+    def notify(self, event):
+        for listener in self.listeners:
+            listener(event)
     
     def play_sound(self, frequency, duration):
+        if not self.sound_enabled:
+            return
+        
         # Simple tone generation
         try:
             pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
@@ -246,178 +307,231 @@ class Player:
         except:
             pass
     
-    def handle_key_press(self, key):
-        """Handle key press events"""
-        if key in [pygame.K_SPACE, pygame.K_UP, pygame.K_w]:
-            self.jump_pressed = True
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
     
-    def render(self, screen):
-        from .effects import effects
-        import math
-        
-        player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+    def get_render_bounds(self):
+        """World area touched by render, including trail, shield and glow"""
+        return self.get_rect().inflate(100, 70)
+    
+    def render(self, screen, offset=(0, 0)):
+        # Each layer is rasterized once per quantized state and reused
+        t = self.animation_timer
+        x = self.x - offset[0]
+        y = self.y - offset[1]
+        center_x = x + self.width//2
+        center_y = y + self.height//2
         
         # Draw simple shadow without multiple layers to avoid instability
-        shadow_rect = pygame.Rect(self.x + SHADOW_OFFSET, self.y + SHADOW_OFFSET, 
+        shadow_rect = pygame.Rect(x + SHADOW_OFFSET, y + SHADOW_OFFSET, 
                                 self.width, self.height)
         pygame.draw.rect(screen, (20, 20, 30), shadow_rect)
         
-        # Determine player color based on state with enhanced effects
+        # Player color follows the flash cycle when invulnerable, else a slow pulse
         if self.invulnerable:
-            # Enhanced flashing effect with smooth transitions
-            flash_colors = [WHITE, GOLDEN_YELLOW, CYAN, PINK, LIGHT_BLUE]
-            color_index = int(self.animation_timer * 6) % len(flash_colors)
-            blend_factor = (self.animation_timer * 6) % 1
-            current_color = flash_colors[color_index]
-            next_color = flash_colors[(color_index + 1) % len(flash_colors)]
-            
-            # Blend between colors for smooth transition
-            base_color = tuple(
-                int(current_color[i] * (1 - blend_factor) + next_color[i] * blend_factor)
-                for i in range(3)
-            )
-            
-            # Add pulsing glow effect directly
-            glow_radius = self.width + int(math.sin(self.animation_timer * 8) * 8)
-            pygame.draw.circle(screen, base_color, 
-                             (self.x + self.width//2, self.y + self.height//2), glow_radius)
+            color_step = int(t * 6 / 5 * FLASH_STEPS) % FLASH_STEPS
+            self.blit_layer(screen, x, y, ("glow", color_step),
+                            lambda: self.build_glow_layer(color_step))
         else:
-            # Enhanced base color with subtle animation
-            pulse = math.sin(self.animation_timer * 2) * 0.1 + 1
-            base_color = tuple(min(255, max(0, int(c * pulse))) for c in BLUE)
+            color_step = int(t / math.pi * PULSE_STEPS) % PULSE_STEPS
         
         # Enhanced shield effect
         if self.has_shield:
             shield_radius = self.width//2 + 12
-            shield_pulse = math.sin(self.animation_timer * 4) * 3
-            
-            # Multiple shield layers with different effects drawn directly
-            for i in range(4):
-                layer_radius = shield_radius - i * 3 + shield_pulse
-                shield_alpha = 120 - i * 25
-                shield_color = CYAN if i % 2 == 0 else LIGHT_BLUE
-                
-                # Draw shield circle directly
-                pygame.draw.circle(screen, shield_color, 
-                                 (self.x + self.width//2, self.y + self.height//2), 
-                                 layer_radius, 3)
+            shield_pulse = round(math.sin(t * 4) * 3 * 2) / 2  # Half-pixel steps
+            shield_layers = quality.get("shield_layers")
+            self.blit_layer(screen, x, y, ("shield", shield_pulse, shield_layers),
+                            lambda: self.build_shield_layer(shield_pulse, shield_layers))
             
             # Shield sparkles
             for i in range(8):
-                angle = (self.animation_timer * 2 + i * math.pi / 4) % (2 * math.pi)
-                sparkle_x = self.x + self.width//2 + math.cos(angle) * shield_radius
-                sparkle_y = self.y + self.height//2 + math.sin(angle) * shield_radius
-                sparkle_size = 2 + int(math.sin(self.animation_timer * 6 + i) * 1)
-                pygame.draw.circle(screen, WHITE, (int(sparkle_x), int(sparkle_y)), sparkle_size)
+                angle = (t * 2 + i * math.pi / 4) % (2 * math.pi)
+                sparkle_x = center_x + math.cos(angle) * shield_radius
+                sparkle_y = center_y + math.sin(angle) * shield_radius
+                sparkle_size = 2 + int(math.sin(t * 6 + i) * 1)
+                sprite_atlas.blit(screen, "sparkle", "white", sparkle_size,
+                                  int(sparkle_x), int(sparkle_y))
         
         # Enhanced speed trail effect
         if self.has_speed_boost:
-            trail_length = 8
-            for i in range(trail_length):
-                trail_alpha = 200 - (i * 25)
-                if trail_alpha > 0:
-                    trail_offset_x = i * 6 * (-1 if self.vel_x >= 0 else 1)
-                    trail_offset_y = math.sin(self.animation_timer * 8 + i * 0.5) * 2
-                    
-                    # Draw trail rectangle directly
-                    trail_colors = [GOLDEN_YELLOW, ORANGE, RED]
-                    color_index = min(i // 3, len(trail_colors) - 1)
-                    trail_rect = pygame.Rect(self.x + trail_offset_x, self.y + trail_offset_y, 
-                                           self.width, self.height)
-                    pygame.draw.rect(screen, trail_colors[color_index], trail_rect)
-        
-        # Enhanced main player body with stable rendering
-        # Simpler, more stable rendering
-        body_rect = pygame.Rect(self.x, self.y, self.width, self.height)
+            direction = -1 if self.vel_x >= 0 else 1
+            trail_step = int(t / (math.pi / 4) * TRAIL_STEPS) % TRAIL_STEPS
+            trail_length = quality.get("trail_length")
+            self.blit_layer(screen, x, y, ("trail", direction, trail_step, trail_length),
+                            lambda: self.build_trail_layer(direction, trail_step, trail_length))
+        
+        # Main body with face
+        blink = int(t * 2) % 120 < 3  # Occasional blinking
+        expression = "happy" if self.has_speed_boost or self.has_shield else "normal"
+        body_key = ("body", self.invulnerable, color_step, blink, expression)
+        self.blit_layer(screen, x, y, body_key,
+                        lambda: self.build_body_layer(self.invulnerable, color_step,
+                                                      blink, expression))
+        
+        # Enhanced double jump indicator
+        if self.has_double_jump and not self.double_jump_used:
+            indicator_y = y - 15
+            indicator_bounce = math.sin(t * 5) * 3
+            orb_y = int(indicator_y + indicator_bounce)
+            self.blit_layer(screen, x, orb_y, ("indicator",), self.build_indicator_layer)
+            
+            # Sparkles around the orb
+            for i in range(4):
+                angle = t * 3 + i * math.pi / 2
+                sparkle_x = center_x + math.cos(angle) * 8
+                sparkle_y = indicator_y + indicator_bounce + math.sin(angle) * 8
+                sprite_atlas.blit(screen, "sparkle", "white", 1,
+                                  int(sparkle_x), int(sparkle_y))
+    
+    def blit_layer(self, screen, x, y, key, builder):
+        """Blit a cached appearance layer relative to a screen position"""
+        surface, (layer_x, layer_y) = appearance_cache.get(key, builder)
+        screen.blit(surface, (x + layer_x, y + layer_y))
+    
+    def get_base_color(self, invulnerable, color_step):
+        """Body color for a step of the flash cycle or idle pulse"""
+        if invulnerable:
+            # Enhanced flashing effect with smooth transitions
+            flash_colors = [WHITE, GOLDEN_YELLOW, CYAN, PINK, LIGHT_BLUE]
+            phase = color_step * len(flash_colors) / FLASH_STEPS
+            color_index = int(phase)
+            blend_factor = phase % 1
+            current_color = flash_colors[color_index]
+            next_color = flash_colors[(color_index + 1) % len(flash_colors)]
+            
+            # Blend between colors for smooth transition
+            return tuple(
+                int(current_color[i] * (1 - blend_factor) + next_color[i] * blend_factor)
+                for i in range(3)
+            )
+        
+        # Enhanced base color with subtle animation
+        pulse = math.sin(color_step * math.pi / PULSE_STEPS * 2) * 0.1 + 1
+        return tuple(min(255, max(0, int(c * pulse))) for c in BLUE)
+    
+    def build_glow_layer(self, color_step):
+        """Rasterize the pulsing invulnerability glow"""
+        base_color = self.get_base_color(True, color_step)
+        # The glow pulses in step with the flash cycle
+        t = color_step * 5 / 6 / FLASH_STEPS
+        glow_radius = self.width + int(math.sin(t * 8) * 8)
+        
+        surface = pygame.Surface((glow_radius * 2 + 2, glow_radius * 2 + 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, base_color, (glow_radius + 1, glow_radius + 1), glow_radius)
+        return surface, (self.width//2 - glow_radius - 1, self.height//2 - glow_radius - 1)
+    
+    def build_shield_layer(self, shield_pulse, layers):
+        """Rasterize the shield rings"""
+        shield_radius = self.width//2 + 12
+        size = (shield_radius + 5) * 2
+        center = size // 2
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        
+        # Multiple shield layers with different effects
+        for i in range(layers):
+            layer_radius = shield_radius - i * 3 + shield_pulse
+            shield_color = CYAN if i % 2 == 0 else LIGHT_BLUE
+            pygame.draw.circle(surface, shield_color, (center, center), layer_radius, 3)
+        return surface, (self.width//2 - center, self.height//2 - center)
+    
+    def build_trail_layer(self, direction, trail_step, trail_length):
+        """Rasterize the speed boost trail"""
+        t = trail_step * (math.pi / 4) / TRAIL_STEPS
+        spread = trail_length * 6
+        surface = pygame.Surface((self.width + spread * 2, self.height + 4), pygame.SRCALPHA)
+        
+        for i in range(trail_length):
+            trail_alpha = 200 - (i * 25)
+            if trail_alpha > 0:
+                trail_offset_x = i * 6 * direction
+                trail_offset_y = math.sin(t * 8 + i * 0.5) * 2
+                
+                trail_colors = [GOLDEN_YELLOW, ORANGE, RED]
+                color_index = min(i // 3, len(trail_colors) - 1)
+                trail_rect = pygame.Rect(spread + trail_offset_x, 2 + trail_offset_y, 
+                                       self.width, self.height)
+                pygame.draw.rect(surface, trail_colors[color_index], trail_rect)
+        return surface, (-spread, -2)
+    
+    def build_body_layer(self, invulnerable, color_step, blink, expression):
+        """Rasterize the body and face"""
+        base_color = self.get_base_color(invulnerable, color_step)
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        x, y = 0, 0
+        body_rect = pygame.Rect(x, y, self.width, self.height)
         
         # Draw body with simple gradient (top and bottom half only)
         top_color = tuple(int(min(255, c + 40)) for c in base_color)
         bottom_color = tuple(int(max(0, c - 20)) for c in base_color)
         
         # Top half
-        top_rect = pygame.Rect(self.x, self.y, self.width, self.height//2)
-        pygame.draw.rect(screen, top_color, top_rect)
+        top_rect = pygame.Rect(x, y, self.width, self.height//2)
+        pygame.draw.rect(surface, top_color, top_rect)
         
         # Bottom half
-        bottom_rect = pygame.Rect(self.x, self.y + self.height//2, self.width, self.height//2)
-        pygame.draw.rect(screen, bottom_color, bottom_rect)
+        bottom_rect = pygame.Rect(x, y + self.height//2, self.width, self.height//2)
+        pygame.draw.rect(surface, bottom_color, bottom_rect)
         
         # Enhanced border with glow
-        border_color = WHITE
-        if self.invulnerable:
-            border_color = base_color
-        
-        pygame.draw.rect(screen, border_color, body_rect, 3)
+        border_color = base_color if invulnerable else WHITE
+        pygame.draw.rect(surface, border_color, body_rect, 3)
         
         # Add inner highlight
         highlight_rect = pygame.Rect(body_rect.x + 2, body_rect.y + 2, 
                                    body_rect.width - 4, body_rect.height - 4)
         highlight_color = tuple(int(min(255, c + 80)) for c in base_color)
-        pygame.draw.rect(screen, highlight_color, highlight_rect, 1)
+        pygame.draw.rect(surface, highlight_color, highlight_rect, 1)
         
-        # Enhanced face with expressions
         # Eyes with animation
         eye_size = 7
-        blink = int(self.animation_timer * 2) % 120 < 3  # Occasional blinking
-        
-        left_eye_pos = (self.x + 6, self.y + 8)
-        right_eye_pos = (self.x + self.width - 12, self.y + 8)
+        left_eye_pos = (x + 6, y + 8)
+        right_eye_pos = (x + self.width - 12, y + 8)
         
         if not blink:
             # Draw eyes with highlights
-            pygame.draw.circle(screen, WHITE, left_eye_pos, eye_size//2)
-            pygame.draw.circle(screen, WHITE, right_eye_pos, eye_size//2)
+            pygame.draw.circle(surface, WHITE, left_eye_pos, eye_size//2)
+            pygame.draw.circle(surface, WHITE, right_eye_pos, eye_size//2)
             
             # Pupils
-            pupil_color = BLACK if not self.invulnerable else base_color
-            pygame.draw.circle(screen, pupil_color, left_eye_pos, eye_size//4)
-            pygame.draw.circle(screen, pupil_color, right_eye_pos, eye_size//4)
+            pupil_color = base_color if invulnerable else BLACK
+            pygame.draw.circle(surface, pupil_color, left_eye_pos, eye_size//4)
+            pygame.draw.circle(surface, pupil_color, right_eye_pos, eye_size//4)
             
             # Eye highlights
             highlight_offset = 1
-            pygame.draw.circle(screen, WHITE, 
+            pygame.draw.circle(surface, WHITE, 
                              (left_eye_pos[0] - highlight_offset, left_eye_pos[1] - highlight_offset), 1)
-            pygame.draw.circle(screen, WHITE, 
+            pygame.draw.circle(surface, WHITE, 
                              (right_eye_pos[0] - highlight_offset, right_eye_pos[1] - highlight_offset), 1)
         else:
             # Closed eyes
-            pygame.draw.line(screen, WHITE, 
+            pygame.draw.line(surface, WHITE, 
                            (left_eye_pos[0] - 3, left_eye_pos[1]), 
                            (left_eye_pos[0] + 3, left_eye_pos[1]), 2)
-            pygame.draw.line(screen, WHITE, 
+            pygame.draw.line(surface, WHITE, 
                            (right_eye_pos[0] - 3, right_eye_pos[1]), 
                            (right_eye_pos[0] + 3, right_eye_pos[1]), 2)
         
         # Enhanced mouth with expressions
-        mouth_center = (self.x + self.width//2, self.y + self.height - 8)
+        mouth_center = (x + self.width//2, y + self.height - 8)
         
-        if self.has_speed_boost or self.has_shield:
-            # Happy expression
+        if expression == "happy":
             mouth_rect = pygame.Rect(mouth_center[0] - 8, mouth_center[1] - 4, 16, 8)
-            pygame.draw.arc(screen, WHITE, mouth_rect, 0, math.pi, 3)
+            pygame.draw.arc(surface, WHITE, mouth_rect, 0, math.pi, 3)
         else:
-            # Normal expression
             mouth_rect = pygame.Rect(mouth_center[0] - 6, mouth_center[1] - 3, 12, 6)
-            pygame.draw.arc(screen, WHITE, mouth_rect, 0, math.pi, 2)
-        
-        # Enhanced double jump indicator
-        if self.has_double_jump and not self.double_jump_used:
-            indicator_y = self.y - 15
-            indicator_bounce = math.sin(self.animation_timer * 5) * 3
-            
-            # Draw glowing orb directly
-            pygame.draw.circle(screen, GREEN, 
-                             (self.x + self.width//2, int(indicator_y + indicator_bounce)), 10)
-            
-            # Inner orb
-            pygame.draw.circle(screen, GREEN, 
-                             (self.x + self.width//2, int(indicator_y + indicator_bounce)), 4)
-            pygame.draw.circle(screen, WHITE, 
-                             (self.x + self.width//2, int(indicator_y + indicator_bounce)), 4, 2)
-            
-            # Sparkles around the orb
-            for i in range(4):
-                angle = self.animation_timer * 3 + i * math.pi / 2
-                sparkle_x = self.x + self.width//2 + math.cos(angle) * 8
-                sparkle_y = indicator_y + indicator_bounce + math.sin(angle) * 8
-                pygame.draw.circle(screen, WHITE, (int(sparkle_x), int(sparkle_y)), 1)
+            pygame.draw.arc(surface, WHITE, mouth_rect, 0, math.pi, 2)
+        return surface, (0, 0)
+    
+    def build_indicator_layer(self):
+        """Rasterize the double jump orb, centered above the player"""
+        surface = pygame.Surface((22, 22), pygame.SRCALPHA)
+        center = (11, 11)
+        
+        # Glowing orb
+        pygame.draw.circle(surface, GREEN, center, 10)
+        
+        # Inner orb
+        pygame.draw.circle(surface, GREEN, center, 4)
+        pygame.draw.circle(surface, WHITE, center, 4, 2)
+        return surface, (self.width//2 - 11, -11)
@@ -0,0 +1,101 @@
+# Adaptive Quality for Crystal Quest
+from collections import deque
+from .constants import *
+
+# Detail settings per quality tier, from cheapest to richest
+QUALITY_TIERS = {
+    "low": {
+        "particle_scale": 0.3,  # Fraction of requested particles actually spawned
+        "decoration_detail": 0,  # 0: plain platforms, 1: + decorations, 2: + textures
+        "shield_layers": 1,
+        "trail_length": 3,
+        "menu_glow_layers": 1,
+    },
+    "medium": {
+        "particle_scale": 0.6,
+        "decoration_detail": 1,
+        "shield_layers": 2,
+        "trail_length": 5,
+        "menu_glow_layers": 3,
+    },
+    "high": {
+        "particle_scale": 1.0,
+        "decoration_detail": 2,
+        "shield_layers": 4,
+        "trail_length": 8,
+        "menu_glow_layers": 5,
+    },
+}
+QUALITY_TIER_NAMES = ("low", "medium", "high")
+
+QUALITY_WINDOW = 60  # Frames averaged before deciding to change tier
+QUALITY_DOWNGRADE_RATIO = 0.9  # Drop a tier above this fraction of the frame budget
+QUALITY_UPGRADE_RATIO = 0.5  # Raise a tier below this fraction of the frame budget
+
+class QualityGovernor:
+    """Picks a quality tier from a rolling average of measured frame times"""
+    def __init__(self, tier="high", adaptive=True, budget_ms=1000 / FPS):
+        self.tier = tier
+        self.adaptive = adaptive
+        self.budget_ms = budget_ms
+        self.frame_times = deque(maxlen=QUALITY_WINDOW)
+        self.total_ms = 0.0
+        self.changes = 0  # Bumped on every tier change so caches can notice
+    
+    @property
+    def average_frame_ms(self):
+        if not self.frame_times:
+            return 0.0
+        return self.total_ms / len(self.frame_times)
+    
+    def get(self, setting):
+        """Current value of a tier setting"""
+        return QUALITY_TIERS[self.tier][setting]
+    
+    def scale_count(self, count):
+        """Scale a particle count for the current tier, keeping at least one"""
+        if count <= 0:
+            return 0
+        return max(1, round(count * self.get("particle_scale")))
+    
+    def set_tier(self, tier, adaptive=False):
+        """Choose a tier by name, optionally turning adaptation off"""
+        if tier not in QUALITY_TIERS:
+            raise ValueError(f"Unknown quality tier: {tier}")
+        self.adaptive = adaptive
+        if tier != self.tier:
+            self.tier = tier
+            self.changes += 1
+        self.reset_window()
+    
+    def reset_window(self):
+        self.frame_times.clear()
+        self.total_ms = 0.0
+    
+    def record_frame(self, frame_ms):
+        """Add the time spent on one frame's work, adapting the tier if needed"""
+        if len(self.frame_times) == self.frame_times.maxlen:
+            self.total_ms -= self.frame_times[0]
+        self.frame_times.append(frame_ms)
+        self.total_ms += frame_ms
+        
+        # Wait for a full window, which also spaces tier changes apart
+        if not self.adaptive or len(self.frame_times) < QUALITY_WINDOW:
+            return
+        
+        average = self.average_frame_ms
+        if average > self.budget_ms * QUALITY_DOWNGRADE_RATIO:
+            self.step(-1)
+        elif average < self.budget_ms * QUALITY_UPGRADE_RATIO:
+            self.step(1)
+    
+    def step(self, direction):
+        """Move one tier down (-1) or up (1) if there is one"""
+        index = QUALITY_TIER_NAMES.index(self.tier) + direction
+        if 0 <= index < len(QUALITY_TIER_NAMES):
+            self.tier = QUALITY_TIER_NAMES[index]
+            self.changes += 1
+            self.reset_window()
+
+# Global quality governor instance
+quality = QualityGovernor()
@@ -0,0 +1,31 @@
+# Random Number Streams for Crystal Quest
+import random
+from .constants import *
+
+class RandomStreams:
+    """Separate random generators per subsystem, all derived from one session seed.
+    
+    Cosmetic randomness never shifts gameplay randomness, and a run with the
+    same seed and inputs replays exactly. Decoration layouts are not drawn
+    from a stream: they use LAYOUT_SEED so they look the same in every session.
+    """
+    NAMES = ("effects", "gameplay")
+    
+    def __init__(self, seed=RANDOM_SEED):
+        self.effects = random.Random()  # Particles and screen shake
+        # Reserved for anything random that changes the simulation. Nothing
+        # draws from it yet: enemies, spawns and physics are all deterministic.
+        self.gameplay = random.Random()
+        self.seed = None
+        self.reseed(seed)
+    
+    def reseed(self, seed=None):
+        """Restart every stream from a session seed, or from a fresh one if None"""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        for name in self.NAMES:
+            getattr(self, name).seed(f"{seed}:{name}")
+
+# Global random streams instance
+streams = RandomStreams()
@@ -0,0 +1,40 @@
+# Spatial Index for Crystal Quest
+from .constants import *
+
+class SpatialGrid:
+    """Uniform grid over static rects for finding the few a query can touch.
+    
+    Each cell lists the indices of the rects overlapping it. The grid is built
+    once, so it must be rebuilt if the rects are moved, added or removed.
+    """
+    def __init__(self, rects, cell_size=SPATIAL_CELL_SIZE):
+        self.rects = list(rects)
+        self.cell_size = cell_size
+        self.cells = {}  # (column, row) -> rect indices in insertion order
+        for index, rect in enumerate(self.rects):
+            for cell in self.get_cells(rect):
+                self.cells.setdefault(cell, []).append(index)
+    
+    def get_cells(self, rect):
+        """Grid cells overlapped by a rect"""
+        size = self.cell_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield column, row
+    
+    def query(self, rect):
+        """Rects that may overlap rect, in insertion order.
+        
+        Candidates share a cell with rect but still need an exact test.
+        """
+        found = [self.cells[cell] for cell in self.get_cells(rect) if cell in self.cells]
+        if not found:
+            return []
+        if len(found) == 1:
+            indices = found[0]
+        else:
+            indices = sorted(set().union(*found))
+        return [self.rects[index] for index in indices]
+    
+    def __len__(self):
+        return len(self.rects)
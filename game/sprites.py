@@ -0,0 +1,571 @@
+# Sprite Atlas for Crystal Quest
+import pygame
+import math
+from collections import OrderedDict
+from .constants import *
+
+class AtlasFrame:
+    """Location of one rasterized animation frame inside an atlas page"""
+    def __init__(self, page, area, offset):
+        self.page = page
+        self.area = area
+        self.offset = offset  # From the entity's origin to the frame's top-left
+
+class SpriteAtlas:
+    """Rasterizes animation frames once and packs them into shared pages.
+    
+    Frames are keyed by (sprite type, animation state, frame index). Each
+    sprite type registers a builder, and all of its frames are rasterized
+    the first time any of them is looked up.
+    """
+    def __init__(self, page_size=(1024, 1024), padding=1):
+        self.page_size = page_size
+        self.padding = padding
+        self.builders = {}
+        self.frames = {}
+        self.pages = []
+        
+        # Shelf packer state for the current page
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+    
+    def register(self, sprite_type, builder, states):
+        """Register a sprite type.
+        
+        builder(state, frame) returns (surface, offset) for one frame, and
+        states maps each animation state to its number of frames.
+        """
+        self.builders[sprite_type] = (builder, states)
+    
+    def build(self, sprite_type):
+        """Rasterize and pack every frame of a sprite type"""
+        builder, states = self.builders[sprite_type]
+        for state, frame_count in states.items():
+            for frame in range(frame_count):
+                surface, offset = builder(state, frame)
+                page, area = self.pack(surface)
+                self.frames[(sprite_type, state, frame)] = AtlasFrame(page, area, offset)
+    
+    def get(self, sprite_type, state, frame):
+        """Look up a frame, rasterizing its sprite type on first use"""
+        key = (sprite_type, state, frame)
+        atlas_frame = self.frames.get(key)
+        if atlas_frame is None:
+            self.build(sprite_type)
+            atlas_frame = self.frames[key]
+        return atlas_frame
+    
+    def blit(self, screen, sprite_type, state, frame, x, y):
+        """Draw a frame with the entity's origin at (x, y)"""
+        atlas_frame = self.get(sprite_type, state, frame)
+        offset_x, offset_y = atlas_frame.offset
+        return screen.blit(atlas_frame.page, (x + offset_x, y + offset_y), atlas_frame.area)
+    
+    def new_page(self, size):
+        """Start a new transparent page"""
+        page = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        return page
+    
+    def pack(self, surface):
+        """Copy a frame into the atlas, returning its page and area"""
+        width, height = surface.get_size()
+        page_width, page_height = self.page_size
+        
+        # Frames bigger than a page get a page to themselves
+        if width > page_width or height > page_height:
+            page = self.new_page((width, height))
+            page.blit(surface, (0, 0))
+            return page, pygame.Rect(0, 0, width, height)
+        
+        if not self.pages:
+            self.new_page(self.page_size)
+        
+        # Move to the next shelf, or the next page, when this one is full
+        if self.shelf_x + width > page_width:
+            self.shelf_x = 0
+            self.shelf_y += self.shelf_height + self.padding
+            self.shelf_height = 0
+        if self.shelf_y + height > page_height:
+            self.new_page(self.page_size)
+            self.shelf_x = 0
+            self.shelf_y = 0
+            self.shelf_height = 0
+        
+        page = self.pages[-1]
+        area = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        page.blit(surface, area)
+        
+        self.shelf_x += width + self.padding
+        self.shelf_height = max(self.shelf_height, height)
+        return page, area
+    
+    def clear(self):
+        """Drop all pages and frames (e.g. after the display format changes)"""
+        self.frames.clear()
+        self.pages.clear()
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+
+class SurfaceCache:
+    """Bounded cache of rendered surfaces with least-recently-used eviction"""
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key, builder):
+        """Get the entry for key, calling builder() to create it on a miss"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        
+        self.misses += 1
+        entry = builder()
+        self.entries[key] = entry
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+    
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class TextCache(SurfaceCache):
+    """Cache of rendered text keyed by font, text, antialias and color"""
+    def render(self, font, text, antialias, color):
+        """Render text through the cache. The result is shared, so copy it before modifying"""
+        key = (font, text, antialias, tuple(color))
+        return self.get(key, lambda: font.render(text, antialias, color))
+
+
+def render_pulsing_text(font, text, color):
+    """Render text whose color changes every frame.
+    
+    Those colors never repeat, so caching them would only flush the stable
+    entries out of text_cache.
+    """
+    return font.render(text, True, color)
+
+
+def new_frame_surface(width, height):
+    """Create a transparent surface to rasterize a frame into"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 0))
+    return surface
+
+
+# Enemy frames
+
+ENEMY_COLORS = {
+    "walker": RED,
+    "jumper": ORANGE,
+    "flyer": PURPLE
+}
+
+# Room around the body for legs, springs, wings and the shadow
+ENEMY_PADDING_X = 12
+ENEMY_PADDING_Y = 14
+
+# Frame counts per enemy type
+WALKER_LEG_FRAMES = 5  # Leg offsets -2..2
+JUMPER_SPRING_FRAMES = 9  # Spring heights 0..8
+FLYER_WING_FRAMES = 7  # Wing flaps -3..3
+
+def build_enemy_frame(enemy_type, blink, leg_offset=0, spring_height=8, wing_flap=0):
+    """Rasterize one enemy frame"""
+    width = height = ENEMY_SIZE
+    surface = new_frame_surface(width + ENEMY_PADDING_X * 2, height + ENEMY_PADDING_Y * 2)
+    x, y = ENEMY_PADDING_X, ENEMY_PADDING_Y
+    color = ENEMY_COLORS[enemy_type]
+    
+    # Draw shadow directly without surface
+    shadow_rect = pygame.Rect(x + SHADOW_OFFSET, y + SHADOW_OFFSET, width, height)
+    pygame.draw.rect(surface, (20, 20, 20), shadow_rect)
+    
+    # Draw enemy body with gradient
+    enemy_rect = pygame.Rect(x, y, width, height)
+    
+    # Create gradient effect
+    top_color = tuple(int(min(255, c + 30)) for c in color)
+    bottom_color = tuple(int(max(0, c - 30)) for c in color)
+    
+    # Top half
+    top_rect = pygame.Rect(x, y, width, height//2)
+    pygame.draw.rect(surface, top_color, top_rect)
+    
+    # Bottom half
+    bottom_rect = pygame.Rect(x, y + height//2, width, height//2)
+    pygame.draw.rect(surface, bottom_color, bottom_rect)
+    
+    # Border
+    pygame.draw.rect(surface, WHITE, enemy_rect, 2)
+    
+    # Draw type-specific features
+    if enemy_type == "walker":
+        # Draw legs
+        leg_width = 4
+        leg_height = 8
+        left_leg = pygame.Rect(x + 4, y + height + leg_offset, leg_width, leg_height)
+        right_leg = pygame.Rect(x + width - 8, y + height - leg_offset, leg_width, leg_height)
+        pygame.draw.rect(surface, color, left_leg)
+        pygame.draw.rect(surface, color, right_leg)
+        pygame.draw.rect(surface, WHITE, left_leg, 1)
+        pygame.draw.rect(surface, WHITE, right_leg, 1)
+    
+    elif enemy_type == "jumper":
+        # Draw spring
+        spring_points = []
+        for i in range(6):
+            point_x = x + (i * width // 5)
+            point_y = y + height + (spring_height if i % 2 else 0)
+            spring_points.append((point_x, point_y))
+        pygame.draw.lines(surface, WHITE, False, spring_points, 3)
+        pygame.draw.lines(surface, color, False, spring_points, 1)
+    
+    elif enemy_type == "flyer":
+        # Draw wings
+        wing_size = 8
+        
+        # Left wing
+        left_wing = [(x - wing_size, y + wing_size + wing_flap),
+                     (x, y + 4),
+                     (x, y + wing_size + 2)]
+        pygame.draw.polygon(surface, LIGHT_BLUE, left_wing)
+        pygame.draw.polygon(surface, WHITE, left_wing, 2)
+        
+        # Right wing
+        right_wing = [(x + width, y + 4),
+                      (x + width + wing_size, y + wing_size + wing_flap),
+                      (x + width, y + wing_size + 2)]
+        pygame.draw.polygon(surface, LIGHT_BLUE, right_wing)
+        pygame.draw.polygon(surface, WHITE, right_wing, 2)
+    
+    # Draw eyes
+    eye_size = 4
+    if not blink:
+        left_eye_pos = (x + 6, y + 6)
+        right_eye_pos = (x + width - 10, y + 6)
+        
+        pygame.draw.circle(surface, WHITE, left_eye_pos, eye_size//2)
+        pygame.draw.circle(surface, WHITE, right_eye_pos, eye_size//2)
+        pygame.draw.circle(surface, RED, left_eye_pos, eye_size//4)
+        pygame.draw.circle(surface, RED, right_eye_pos, eye_size//4)
+    else:
+        # Draw closed eyes (lines)
+        pygame.draw.line(surface, WHITE, (x + 4, y + 6), (x + 8, y + 6), 2)
+        pygame.draw.line(surface, WHITE, (x + width - 12, y + 6), (x + width - 8, y + 6), 2)
+    
+    return surface, (-ENEMY_PADDING_X, -ENEMY_PADDING_Y)
+
+def build_walker_frame(state, frame):
+    return build_enemy_frame("walker", state == "blink", leg_offset=frame - 2)
+
+def build_jumper_frame(state, frame):
+    return build_enemy_frame("jumper", state == "blink", spring_height=frame)
+
+def build_flyer_frame(state, frame):
+    return build_enemy_frame("flyer", state == "blink", wing_flap=frame - 3)
+
+
+# Crystal frames
+
+CRYSTAL_PADDING = 16
+CRYSTAL_GLOW_FRAMES = 9  # Glow radius offsets -4..4
+
+def build_crystal_frame(state, frame):
+    """Rasterize a crystal with the glow radius for the given frame"""
+    width = height = CRYSTAL_SIZE
+    surface = new_frame_surface(width + CRYSTAL_PADDING * 2, height + CRYSTAL_PADDING * 2)
+    x, y = CRYSTAL_PADDING, CRYSTAL_PADDING
+    center_x = x + width // 2
+    center_y = y + height // 2
+    
+    # Draw glow effect
+    glow_radius = width + frame - 4
+    pygame.draw.circle(surface, (50, 150, 200), (center_x, center_y), glow_radius)
+    
+    # Draw crystal shadow
+    shadow_points = [
+        (center_x + SHADOW_OFFSET, y + SHADOW_OFFSET),  # Top
+        (x + width + SHADOW_OFFSET, center_y + SHADOW_OFFSET),  # Right
+        (center_x + SHADOW_OFFSET, y + height + SHADOW_OFFSET),  # Bottom
+        (x + SHADOW_OFFSET, center_y + SHADOW_OFFSET)  # Left
+    ]
+    pygame.draw.polygon(surface, (20, 20, 20), shadow_points)
+    
+    # Draw main crystal diamond
+    points = [
+        (center_x, y),  # Top
+        (x + width, center_y),  # Right
+        (center_x, y + height),  # Bottom
+        (x, center_y)  # Left
+    ]
+    pygame.draw.polygon(surface, CYAN, points)
+    
+    # Draw inner diamond (lighter)
+    inner_size = 0.6
+    inner_points = [
+        (center_x, y + height * (1 - inner_size) / 2),
+        (x + width * (1 + inner_size) / 2, center_y),
+        (center_x, y + height * (1 + inner_size) / 2),
+        (x + width * (1 - inner_size) / 2, center_y)
+    ]
+    pygame.draw.polygon(surface, CRYSTAL_BLUE, inner_points)
+    
+    # Draw highlight
+    highlight_points = [
+        (center_x, y + 2),
+        (x + width - 2, center_y),
+        (center_x, y + 4),
+        (x + 2, center_y)
+    ]
+    pygame.draw.polygon(surface, WHITE, highlight_points)
+    
+    # Draw border
+    pygame.draw.polygon(surface, WHITE, points, 2)
+    
+    return surface, (-CRYSTAL_PADDING, -CRYSTAL_PADDING)
+
+
+# Coin frames
+
+COIN_PADDING = 3
+
+def build_coin_frame(size, frame):
+    """Rasterize a coin of the given size at one step of its half turn"""
+    width = height = size
+    surface = new_frame_surface(width + COIN_PADDING * 2, height + COIN_PADDING * 2)
+    x, y = COIN_PADDING, COIN_PADDING
+    center_x = x + width // 2
+    center_y = y + height // 2
+    
+    # A coin looks the same every half turn, so frames cover 0-180 degrees
+    rotation = frame * 180 / COIN_ROTATION_FRAMES
+    width_factor = abs(math.cos(math.radians(rotation)))
+    coin_width = max(3, int(width * width_factor))
+    
+    # Draw shadow that rotates with the coin
+    shadow_center_x = center_x + SHADOW_OFFSET
+    shadow_center_y = center_y + SHADOW_OFFSET
+    shadow_rect = pygame.Rect(shadow_center_x - coin_width//2, shadow_center_y - height//2,
+                              coin_width, height)
+    pygame.draw.ellipse(surface, (20, 20, 20), shadow_rect)
+    
+    # Draw outer ring (bronze/copper color)
+    outer_rect = pygame.Rect(center_x - coin_width//2, y, coin_width, height)
+    pygame.draw.ellipse(surface, BRONZE, outer_rect)
+    
+    # Draw inner coin (gold)
+    inner_width = max(2, coin_width - 4)
+    inner_height = height - 4
+    inner_rect = pygame.Rect(center_x - inner_width//2, y + 2, inner_width, inner_height)
+    pygame.draw.ellipse(surface, GOLDEN_YELLOW, inner_rect)
+    
+    # Draw highlight when coin is facing forward
+    if width_factor > 0.7:
+        highlight_width = max(1, inner_width - 4)
+        highlight_height = inner_height - 4
+        highlight_rect = pygame.Rect(center_x - highlight_width//2, y + 4,
+                                     highlight_width, highlight_height)
+        pygame.draw.ellipse(surface, WHITE, highlight_rect)
+    
+    # Draw border
+    pygame.draw.ellipse(surface, WHITE, outer_rect, 2)
+    
+    # Draw coin value symbol ($) when facing forward
+    if width_factor > 0.8:
+        symbol_x = center_x
+        symbol_y = center_y
+        pygame.draw.line(surface, BRONZE,
+                         (symbol_x, symbol_y - 4), (symbol_x, symbol_y + 4), 2)
+        pygame.draw.arc(surface, BRONZE,
+                        pygame.Rect(symbol_x - 3, symbol_y - 3, 6, 3),
+                        0, math.pi, 2)
+        pygame.draw.arc(surface, BRONZE,
+                        pygame.Rect(symbol_x - 3, symbol_y, 6, 3),
+                        math.pi, 2 * math.pi, 2)
+    
+    return surface, (-COIN_PADDING, -COIN_PADDING)
+
+def coin_sprite_type(size):
+    """Atlas sprite type for coins of a given size, registered on first use"""
+    sprite_type = "coin_%d" % size
+    if sprite_type not in sprite_atlas.builders:
+        sprite_atlas.register(sprite_type,
+                              lambda state, frame: build_coin_frame(size, frame),
+                              {"spin": COIN_ROTATION_FRAMES})
+    return sprite_type
+
+
+# Power-up frames
+
+POWERUP_COLORS = {
+    "double_jump": GREEN,
+    "speed_boost": YELLOW,
+    "shield": CYAN
+}
+
+POWERUP_PADDING = 6
+POWERUP_MIN_SIZE = int(POWERUP_SIZE * 0.7)
+POWERUP_BODY_FRAMES = int(POWERUP_SIZE * 1.3) - POWERUP_MIN_SIZE + 1
+POWERUP_MIN_GLOW = int(POWERUP_SIZE * 0.5)
+POWERUP_GLOW_FRAMES = int(POWERUP_SIZE * 1.5) - POWERUP_MIN_GLOW + 1
+
+def build_powerup_glow(powerup_type, radius):
+    """Rasterize a power-up's glow circle, centered on the power-up"""
+    glow_color = tuple(int(min(255, c + 50)) for c in POWERUP_COLORS[powerup_type])
+    surface = new_frame_surface(radius * 2 + 2, radius * 2 + 2)
+    pygame.draw.circle(surface, glow_color, (radius + 1, radius + 1), radius)
+    offset = POWERUP_SIZE // 2 - radius - 1
+    return surface, (offset, offset)
+
+def build_powerup_body(powerup_type, size):
+    """Rasterize a power-up's body and symbol at the given pulse size"""
+    color = POWERUP_COLORS[powerup_type]
+    surface = new_frame_surface(POWERUP_SIZE + POWERUP_PADDING * 2,
+                                POWERUP_SIZE + POWERUP_PADDING * 2)
+    x, y = POWERUP_PADDING, POWERUP_PADDING
+    offset = (POWERUP_SIZE - size) // 2
+    
+    # Draw shadow directly
+    shadow_rect = pygame.Rect(x + offset + SHADOW_OFFSET,
+                              y + offset + SHADOW_OFFSET, size, size)
+    pygame.draw.rect(surface, (20, 20, 20), shadow_rect)
+    
+    # Draw main powerup body with gradient
+    powerup_rect = pygame.Rect(x + offset, y + offset, size, size)
+    
+    # Gradient effect
+    top_color = tuple(int(min(255, c + 40)) for c in color)
+    bottom_color = tuple(int(max(0, c - 20)) for c in color)
+    
+    # Top half
+    top_rect = pygame.Rect(x + offset, y + offset, size, size//2)
+    pygame.draw.rect(surface, top_color, top_rect)
+    
+    # Bottom half
+    bottom_rect = pygame.Rect(x + offset, y + offset + size//2, size, size//2)
+    pygame.draw.rect(surface, bottom_color, bottom_rect)
+    
+    # Draw border
+    pygame.draw.rect(surface, WHITE, powerup_rect, 3)
+    
+    # Draw inner border
+    inner_rect = pygame.Rect(x + offset + 3, y + offset + 3, size - 6, size - 6)
+    pygame.draw.rect(surface, tuple(int(max(0, c - 30)) for c in color), inner_rect, 1)
+    
+    # Draw symbols with better graphics
+    symbol_center_x = x + POWERUP_SIZE // 2
+    symbol_center_y = y + POWERUP_SIZE // 2
+    symbol_size = size // 3
+    
+    if powerup_type == "double_jump":
+        # Draw stylized up arrows with trails
+        arrow_width = symbol_size
+        arrow_height = symbol_size // 2
+        
+        # First arrow (higher)
+        arrow1_points = [
+            (symbol_center_x, symbol_center_y - arrow_height),
+            (symbol_center_x - arrow_width//2, symbol_center_y - arrow_height//2),
+            (symbol_center_x + arrow_width//2, symbol_center_y - arrow_height//2)
+        ]
+        pygame.draw.polygon(surface, WHITE, arrow1_points)
+        
+        # Second arrow (lower)
+        arrow2_points = [
+            (symbol_center_x, symbol_center_y),
+            (symbol_center_x - arrow_width//2, symbol_center_y + arrow_height//2),
+            (symbol_center_x + arrow_width//2, symbol_center_y + arrow_height//2)
+        ]
+        pygame.draw.polygon(surface, WHITE, arrow2_points)
+    
+    elif powerup_type == "speed_boost":
+        # Draw lightning bolt
+        lightning_points = [
+            (symbol_center_x - symbol_size//2, symbol_center_y - symbol_size//2),
+            (symbol_center_x, symbol_center_y - symbol_size//4),
+            (symbol_center_x - symbol_size//4, symbol_center_y),
+            (symbol_center_x + symbol_size//2, symbol_center_y + symbol_size//2),
+            (symbol_center_x, symbol_center_y + symbol_size//4),
+            (symbol_center_x + symbol_size//4, symbol_center_y)
+        ]
+        pygame.draw.polygon(surface, WHITE, lightning_points)
+        pygame.draw.polygon(surface, YELLOW, lightning_points, 2)
+    
+    elif powerup_type == "shield":
+        # Draw shield with cross pattern
+        shield_points = [
+            (symbol_center_x, symbol_center_y - symbol_size//2),
+            (symbol_center_x - symbol_size//3, symbol_center_y - symbol_size//4),
+            (symbol_center_x - symbol_size//3, symbol_center_y + symbol_size//4),
+            (symbol_center_x, symbol_center_y + symbol_size//2),
+            (symbol_center_x + symbol_size//3, symbol_center_y + symbol_size//4),
+            (symbol_center_x + symbol_size//3, symbol_center_y - symbol_size//4)
+        ]
+        pygame.draw.polygon(surface, WHITE, shield_points)
+        
+        # Draw cross on shield
+        cross_size = symbol_size // 4
+        pygame.draw.line(surface, CYAN,
+                         (symbol_center_x - cross_size, symbol_center_y),
+                         (symbol_center_x + cross_size, symbol_center_y), 3)
+        pygame.draw.line(surface, CYAN,
+                         (symbol_center_x, symbol_center_y - cross_size),
+                         (symbol_center_x, symbol_center_y + cross_size), 3)
+    
+    return surface, (-POWERUP_PADDING, -POWERUP_PADDING)
+
+def make_powerup_builder(powerup_type):
+    """Create the frame builder for one power-up type"""
+    def build_powerup_frame(state, frame):
+        if state == "glow":
+            return build_powerup_glow(powerup_type, POWERUP_MIN_GLOW + frame)
+        return build_powerup_body(powerup_type, POWERUP_MIN_SIZE + frame)
+    return build_powerup_frame
+
+
+# Sparkle frames (small white dots orbiting collectibles)
+
+SPARKLE_FRAMES = 4  # Radii 0..3
+
+def build_sparkle_frame(state, frame):
+    """Rasterize a sparkle of the given radius, centered on its origin"""
+    surface = new_frame_surface(frame * 2 + 2, frame * 2 + 2)
+    pygame.draw.circle(surface, WHITE, (frame + 1, frame + 1), frame)
+    return surface, (-frame - 1, -frame - 1)
+
+
+# Global atlas instance
+sprite_atlas = SpriteAtlas()
+
+sprite_atlas.register("enemy_walker", build_walker_frame,
+                      {"open": WALKER_LEG_FRAMES, "blink": WALKER_LEG_FRAMES})
+sprite_atlas.register("enemy_jumper", build_jumper_frame,
+                      {"open": JUMPER_SPRING_FRAMES, "blink": JUMPER_SPRING_FRAMES})
+sprite_atlas.register("enemy_flyer", build_flyer_frame,
+                      {"open": FLYER_WING_FRAMES, "blink": FLYER_WING_FRAMES})
+sprite_atlas.register("crystal", build_crystal_frame, {"glow": CRYSTAL_GLOW_FRAMES})
+for powerup_type in POWERUP_COLORS:
+    sprite_atlas.register("powerup_" + powerup_type, make_powerup_builder(powerup_type),
+                          {"glow": POWERUP_GLOW_FRAMES, "body": POWERUP_BODY_FRAMES})
+sprite_atlas.register("sparkle", build_sparkle_frame, {"white": SPARKLE_FRAMES})
+
+# Global text cache shared by the HUD, menus and animated text
+text_cache = TextCache(max_entries=512)
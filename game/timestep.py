@@ -0,0 +1,33 @@
+# Fixed Timestep for Crystal Quest
+from .constants import *
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed simulation steps.
+    
+    Leftover time carries over to the next frame, and alpha tells the renderer
+    how far the frame is between the last two simulated states. Frames longer
+    than max_frame_time are cut short, so a hitch costs a bounded number of
+    steps at any rate instead of a spiral of catching up.
+    """
+    def __init__(self, rate=SIMULATION_RATE, max_frame_time=MAX_FRAME_TIME):
+        if rate <= 0:
+            raise ValueError(f"Simulation rate must be positive, not {rate}")
+        self.step = 1.0 / rate
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.dropped = 0.0  # Simulation time skipped after hitches
+    
+    def advance(self, frame_time):
+        """Add a frame's duration and return how many steps to simulate"""
+        if frame_time > self.max_frame_time:
+            # Too far behind to catch up: drop the excess instead of spiralling
+            self.dropped += frame_time - self.max_frame_time
+            frame_time = self.max_frame_time
+        
+        steps, self.accumulator = divmod(self.accumulator + frame_time, self.step)
+        return int(steps)
+    
+    @property
+    def alpha(self):
+        """How far the frame lies from the previous toward the current state, from 0 to 1"""
+        return self.accumulator / self.step
@@ -4,14 +4,73 @@ Crystal Quest - A 2D Platformer Game
 A challenging platformer with multiple levels, enemies, collectibles, and power-ups.
 """
 
+import argparse
 import pygame
 import sys
 import json
 from game.game_engine import GameEngine
-from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SIMULATION_RATE
+from game.quality import quality, QUALITY_TIER_NAMES
+from game.timestep import FixedTimestep
+from game.rng import streams
+from game.input import KeyboardInput, InputRecorder
+
+def positive_int(value):
+    """argparse type for options that must be at least 1"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, not {number}")
+    return number
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Crystal Quest - A 2D Platformer Game")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only repaint changed screen areas (saves CPU on software displays)")
+    parser.add_argument("--quality", choices=("auto",) + QUALITY_TIER_NAMES, default="auto",
+                        help="detail level, or 'auto' to adapt it to the measured frame time")
+    parser.add_argument("--tick-rate", type=positive_int, default=SIMULATION_RATE,
+                        help=f"simulation steps per second, independent of the frame rate (default {SIMULATION_RATE})")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate as fast as possible without a window, rendering or sound")
+    parser.add_argument("--steps", type=positive_int, default=10000,
+                        help="simulation steps to run in headless mode (default 10000)")
+    parser.add_argument("--seed", type=int,
+                        help="session seed for all randomness, to replay a run exactly (default: random)")
+    parser.add_argument("--record", metavar="FILE",
+                        help="save the player's input to FILE when the game exits")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="replay input recorded with --record in headless mode")
+    return parser.parse_args()
+
+def run_headless(args):
+    """Run a batch simulation and print its statistics"""
+    from game.headless import run_simulation
+    from game.input import RecordedInput
+    
+    if args.replay:
+        # Recordings carry the seed and tick rate they were made with
+        recording = RecordedInput.load(args.replay)
+        stats = run_simulation(len(recording), recording.tick_rate, seed=recording.seed,
+                               input_source=recording)
+    else:
+        stats = run_simulation(args.steps, args.tick_rate, seed=args.seed)
+    for name, value in stats.items():
+        if isinstance(value, float):
+            value = f"{value:.2f}"
+        print(f"{name}: {value}")
 
 def main():
     """Main game entry point"""
+    args = parse_args()
+    if args.quality != "auto":
+        quality.set_tier(args.quality)
+    streams.reseed(args.seed)
+    
+    if args.headless or args.replay:
+        run_headless(args)
+        return
+    
     pygame.init()
     pygame.mixer.init()
     
@@ -21,27 +80,39 @@ def main():
     clock = pygame.time.Clock()
     
     # Create game engine
-    game = GameEngine(screen)
+    recorder = InputRecorder(KeyboardInput()) if args.record else None
+    game = GameEngine(screen, dirty_rects=args.dirty_rects, input_source=recorder)
+    timestep = FixedTimestep(args.tick_rate)
     
     # Main game loop
     running = True
-    while running:
-        dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
-        
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if not game.handle_event(event):
-                running = False  # Quit requested from game
-        
-        # Update game
-        if not game.update(dt):
-            running = False
-        
-        # Render game
-        game.render()
-        pygame.display.flip()
+    try:
+        while running:
+            frame_time = clock.tick(FPS) / 1000.0  # Frame time in seconds
+            
+            # Time spent working on the last frame, excluding the tick delay
+            quality.record_frame(clock.get_rawtime())
+            
+            # Handle events
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                if not game.handle_event(event):
+                    running = False  # Quit requested from game
+            
+            # Update game in fixed steps so physics doesn't depend on the frame rate
+            for _ in range(timestep.advance(frame_time)):
+                if not game.update(timestep.step):
+                    running = False
+                    break
+            
+            # Render game between the last two simulated states
+            game.render(timestep.alpha)
+            game.present()
+    finally:
+        # Save even after a crash, so the session can still be replayed
+        if recorder:
+            recorder.save(args.record, streams.seed, args.tick_rate)
     
     pygame.quit()
     sys.exit()
@@ -48,6 +48,9 @@ setup(
             "flake8",
             "pytest",
         ],
+        "fast": [
+            "numpy",
+        ],
     },
     entry_points={
         "console_scripts": [
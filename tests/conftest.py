@@ -0,0 +1,21 @@
+# Test setup for Crystal Quest
+import os
+import sys
+
+# Tests never open a window or an audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the game package importable however pytest is started
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_init():
+    """Fonts and surfaces need pygame initialized, the dummy display backs key state"""
+    pygame.display.init()
+    pygame.font.init()
+    yield
+    pygame.quit()
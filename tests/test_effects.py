@@ -0,0 +1,98 @@
+# Particle budget tests for Crystal Quest
+import pytest
+from game.constants import *
+from game.effects import ParticleSystem, numpy
+
+BACKENDS = ["pool", pytest.param("arrays", marks=pytest.mark.skipif(numpy is None, reason="needs NumPy"))]
+
+def spawn(particles, x, life):
+    particles.add_particle(x, 100, 0, 0, WHITE, life, size=2, gravity=False)
+
+def live_xs(particles):
+    store = particles.particles
+    if hasattr(store, "live"):
+        return [p.x for p in store.live()]
+    return store.x[:store.count].tolist()
+
+def live_lives(particles):
+    store = particles.particles
+    if hasattr(store, "live"):
+        return sorted(round(p.life, 6) for p in store.live())
+    return sorted(round(life, 6) for life in store.life[:store.count].tolist())
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_oldest_eviction_replaces_the_first_spawned(backend):
+    particles = ParticleSystem(capacity=3, eviction="oldest", backend=backend)
+    for x in range(5):
+        spawn(particles, x, 1.0)
+    
+    assert sorted(live_xs(particles)) == [2, 3, 4]
+    assert (particles.spawned, particles.evicted, particles.peak) == (5, 2, 3)
+
+def test_oldest_eviction_keeps_the_pool_in_spawn_order():
+    particles = ParticleSystem(capacity=3, eviction="oldest", backend="pool")
+    for x in range(7):
+        spawn(particles, x, 1.0)
+    assert live_xs(particles) == [4, 5, 6]
+
+@pytest.mark.skipif(numpy is None, reason="needs NumPy")
+def test_oldest_eviction_compacts_the_arrays_in_spawn_order():
+    particles = ParticleSystem(capacity=3, eviction="oldest", backend="arrays")
+    for x, life in enumerate((1.0, 1.0, 1.0, 1.0, 0.25, 1.0, 1.0)):
+        spawn(particles, x, life)
+    
+    # Particle 4 dies; the others come back out of the ring oldest first
+    particles.update(0.5)
+    assert live_xs(particles) == [5, 6]
+    spawn(particles, 7, 1.0)
+    spawn(particles, 8, 1.0)
+    assert live_xs(particles) == [8, 6, 7]
+    
+    # Nothing dies, so the ring keeps turning from where it was
+    particles.update(0.1)
+    spawn(particles, 9, 1.0)
+    assert live_xs(particles) == [8, 9, 7]
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_lowest_life_eviction_replaces_the_closest_to_dying(backend):
+    particles = ParticleSystem(capacity=3, eviction="lowest_life", backend=backend)
+    for x, life in enumerate((3.0, 1.0, 2.0)):
+        spawn(particles, x, life)
+    
+    spawn(particles, 3, 5.0)
+    assert live_lives(particles) == [2.0, 3.0, 5.0]
+    
+    # Lives keep their order as they run down
+    particles.update(0.5)
+    spawn(particles, 4, 0.25)
+    assert live_lives(particles) == [0.25, 2.5, 4.5]
+    spawn(particles, 5, 4.0)
+    assert live_lives(particles) == [2.5, 4.0, 4.5]
+    assert sorted(live_xs(particles)) == [0, 3, 5]
+    assert (particles.spawned, particles.evicted, particles.peak) == (6, 3, 3)
+
+def test_lowest_life_eviction_skips_particles_that_died():
+    particles = ParticleSystem(capacity=4, eviction="lowest_life", backend="pool")
+    for x in range(200):
+        spawn(particles, x, 0.1 + x % 7 * 0.1)
+        particles.update(0.05)
+    
+    # The lookup heap stays bounded and still finds the lowest life
+    assert len(particles.particles.expiry_heap) <= 8
+    lives = live_lives(particles)
+    spawn(particles, 999, 10.0)
+    assert live_lives(particles) == sorted(lives[1:] + [10.0])
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_counters_survive_particles_dying(backend):
+    particles = ParticleSystem(capacity=10, backend=backend)
+    for x in range(6):
+        spawn(particles, x, 0.5)
+    particles.update(1.0)
+    spawn(particles, 0, 0.5)
+    
+    assert len(particles) == 1
+    assert (particles.spawned, particles.evicted, particles.peak) == (7, 0, 6)
+    
+    particles.clear()
+    assert len(particles) == 0
@@ -0,0 +1,28 @@
+# Gradient rendering tests for Crystal Quest
+import pygame
+import pytest
+from game.gradients import GradientEngine
+
+def red_ramp(y, ratio, xp):
+    return 255 * ratio, 0, 0
+
+@pytest.mark.parametrize("depth", [32, 24, 16])
+def test_draw_into_any_pixel_format(depth):
+    engine = GradientEngine()
+    screen = pygame.Surface((40, 100), 0, depth)
+    engine.draw(screen, red_ramp)
+    
+    top = screen.get_at((20, 0))
+    bottom = screen.get_at((20, 99))
+    assert top.r < 10 and bottom.r > 240
+    assert bottom.g == bottom.b == 0
+
+def test_format_change_rebuilds_column():
+    engine = GradientEngine()
+    engine.draw(pygame.Surface((40, 100), 0, 32), red_ramp)
+    
+    # Same size, different format
+    screen = pygame.Surface((40, 100), 0, 16)
+    engine.draw(screen, red_ramp)
+    engine.draw_linear(screen, (0, 0, 0), (0, 0, 255))
+    assert screen.get_at((20, 99)).b > 240
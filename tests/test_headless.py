@@ -0,0 +1,49 @@
+# Headless simulation tests for Crystal Quest
+import pygame
+from game.constants import *
+from game.effects import effects
+from game.game_engine import GameEngine
+from game.headless import run_simulation
+from game.input import InputState, ScriptedInput
+
+TIMING = ("elapsed_seconds", "steps_per_second")
+
+def run_and_right(step):
+    """Run right in bursts, jumping every 45 steps"""
+    return InputState(right=(step // 120) % 4 != 3, left=(step // 120) % 4 == 3, jump=step % 45 == 0)
+
+def simulate(seed, steps=1500, engine=None, controller=None):
+    stats = run_simulation(steps, seed=seed, input_source=ScriptedInput(run_and_right),
+                           engine=engine, controller=controller)
+    for name in TIMING:
+        del stats[name]
+    particles = effects.particle_system.particles.get_dirty_rects()
+    return stats, [tuple(rect) for rect in particles]
+
+def test_same_seed_and_input_give_identical_runs():
+    first = simulate(5)
+    second = simulate(5)
+    assert first == second
+    assert first[0]["seed"] == 5
+    assert first[1], "the run should leave particles to compare"
+
+def test_seed_only_changes_cosmetic_randomness():
+    first_stats, first_particles = simulate(5)
+    second_stats, second_particles = simulate(6)
+    del first_stats["seed"], second_stats["seed"]
+    assert first_stats == second_stats
+    assert first_particles != second_particles
+
+def shake_every_second(engine, step):
+    if step % 60 == 0:
+        effects.start_screen_shake(8, 0.5)
+
+def test_rendering_does_not_change_the_run():
+    def render_unevenly(engine, step):
+        """Render zero to two frames per step, like a display faster or slower than the tick"""
+        shake_every_second(engine, step)
+        for _ in range(step % 3):
+            engine.render()
+    
+    engine = GameEngine(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    assert simulate(5, engine=engine, controller=render_unevenly) == simulate(5, controller=shake_every_second)
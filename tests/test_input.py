@@ -0,0 +1,73 @@
+# Input recording tests for Crystal Quest
+from game.constants import *
+from game.headless import create_headless_engine, run_simulation
+from game.input import InputState, ScriptedInput, InputRecorder, RecordedInput
+from game.rng import streams
+
+TICK_RATE = 20  # Coarse steps keep the run to game over short
+
+def wander(step):
+    """Move about for a while, then stand still until the level timer runs out"""
+    if step >= 400:
+        return InputState()
+    return InputState(right=(step // 40) % 3 != 2, left=(step // 40) % 3 == 2, jump=step % 25 == 0)
+
+def snapshot(engine):
+    player = engine.player
+    return (engine.state, engine.level_manager.current_level, player.score, player.lives,
+            round(player.x, 6), round(player.y, 6), round(engine.level_timer, 6),
+            [(round(enemy.x, 6), round(enemy.y, 6), enemy.alive) for enemy in engine.current_level.enemies])
+
+def record_session(path):
+    """Play like a person would, restarting along the way, and save the input"""
+    streams.reseed(3)
+    recorder = InputRecorder(ScriptedInput(wander))
+    engine = create_headless_engine(recorder)
+    engine.start_game()
+    
+    dt = 1.0 / TICK_RATE
+    game_overs = 0
+    for step in range(30000):
+        engine.update(dt)
+        if engine.state == "level_complete":
+            engine.next_level()
+        if step == 150:
+            engine.state = "paused"
+            engine.restart_level()
+        if step == 300:
+            # Back to the main menu and a new game
+            engine.state = "menu"
+            engine.start_game()
+        if engine.state == "game_over":
+            game_overs += 1
+            if game_overs == 2:
+                break
+            engine.restart_game()
+    
+    recorder.save(path, streams.seed, TICK_RATE)
+    return snapshot(engine)
+
+def test_replay_matches_a_session_with_restarts(tmp_path):
+    path = tmp_path / "session.json"
+    recorded = record_session(path)
+    assert recorded[0] == "game_over"
+    
+    recording = RecordedInput.load(path)
+    assert [event for _, event in recording.events] == [
+        "restart_game", "restart_level", "restart_game", "restart_game"]
+    
+    engine = create_headless_engine()
+    stats = run_simulation(len(recording), recording.tick_rate, engine=engine,
+                           seed=recording.seed, input_source=recording)
+    assert stats["steps"] == len(recording)
+    assert snapshot(engine) == recorded
+
+def test_recordings_round_trip_every_control():
+    states = [InputState(bits & 1, bits & 2, bits & 4) for bits in range(8)]
+    recorder = InputRecorder(ScriptedInput(lambda step: states[step]))
+    for _ in states:
+        recorder.poll()
+    
+    playback = RecordedInput(recorder.frames)
+    assert [playback.poll() for _ in states] == [InputState.from_bits(bits) for bits in range(8)]
+    assert playback.poll() == InputState()
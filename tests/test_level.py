@@ -0,0 +1,43 @@
+# Level rendering tests for Crystal Quest
+import pygame
+from game.constants import *
+from game.level import LevelManager, StarField
+from game.spatial import SpatialGrid
+
+def near_platform(rect, platforms):
+    reach = PLATFORM_DRAW_MARGIN * 2
+    return any(platform.colliderect(rect.inflate(reach, reach)) for platform in platforms)
+
+def test_sky_level_hides_stars_behind_platforms():
+    level = LevelManager().levels[1]
+    level.draw_stars(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    
+    stars = level.star_field
+    assert stars.covered == [near_platform(rect, level.platforms) for rect in stars.rects]
+
+def test_covered_stars_follow_the_camera():
+    stars = StarField(count=50, seed=1)
+    platforms = [pygame.Rect(0, 100, SCREEN_WIDTH, 40)]
+    grid = SpatialGrid(platforms)
+    
+    stars.hide_covered(grid, (0, 0))
+    assert any(stars.covered)
+    assert stars.covered == [near_platform(rect, platforms) for rect in stars.rects]
+    
+    # Scrolled down past the platform, no star is behind it any more
+    stars.hide_covered(grid, (0, 400))
+    assert not any(stars.covered)
+
+def test_covered_stars_are_not_drawn():
+    stars = StarField(count=1, seed=1)
+    star = stars.rects[0]
+    grid = SpatialGrid([star.copy()])
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    stars.hide_covered(grid, (0, 0))
+    stars.draw(screen, 0)
+    assert screen.get_at(star.center) == BLACK
+    
+    stars.hide_covered(grid, (0, 200))
+    stars.draw(screen, 0)
+    assert screen.get_at(star.center) != BLACK
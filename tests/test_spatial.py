@@ -0,0 +1,85 @@
+# Spatial grid tests for Crystal Quest
+import random
+import pygame
+from game.constants import *
+from game.input import InputState
+from game.level import LevelManager
+from game.player import Player
+from game.spatial import SpatialGrid
+
+CELL = 64
+
+def boundary_platforms():
+    """Platforms starting, ending and spanning exactly on cell edges"""
+    return [
+        pygame.Rect(0, 0, CELL, CELL),
+        pygame.Rect(CELL, CELL, CELL, 20),
+        pygame.Rect(CELL - 1, 2 * CELL - 1, 2, 2),
+        pygame.Rect(3 * CELL, 0, 1, 4 * CELL),
+        pygame.Rect(-CELL, -CELL, 3 * CELL, CELL),
+        pygame.Rect(2 * CELL + 10, 3 * CELL, 5 * CELL, 20),
+    ]
+
+def grid_hits(grid, rect):
+    return [platform for platform in grid.query(rect) if platform.colliderect(rect)]
+
+def scan_hits(platforms, rect):
+    return [platform for platform in platforms if platform.colliderect(rect)]
+
+def test_query_matches_a_linear_scan_on_cell_boundaries():
+    platforms = boundary_platforms()
+    grid = SpatialGrid(platforms, CELL)
+    for x in range(-CELL - 2, 5 * CELL, 7):
+        for y in range(-CELL - 2, 5 * CELL, 7):
+            for width, height in ((1, 1), (3, 13), (CELL, CELL), (CELL + 1, 2)):
+                rect = pygame.Rect(x, y, width, height)
+                assert grid_hits(grid, rect) == scan_hits(platforms, rect), rect
+
+def test_query_matches_a_linear_scan_on_random_levels():
+    rng = random.Random(21)
+    platforms = [pygame.Rect(rng.randrange(-200, 3000), rng.randrange(-200, 900),
+                             rng.randrange(1, 400), rng.randrange(1, 60)) for _ in range(300)]
+    grid = SpatialGrid(platforms)
+    for _ in range(2000):
+        rect = pygame.Rect(rng.randrange(-300, 3200), rng.randrange(-300, 1000),
+                           rng.randrange(1, 200), rng.randrange(1, 200))
+        assert grid_hits(grid, rect) == scan_hits(platforms, rect)
+
+def walker_stands(platforms, foot_x, foot_y):
+    """The walker's edge test from Enemy.update_walker"""
+    return any(platform.top <= foot_y <= platform.top + 10 and
+               platform.left <= foot_x <= platform.right
+               for platform in platforms)
+
+def test_walker_probe_finds_platform_edges():
+    platforms = boundary_platforms()
+    grid = SpatialGrid(platforms, CELL)
+    for platform in platforms:
+        for foot_x in (platform.left - 1, platform.left, platform.right - 1, platform.right, platform.right + 1):
+            for foot_y in (platform.top - 1, platform.top, platform.top + 10, platform.top + 11):
+                # Same probe as Enemy.update_walker
+                ahead = pygame.Rect(foot_x - 1, foot_y - 11, 3, 13)
+                assert (walker_stands(grid.query(ahead), foot_x, foot_y) ==
+                        walker_stands(platforms, foot_x, foot_y)), (platform, foot_x, foot_y)
+
+def test_query_keeps_insertion_order():
+    platforms = [pygame.Rect(x, 0, 2 * CELL, 10) for x in range(0, 10 * CELL, CELL // 2)]
+    grid = SpatialGrid(platforms, CELL)
+    hits = grid.query(pygame.Rect(0, 0, 10 * CELL, 10))
+    assert hits == platforms
+
+def test_collisions_follow_moved_platforms():
+    level = LevelManager().levels[0]
+    old_spot = level.platforms[1].copy()
+    level.platforms[1].topleft = (950, 300)
+    level.invalidate_geometry()
+    
+    for rect in (old_spot, level.platforms[1]):
+        assert grid_hits(level.platform_grid, rect) == scan_hits(level.platforms, rect)
+    
+    # Dropped above the new spot, the player lands on the moved platform
+    player = Player(1000, 100)
+    for _ in range(120):
+        player.update(1 / SIMULATION_RATE, level.platform_grid, level.width, InputState())
+    assert player.on_ground
+    assert player.y + player.height == 300
@@ -0,0 +1,45 @@
+# Fixed timestep tests for Crystal Quest
+import pytest
+from game.timestep import FixedTimestep
+
+def run_frames(timestep, frame_time, frames):
+    return sum(timestep.advance(frame_time) for _ in range(frames))
+
+@pytest.mark.parametrize("rate", [30, 60, 120, 600, 1000])
+def test_one_second_of_frames_simulates_one_second(rate):
+    timestep = FixedTimestep(rate)
+    steps = run_frames(timestep, 1 / 60, 60)
+    
+    assert abs(steps - rate) <= 1
+    assert timestep.dropped == 0
+
+def test_leftover_time_carries_over():
+    timestep = FixedTimestep(100)
+    assert timestep.advance(0.025) == 2
+    assert timestep.advance(0.025) == 3
+    assert timestep.accumulator == pytest.approx(0)
+
+def test_alpha_is_the_fraction_of_a_step_left_over():
+    timestep = FixedTimestep(100)
+    timestep.advance(0.0125)
+    assert timestep.alpha == pytest.approx(0.25)
+    timestep.advance(0.005)
+    assert timestep.alpha == pytest.approx(0.75)
+    for _ in range(100):
+        timestep.advance(0.0071)
+        assert 0 <= timestep.alpha < 1
+
+def test_hitch_drops_time_past_the_frame_limit():
+    timestep = FixedTimestep(60, max_frame_time=0.25)
+    assert timestep.advance(1.0) == 15
+    assert timestep.dropped == pytest.approx(0.75)
+    
+    # Back to normal frames, nothing more is dropped
+    assert run_frames(timestep, 1 / 60, 60) == 60
+    assert timestep.dropped == pytest.approx(0.75)
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        FixedTimestep(0)
+    with pytest.raises(ValueError):
+        FixedTimestep(-60)